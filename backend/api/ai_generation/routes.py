@@ -5,19 +5,34 @@ Purpose: Defines the API routes for AI-powered generation operations, including
 """
 
 import ast
+import asyncio
 import json
 import logging
 import os
 import traceback
 from datetime import datetime
-from typing import Optional
-
+from typing import AsyncIterator, Callable, Optional
+
+from config.generation_config import (
+    BOOK_BATCH_CONCURRENCY,
+    BOOK_BATCH_WRITE_SIZE,
+    RESPONSE_CACHE_ENABLED,
+    STRUCTURE_COMBINED_CALL,
+    VERSE_RANGES_USE_LLM,
+)
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from lib.supabase import supabase
 from middleware.gemini import model_flash
+from middleware.gemini_response_cache import get_response_cache, make_cache_key
+from services.query_cache import get_structure_cache, invalidate_passage, structure_key, verse_ranges_key
+from services.single_flight import get_generation_flights, passage_key
+from services.supabase_async import execute_async, insert_many_async
 from pydantic import BaseModel
 from utils.assign_styles import get_style_by_chapter
-from utils.bible_utils import split_chapter_into_sections
+from utils.bible_utils import ChapterSplitError, split_chapter_into_verse_ranges
+from utils.book_batch import plan_book_passages, run_bounded
+from utils.song_structure_schema import STRUCTURE_AND_TONE_GENERATION_CONFIG, parse_structure_and_tone
 
 router = APIRouter(prefix="/api/v1/ai-generation", tags=["ai-generation"])
 
@@ -34,6 +49,14 @@ class SongStructureRequest(BaseModel):
     intBookChapter: int
     strVerseRange: str
     structureId: Optional[str] = None  # For regeneration
+    bypassCache: bool = False  # Skip the Gemini response cache
+
+
+class BookStructuresRequest(BaseModel):
+    """Request model for generating the song structures of a whole book."""
+    strBookName: str
+    chapters: Optional[list[int]] = None  # Whole book when omitted
+    bypassCache: bool = False  # Skip the Gemini response cache
 
 
 class VerseRangeResponse(BaseModel):
@@ -78,132 +101,266 @@ ai_logger.addHandler(file_handler)
 # TODO: Future Improvements
 # 1. Centralize AI Prompts - Create backend/constants/song_prompts.py to store all prompts
 #    This will provide a single source of truth and avoid duplication with song_generation_agent.py
-# 2. Add Caching for AI Responses - Implement caching mechanism for verse ranges and song structures
-#    since Bible content doesn't change. This will reduce API calls and costs.
-# 3. Validate Song Structure JSON - Add validation function to ensure AI-generated structures
-#    meet minimum requirements (e.g., must have verse and chorus sections)
-# 4. Logging Improvements - Replace print statements with structured logging using Python's
+# 2. Logging Improvements - Replace print statements with structured logging using Python's
 #    logging module for better debugging and monitoring in production
-# 5. Consider upgrading from deepseek/deepseek-r1-0528:free to a more capable model
+# 3. Consider upgrading from deepseek/deepseek-r1-0528:free to a more capable model
 #    for better Bible verse analysis and structure generation
 
 
 
-async def _run_gemini(prompt: str) -> str:
-    """Helper function to run the Gemini model."""
+async def _run_gemini(
+    prompt: str,
+    bypass_cache: bool = False,
+    generation_config: Optional[dict] = None,
+    validate: Optional[Callable[[str], bool]] = None,
+) -> str:
+    """
+    Helper function to run the Gemini model.
+
+    Responses are read from the persistent response cache unless bypass_cache is set
+    (regeneration) or the cache is disabled. Fresh responses are written back, so a
+    regenerated answer replaces the cached one, but only when ``validate`` (if given)
+    accepts them: a reply the caller cannot use must not be replayed on retry.
+    Empty responses are never cached.
+    """
+    model_name = getattr(model_flash, "model_name", "gemini")
+    cache_key = make_cache_key(model_name, prompt, generation_config)
+    if RESPONSE_CACHE_ENABLED and not bypass_cache:
+        cached_response = await get_response_cache().get_async(cache_key)
+        if cached_response is not None and (validate is None or validate(cached_response)):
+            ai_logger.info(f"Gemini response cache hit ({cache_key[:12]})")
+            return cached_response
+
     try:
-        response = await model_flash.generate_content_async(prompt)
-        return response.text
+        if generation_config:
+            response = await model_flash.generate_content_async(prompt, generation_config=generation_config)
+        else:
+            response = await model_flash.generate_content_async(prompt)
+        response_text = response.text
     except Exception as e:
         ai_logger.error(f"Error running Gemini model: {e}")
         raise
 
+    if RESPONSE_CACHE_ENABLED and response_text:
+        if validate is None or validate(response_text):
+            await get_response_cache().put_async(cache_key, model_name, response_text)
+        else:
+            # Drop an earlier unusable reply so the next request reaches the model
+            await asyncio.to_thread(get_response_cache().delete, cache_key)
+    return response_text
 
-async def generate_verse_ranges_handler(book_name: str, book_chapter: int) -> list[str]:
-    print(
-        f"[generate_verse_ranges_handler()] Generating verse ranges for {book_name} chapter {book_chapter}"
-    )
-    ai_logger.info(f"Generating verse ranges for {book_name} chapter {book_chapter}")
-    
-    split_chapter = split_chapter_into_sections(book_name, str(book_chapter))
 
-    print(
-        f"[generate_verse_ranges_handler()] Splitting {book_name} {book_chapter} into sections: {split_chapter}"
-    )
-    
-    # Use the agent to generate verse ranges
+def _split_verse_ranges(verse_ranges_str: Optional[str]) -> list[str]:
+    """Comma-separated "start-end" ranges of a Gemini reply, stripped."""
+    return [v.strip() for v in (verse_ranges_str or "").split(",") if v.strip()]
+
+
+def _ranges_cover_chapter(verse_ranges: list[str], total_verses: int) -> bool:
+    """True when the ranges are contiguous "start-end" pairs covering verses 1..total_verses."""
+    expected_start = 1
+    for verse_range in verse_ranges:
+        try:
+            start, end = (int(part) for part in verse_range.split("-"))
+        except ValueError:
+            return False
+        if start != expected_start or end < start:
+            return False
+        expected_start = end + 1
+    return expected_start == total_verses + 1
+
+
+async def _refine_verse_ranges_with_gemini(book_name: str, book_chapter: int, local_ranges: list[str]) -> list[str]:
+    """Ask Gemini for a content-aware split with as many sections as the local split."""
     try:
-        # Log the request
         request_prompt = (
             "You are a helpful agent. Split the given Bible chapter into the requested number of sections. "
             "Return ONLY the verse ranges separated by commas (e.g., '1-11, 12-22'). "
             "No explanations or extra text.\n\n"
-            f"Task: Split {book_name} chapter {book_chapter} into {split_chapter} verse ranges."
+            f"Task: Split {book_name} chapter {book_chapter} into {len(local_ranges)} verse ranges."
         )
         ai_logger.info(f"Gemini request: {request_prompt}")
-        
-        verse_ranges_str = await _run_gemini(request_prompt)
-        
+
+        total_verses = int(local_ranges[-1].split("-")[1])
+        verse_ranges_str = await _run_gemini(
+            request_prompt,
+            validate=lambda text: _ranges_cover_chapter(_split_verse_ranges(text), total_verses),
+        )
+
         # Log the response
         ai_logger.info(f"Gemini response: {verse_ranges_str}")
-        
-        if verse_ranges_str:
-            verse_ranges = verse_ranges_str.split(",")
-            print(f"Verse ranges: {verse_ranges} with type {type(verse_ranges)}")
-
-            # Insert verse ranges into database
-            for verse_range in verse_ranges:
-                supabase.table("song_structure_tbl").insert(
-                    {
-                        "book_name": book_name,
-                        "chapter": book_chapter,
-                        "verse_range": verse_range.strip(),
-                    }
-                ).execute()
-
-            return [v.strip() for v in verse_ranges]
-        else:
-            print(
-                "Error: Failed to get verse ranges from agent. Skipping further processing."
-            )
-            ai_logger.error(f"Failed to get verse ranges for {book_name} {book_chapter}")
-            return []
     except Exception as e:
         print(f"Error using Gemini for verse ranges: {e}")
         ai_logger.error(f"Error using Gemini for verse ranges: {e}")
-        return []
+        return local_ranges
 
+    verse_ranges = _split_verse_ranges(verse_ranges_str)
+    if not _ranges_cover_chapter(verse_ranges, total_verses):
+        print(f"Gemini verse ranges {verse_ranges} do not cover {book_name} {book_chapter}; using local split")
+        ai_logger.error(f"Invalid Gemini verse ranges for {book_name} {book_chapter}: {verse_ranges_str}")
+        return local_ranges
+    return verse_ranges
 
-async def get_verse_ranges(book_name: str, book_chapter: int) -> list[str]:
-    """
-    Get verse ranges for a book and chapter. If they don't exist, generate them.
-    """
-    response = (
+
+async def _fetch_stored_verse_ranges(book_name: str, book_chapter: int) -> list[str]:
+    """Verse ranges already stored for a chapter (cached when found); [] when there are none."""
+    response = await execute_async(
         supabase.table("song_structure_tbl")
         .select("verse_range")
         .eq("book_name", book_name)
         .eq("chapter", book_chapter)
-        .execute()
     )
+    verse_ranges = [item["verse_range"] for item in response.data or []]
+    if verse_ranges:
+        get_structure_cache().set(verse_ranges_key(book_name, book_chapter), verse_ranges)
+    return verse_ranges
 
-    if response.data and len(response.data) > 0:
-        return [item["verse_range"] for item in response.data]
-    else:
-        return await generate_verse_ranges_handler(book_name, book_chapter)
 
+async def _generate_verse_ranges(book_name: str, book_chapter: int) -> list[str]:
+    # A retried request, or one after a lookup already stored the chapter, must not insert a second set
+    stored_ranges = await _fetch_stored_verse_ranges(book_name, book_chapter)
+    if stored_ranges:
+        print(
+            f"[generate_verse_ranges_handler()] Verse ranges for {book_name} {book_chapter} already stored: {stored_ranges}"
+        )
+        return stored_ranges
 
-async def generate_song_structure_handler(
-    strBookName: str, intBookChapter: int, strVerseRange: str, structureId: Optional[str] = None
-) -> dict:
-    # First check if song structure already exists
-    existing_data = (
-        supabase.table("song_structure_tbl")
-        .select("song_structure, tone, styles")
-        .eq("book_name", strBookName)
-        .eq("chapter", intBookChapter)
-        .eq("verse_range", strVerseRange)
-        .execute()
+    print(
+        f"[generate_verse_ranges_handler()] Generating verse ranges for {book_name} chapter {book_chapter}"
     )
+    ai_logger.info(f"Generating verse ranges for {book_name} chapter {book_chapter}")
+    
+    # Deterministic near-equal split; Gemini only refines it when VERSE_RANGES_USE_LLM is set
+    verse_ranges = split_chapter_into_verse_ranges(book_name, str(book_chapter))
+    if VERSE_RANGES_USE_LLM:
+        verse_ranges = await _refine_verse_ranges_with_gemini(book_name, book_chapter, verse_ranges)
 
-    # If song structure already exists and is not None, return it
-    if existing_data.data and existing_data.data[0]["song_structure"]:
-        song_structure_str = existing_data.data[0]["song_structure"]
+    print(
+        f"[generate_verse_ranges_handler()] Verse ranges for {book_name} {book_chapter}: {verse_ranges}"
+    )
+
+    try:
+        # Insert verse ranges into database (one multi-row request)
+        await insert_many_async(
+            supabase,
+            "song_structure_tbl",
+            [
+                {
+                    "book_name": book_name,
+                    "chapter": book_chapter,
+                    "verse_range": verse_range,
+                }
+                for verse_range in verse_ranges
+            ],
+        )
+        invalidate_passage(book_name, book_chapter)
+
+        return verse_ranges
+    except Exception as e:
+        print(f"Error saving verse ranges: {e}")
+        ai_logger.error(f"Error saving verse ranges for {book_name} {book_chapter}: {e}")
+        return []
+
+
+async def generate_verse_ranges_handler(book_name: str, book_chapter: int) -> list[str]:
+    """Split and store a chapter's verse ranges; concurrent calls for a chapter share one insert."""
+    return await get_generation_flights().run(
+        passage_key("verse_ranges", book_name, book_chapter),
+        lambda: _generate_verse_ranges(book_name, book_chapter),
+    )
+
+
+async def get_verse_ranges(book_name: str, book_chapter: int) -> list[str]:
+    """
+    Get verse ranges for a book and chapter. If they don't exist, generate them.
+
+    Concurrent lookups for the same chapter share one database check and generation.
+    """
+    return await get_generation_flights().run(
+        passage_key("verse_ranges_lookup", book_name, book_chapter),
+        lambda: _get_verse_ranges(book_name, book_chapter),
+    )
+
+
+async def _get_verse_ranges(book_name: str, book_chapter: int) -> list[str]:
+    cache = get_structure_cache()
+    cached_ranges = cache.get(verse_ranges_key(book_name, book_chapter))
+    if cached_ranges:
+        return cached_ranges
+
+    verse_ranges = await _fetch_stored_verse_ranges(book_name, book_chapter)
+    if verse_ranges:
+        return verse_ranges
+    return await generate_verse_ranges_handler(book_name, book_chapter)
+
+
+async def _generate_structure_and_tone(
+    strBookName: str, intBookChapter: int, strVerseRange: str, bypass_cache: bool = False
+) -> Optional[tuple[dict, int]]:
+    """Structure and tone in one schema-constrained Gemini call; None when the reply fails validation."""
+    request_prompt = (
+        "You are a helpful agent. When asked to create a song structure:\n"
+        "- Create a song structure using the given Bible verses\n"
+        "- Use 4-6 sections (or more if needed) based on the verse content\n"
+        "- Include sections like: Verse, Chorus, Bridge, Outro, Pre-Chorus, Post-Chorus, etc.\n"
+        "- Give each section a unique name (e.g., 'verse1', 'chorus', 'verse2') and its verses as '1-5' or '6'\n"
+        "- Do not overlap or reuse verses between sections\n"
+        "- Also analyze the emotional tone of the passage: 0 for negative tone or 1 for positive tone\n\n"
+        f"Task: Create a song structure and analyze the tone for {strBookName} chapter {intBookChapter}, "
+        f"verses {strVerseRange}"
+    )
+    ai_logger.info(f"Generating song structure and tone for {strBookName} {intBookChapter}:{strVerseRange}")
+    ai_logger.info(f"Gemini request: {request_prompt}")
+    try:
+        response_text = await _run_gemini(
+            request_prompt,
+            bypass_cache=bypass_cache,
+            generation_config=STRUCTURE_AND_TONE_GENERATION_CONFIG,
+            validate=lambda text: parse_structure_and_tone(text, strVerseRange) is not None,
+        )
+    except Exception as e:
+        print(f"Error using Gemini for combined song structure and tone: {e}")
+        ai_logger.error(f"Error using Gemini for combined song structure and tone: {e}")
+        return None
+
+    ai_logger.info(f"Song structure and tone response: {response_text}")
+    generated = parse_structure_and_tone(response_text, strVerseRange)
+    if generated is None:
+        print("Combined song structure response failed validation, falling back to separate requests")
+        ai_logger.error(f"Combined song structure response failed validation: {response_text}")
+    return generated
+
+
+def _parse_song_structure_response(song_structure_response: str) -> Optional[dict]:
+    """
+    Song structure dictionary from a free-form reply: JSON, a Python literal, or either
+    embedded between the first "{" and the last "}". None when nothing parses to a dict.
+    """
+    candidates = [song_structure_response]
+    start_idx = song_structure_response.find('{')
+    end_idx = song_structure_response.rfind('}')
+    if start_idx != -1 and end_idx != -1 and start_idx < end_idx:
+        candidates.append(song_structure_response[start_idx:end_idx+1])
+
+    for candidate in candidates:
         try:
-            return (
-                json.loads(song_structure_str)
-                if isinstance(song_structure_str, str)
-                else song_structure_str
-            )
+            # First, try to parse as standard JSON
+            parsed = json.loads(candidate)
         except json.JSONDecodeError:
-            print(
-                f"Warning: Invalid JSON in existing song structure for {strBookName} {intBookChapter}:{strVerseRange}"
-            )
-            # Continue to regenerate the structure
+            try:
+                # If that fails, try parsing as Python literal
+                parsed = ast.literal_eval(candidate)
+            except (SyntaxError, ValueError):
+                continue
+        # Validate that we got a dictionary
+        return parsed if isinstance(parsed, dict) else None
+    return None
+
 
-    # Generate new song structure
+async def _generate_structure_separately(
+    strBookName: str, intBookChapter: int, strVerseRange: str, bypass_cache: bool = False
+) -> dict:
+    """Song structure from the free-form structure prompt; {} when it cannot be parsed."""
     song_structure = {}
-    passage_tone = 0
-    styles = []
 
     # Generate song structure using the agent
     try:
@@ -223,7 +380,11 @@ async def generate_song_structure_handler(
         ai_logger.info(f"Generating song structure for {strBookName} {intBookChapter}:{strVerseRange}")
         ai_logger.info(f"Gemini request: {request_prompt}")
         
-        song_structure_response = await _run_gemini(request_prompt)
+        song_structure_response = await _run_gemini(
+            request_prompt,
+            bypass_cache=bypass_cache,
+            validate=lambda text: _parse_song_structure_response(text) is not None,
+        )
         
         # Log the response
         ai_logger.info(f"Song structure response: {song_structure_response}")
@@ -236,51 +397,23 @@ async def generate_song_structure_handler(
             ai_logger.error("Failed to get song structure from agent")
             return {}
 
-        try:
-            # First, try to parse as standard JSON
-            song_structure = json.loads(song_structure_response)
-        except json.JSONDecodeError:
-            try:
-                # If that fails, try parsing as Python literal
-                song_structure = ast.literal_eval(song_structure_response)
-            except (SyntaxError, ValueError):
-                # If both fail, try to extract a substring that might be JSON
-                start_idx = song_structure_response.find('{')
-                end_idx = song_structure_response.rfind('}')
-                if start_idx != -1 and end_idx != -1 and start_idx < end_idx:
-                    json_string = song_structure_response[start_idx:end_idx+1]
-                    try:
-                        # First try parsing extracted substring as JSON
-                        song_structure = json.loads(json_string)
-                    except json.JSONDecodeError:
-                        try:
-                            # Then try parsing as Python literal
-                            song_structure = ast.literal_eval(json_string)
-                        except (SyntaxError, ValueError):
-                            print(f"Error: Could not parse response as JSON or Python literal: {json_string}")
-                            ai_logger.error(f"Could not parse response as JSON or Python literal: {json_string}")
-                            return {}
-                else:
-                    print(f"Error: Could not extract dictionary from response: {song_structure_response}")
-                    ai_logger.error(f"Could not extract dictionary from response: {song_structure_response}")
-                    return {}
-
-        # Validate that we got a dictionary
-        if not isinstance(song_structure, dict):
-            print(f"Error: Parsed song structure is not a dictionary: {type(song_structure)}")
-            ai_logger.error(f"Parsed song structure is not a dictionary: {type(song_structure)}")
+        song_structure = _parse_song_structure_response(song_structure_response)
+        if song_structure is None:
+            print(f"Error: Could not parse song structure dictionary from response: {song_structure_response}")
+            ai_logger.error(f"Could not parse song structure dictionary from response: {song_structure_response}")
             return {}
     except Exception as e:
         print(f"Error using Gemini for song structure: {e}")
         ai_logger.error(f"Error using Gemini for song structure: {e}")
         return {}
 
-    print(f"Parsed song structure: {song_structure}")
+    return song_structure
 
-    # TODO: Add validation function to ensure song structure meets requirements
-    # Example: validate_song_structure(song_structure)
-    # Should check for minimum sections (verse, chorus), proper format, etc.
 
+async def _analyze_tone_separately(
+    strBookName: str, intBookChapter: int, strVerseRange: str, bypass_cache: bool = False
+) -> int:
+    """Passage tone from the free-form tone prompt; defaults to positive (1)."""
     # Analyze passage tone using the agent
     try:
         # Log the request
@@ -294,7 +427,9 @@ async def generate_song_structure_handler(
         ai_logger.info(f"Analyzing tone for {strBookName} {intBookChapter}:{strVerseRange}")
         ai_logger.info(f"Gemini request: {request_prompt}")
         
-        passage_tone_response = await _run_gemini(request_prompt)
+        passage_tone_response = await _run_gemini(
+            request_prompt, bypass_cache=bypass_cache, validate=lambda text: text.strip().isdigit()
+        )
         
         # Log the response
         ai_logger.info(f"Tone response: {passage_tone_response}")
@@ -312,21 +447,130 @@ async def generate_song_structure_handler(
         ai_logger.error(f"Error parsing tone response: {e}")
         passage_tone = 1
 
+    return passage_tone
+
+
+async def _build_passage_structure(
+    strBookName: str, intBookChapter: int, strVerseRange: str, bypass_cache: bool = False
+) -> Optional[dict]:
+    """
+    Generate the structure, tone and styles of one passage without writing them.
+
+    Returns:
+        Optional[dict]: {"song_structure", "tone", "styles"}, or None when no structure could be produced
+    """
+    # One structured request, falling back to the separate structure and tone
+    # prompts when the reply fails validation
+    generated = None
+    if STRUCTURE_COMBINED_CALL:
+        generated = await _generate_structure_and_tone(strBookName, intBookChapter, strVerseRange, bypass_cache)
+    if generated is not None:
+        song_structure, passage_tone = generated
+    else:
+        song_structure = await _generate_structure_separately(strBookName, intBookChapter, strVerseRange, bypass_cache)
+        if not song_structure:
+            return None
+        passage_tone = await _analyze_tone_separately(strBookName, intBookChapter, strVerseRange, bypass_cache)
+
+    print(f"Parsed song structure: {song_structure}")
+
     # Get styles based on chapter and tone
     styles = get_style_by_chapter(strBookName, intBookChapter, passage_tone)
     print(f"Style for {strBookName} {intBookChapter}: {styles}")
 
+    return {"song_structure": song_structure, "tone": passage_tone, "styles": styles}
+
+
+async def _generate_passage_structure(
+    strBookName: str, intBookChapter: int, strVerseRange: str, bypass_cache: bool = False
+) -> Optional[dict]:
+    """_build_passage_structure, shared by concurrent callers (single requests and book batches) of a passage."""
+    kind = "passage_regenerate" if bypass_cache else "passage"
+    return await get_generation_flights().run(
+        passage_key(kind, strBookName, intBookChapter, strVerseRange),
+        lambda: _build_passage_structure(strBookName, intBookChapter, strVerseRange, bypass_cache),
+    )
+
+
+async def generate_song_structure_handler(
+    strBookName: str,
+    intBookChapter: int,
+    strVerseRange: str,
+    structureId: Optional[str] = None,
+    bypass_cache: bool = False,
+) -> dict:
+    # Regeneration must reach the model instead of replaying a cached answer
+    bypass_cache = bypass_cache or structureId is not None
+
+    # Concurrent requests for the same passage share one lookup and generation
+    kind = "song_structure_regenerate" if bypass_cache else "song_structure"
+    return await get_generation_flights().run(
+        passage_key(kind, strBookName, intBookChapter, strVerseRange),
+        lambda: _generate_song_structure(strBookName, intBookChapter, strVerseRange, bypass_cache),
+    )
+
+
+async def _generate_song_structure(
+    strBookName: str, intBookChapter: int, strVerseRange: str, bypass_cache: bool = False
+) -> dict:
+    # First check if song structure already exists (cached rows are read through).
+    # Regeneration skips the stored row; the UPDATE below stores the new answer.
+    cache = get_structure_cache()
+    row_cache_key = structure_key(strBookName, intBookChapter, strVerseRange)
+    existing_row = None
+    if bypass_cache:
+        cache.invalidate(row_cache_key)
+    else:
+        existing_row = cache.get(row_cache_key)
+        if existing_row is None:
+            existing_data = await execute_async(
+                supabase.table("song_structure_tbl")
+                .select("id, song_structure, tone, styles")
+                .eq("book_name", strBookName)
+                .eq("chapter", intBookChapter)
+                .eq("verse_range", strVerseRange)
+            )
+            if existing_data.data:
+                existing_row = existing_data.data[0]
+                cache.set(row_cache_key, existing_row)
+
+    # If song structure already exists and is not None, return it
+    if existing_row and existing_row["song_structure"]:
+        song_structure_str = existing_row["song_structure"]
+        try:
+            return (
+                json.loads(song_structure_str)
+                if isinstance(song_structure_str, str)
+                else song_structure_str
+            )
+        except json.JSONDecodeError:
+            print(
+                f"Warning: Invalid JSON in existing song structure for {strBookName} {intBookChapter}:{strVerseRange}"
+            )
+            # Continue to regenerate the structure
+
+    # Generate new song structure, tone and styles
+    generated = await _generate_passage_structure(strBookName, intBookChapter, strVerseRange, bypass_cache)
+    if generated is None:
+        return {}
+    song_structure = generated["song_structure"]
+    passage_tone = generated["tone"]
+    styles = generated["styles"]
+
     # Update the database with the generated structure
     try:
-        supabase.table("song_structure_tbl").update(
-            {
-                "song_structure": json.dumps(song_structure),
-                "tone": passage_tone,
-                "styles": styles,
-            }
-        ).eq("book_name", strBookName).eq("chapter", intBookChapter).eq(
-            "verse_range", strVerseRange
-        ).execute()
+        await execute_async(
+            supabase.table("song_structure_tbl").update(
+                {
+                    "song_structure": json.dumps(song_structure),
+                    "tone": passage_tone,
+                    "styles": styles,
+                }
+            ).eq("book_name", strBookName).eq("chapter", intBookChapter).eq(
+                "verse_range", strVerseRange
+            )
+        )
+        invalidate_passage(strBookName, intBookChapter, strVerseRange)
 
         print(
             f"Successfully updated song structure for {strBookName} {intBookChapter}:{strVerseRange}"
@@ -337,6 +581,139 @@ async def generate_song_structure_handler(
     return song_structure
 
 
+async def _plan_book(strBookName: str, chapters: Optional[list[int]]) -> tuple[list[dict], int]:
+    """
+    Plan a book batch and store the verse ranges of chapters that have none yet.
+
+    New ranges are inserted up front (one multi-row request) so every pending passage
+    has a row id and generated structures are written with plain upserts.
+
+    Returns:
+        tuple[list[dict], int]: Pending passages and the number skipped (see plan_book_passages)
+    """
+    query = (
+        supabase.table("song_structure_tbl")
+        .select("id, chapter, verse_range, song_structure")
+        .eq("book_name", strBookName)
+    )
+    if chapters:
+        query = query.in_("chapter", chapters)
+    existing_data = await execute_async(query)
+    pending, skipped = plan_book_passages(strBookName, existing_data.data or [], chapters)
+
+    new_passages = [passage for passage in pending if passage["id"] is None]
+    if new_passages:
+        inserted = await insert_many_async(
+            supabase,
+            "song_structure_tbl",
+            [
+                {"book_name": strBookName, "chapter": passage["chapter"], "verse_range": passage["verse_range"]}
+                for passage in new_passages
+            ],
+        )
+        ids = {(int(row["chapter"]), row["verse_range"]): row.get("id") for row in inserted}
+        for passage in new_passages:
+            passage["id"] = ids.get((passage["chapter"], passage["verse_range"]))
+        for chapter in {passage["chapter"] for passage in new_passages}:
+            invalidate_passage(strBookName, chapter)
+    return pending, skipped
+
+
+async def _write_book_structures(strBookName: str, generated_rows: list[dict]) -> None:
+    """Bulk-write generated passages with one upsert on the row ids from _plan_book."""
+    records = [
+        {
+            "id": row["id"],
+            "book_name": strBookName,
+            "chapter": row["chapter"],
+            "verse_range": row["verse_range"],
+            "song_structure": json.dumps(row["song_structure"]),
+            "tone": row["tone"],
+            "styles": row["styles"],
+        }
+        for row in generated_rows
+        if row.get("id") is not None
+    ]
+    if records:
+        await execute_async(supabase.table("song_structure_tbl").upsert(records, on_conflict="id"))
+    for chapter in {row["chapter"] for row in generated_rows}:
+        invalidate_passage(strBookName, chapter)
+
+
+async def generate_book_structures(
+    strBookName: str, chapters: Optional[list[int]] = None, bypass_cache: bool = False
+) -> AsyncIterator[dict]:
+    """
+    Generate every missing song structure of a book (or of some of its chapters).
+
+    Verse ranges are computed locally and passages that already have a structure are
+    skipped. Planning is shared by concurrent batches for the same book. The rest are
+    generated BOOK_BATCH_CONCURRENCY at a time (Gemini requests still go through the
+    shared rate limiter) and written in bulk every BOOK_BATCH_WRITE_SIZE passages;
+    the remainder is written even when the client disconnects.
+
+    Yields:
+        dict: Progress events: "planned" once, "passage" per generated passage, then "done"
+              (or a single "error" when the book cannot be planned)
+    """
+    plan_key = ("book_plan", strBookName.strip(), tuple(sorted(set(chapters))) if chapters else None)
+    try:
+        pending, skipped = await get_generation_flights().run(
+            plan_key, lambda: _plan_book(strBookName, chapters)
+        )
+    except ChapterSplitError as e:
+        yield {"event": "error", "error": str(e)}
+        return
+
+    total = len(pending)
+    print(f"📚 [BOOK-BATCH] {strBookName}: {total} passages to generate, {skipped} already have structures")
+    yield {"event": "planned", "book_name": strBookName, "total": total, "skipped": skipped}
+
+    async def generate(passage: dict) -> Optional[dict]:
+        return await _generate_passage_structure(
+            strBookName, passage["chapter"], passage["verse_range"], bypass_cache
+        )
+
+    completed = 0
+    failed = 0
+    written = 0
+    write_buffer: list[dict] = []
+    try:
+        async for passage, generated, error in run_bounded(pending, generate, BOOK_BATCH_CONCURRENCY):
+            completed += 1
+            success = generated is not None
+            if success:
+                write_buffer.append({**passage, **generated})
+            else:
+                failed += 1
+                if error is not None:
+                    ai_logger.error(f"Book batch failed for {strBookName} {passage['chapter']}:{passage['verse_range']}: {error}")
+            if len(write_buffer) >= BOOK_BATCH_WRITE_SIZE:
+                rows, write_buffer = write_buffer, []
+                await _write_book_structures(strBookName, rows)
+                written += len(rows)
+            event = {
+                "event": "passage",
+                "chapter": passage["chapter"],
+                "verse_range": passage["verse_range"],
+                "success": success,
+                "completed": completed,
+                "total": total,
+            }
+            if error is not None:
+                event["error"] = str(error)
+            yield event
+    finally:
+        if write_buffer:
+            # Shielded so a disconnect (task cancellation) does not drop generated passages
+            rows, write_buffer = write_buffer, []
+            await asyncio.shield(asyncio.ensure_future(_write_book_structures(strBookName, rows)))
+            written += len(rows)
+
+    print(f"📚 [BOOK-BATCH] {strBookName}: {written} structures written, {failed} failed")
+    yield {"event": "done", "generated": written, "failed": failed, "skipped": skipped}
+
+
 # TODO: Ensure all endpoints return consistent error structures
 # All endpoints should follow the pattern: success: bool, message: str, error?: str
 # This helps frontend handle errors consistently
@@ -425,7 +802,8 @@ async def generate_song_structure_endpoint(request: SongStructureRequest):
             strBookName=request.strBookName,
             intBookChapter=request.intBookChapter,
             strVerseRange=request.strVerseRange,
-            structureId=request.structureId
+            structureId=request.structureId,
+            bypass_cache=request.bypassCache,
         )
 
         return SongStructureResponse(
@@ -442,6 +820,36 @@ async def generate_song_structure_endpoint(request: SongStructureRequest):
             error=str(e)
         )
 
+@router.post("/book-structures")
+async def generate_book_structures_endpoint(request: BookStructuresRequest):
+    """
+    Generate the missing song structures of a book in one request.
+
+    Args:
+        request: BookStructuresRequest with the book name and optional chapters
+
+    Returns:
+        StreamingResponse of newline-delimited JSON progress events (see generate_book_structures)
+    """
+    print(
+        f"[generate_book_structures_endpoint] Generating song structures for {request.strBookName} "
+        f"chapters {request.chapters or 'all'}"
+    )
+
+    async def stream_events():
+        try:
+            async for event in generate_book_structures(
+                request.strBookName, request.chapters, bypass_cache=request.bypassCache
+            ):
+                yield json.dumps(event) + "\n"
+        except Exception as e:
+            print(f"[generate_book_structures_endpoint] Critical error occurred: {e}")
+            print(traceback.format_exc())
+            yield json.dumps({"event": "error", "error": str(e)}) + "\n"
+
+    return StreamingResponse(stream_events(), media_type="application/x-ndjson")
+
+
 # TODO: Consider creating a shared types file or code generation tool
 # to ensure type consistency between frontend TypeScript interfaces
 # and backend Pydantic models
@@ -0,0 +1,330 @@
+"""
+System: Suno Automation
+Module: Orchestrator Job Queue
+File URL: backend/api/orchestrator/job_queue.py
+Purpose: Persist orchestrator workflow jobs in SQLite and drain them with a pool of async workers.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import traceback
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_COMPLETED = "completed"
+JOB_STATUS_FAILED = "failed"
+JOB_STATUSES = (JOB_STATUS_QUEUED, JOB_STATUS_RUNNING, JOB_STATUS_COMPLETED, JOB_STATUS_FAILED)
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+def payload_dedupe_key(payload: Dict[str, Any]) -> str:
+    """SHA-256 of the whole payload (sorted keys): only identical requests share a key."""
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class JobStore:
+    """Durable FIFO job store backed by a local SQLite file."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS orchestrator_jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_orchestrator_jobs_status_created "
+            "ON orchestrator_jobs (status, created_at)"
+        )
+        # Job stores created before deduplication lack the dedupe_key column
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(orchestrator_jobs)")}
+        if "dedupe_key" not in columns:
+            self._conn.execute("ALTER TABLE orchestrator_jobs ADD COLUMN dedupe_key TEXT")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_orchestrator_jobs_dedupe_status "
+            "ON orchestrator_jobs (dedupe_key, status)"
+        )
+
+    def _row_to_job(self, row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def enqueue(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert a new queued job and return its record."""
+        job, _ = self.enqueue_unique(payload, None)
+        return job
+
+    def enqueue_unique(self, payload: Dict[str, Any], dedupe_key: Optional[str]) -> Tuple[Dict[str, Any], bool]:
+        """
+        Queue a job unless a queued or running job has the same dedupe_key.
+
+        Returns:
+            Tuple[Dict[str, Any], bool]: The new or already active job, and whether it was created
+        """
+        with self._lock:
+            if dedupe_key is not None:
+                row = self._conn.execute(
+                    "SELECT job_id FROM orchestrator_jobs WHERE dedupe_key = ? AND status IN (?, ?) "
+                    "ORDER BY created_at, rowid LIMIT 1",
+                    (dedupe_key, JOB_STATUS_QUEUED, JOB_STATUS_RUNNING),
+                ).fetchone()
+                if row is not None:
+                    return self._get_unlocked(row["job_id"]), False
+            job_id = uuid.uuid4().hex
+            self._conn.execute(
+                "INSERT INTO orchestrator_jobs (job_id, status, payload, created_at, dedupe_key) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, JOB_STATUS_QUEUED, json.dumps(payload), _utc_now(), dedupe_key),
+            )
+        return self.get(job_id), True
+
+    def claim_next(self) -> Optional[Dict[str, Any]]:
+        """Atomically move the oldest queued job to running and return it."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT job_id FROM orchestrator_jobs WHERE status = ? ORDER BY created_at, rowid LIMIT 1",
+                    (JOB_STATUS_QUEUED,),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    "UPDATE orchestrator_jobs SET status = ?, started_at = ?, attempts = attempts + 1 WHERE job_id = ?",
+                    (JOB_STATUS_RUNNING, _utc_now(), row["job_id"]),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self.get(row["job_id"])
+
+    def finish(self, job_id: str, status: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        """Record the terminal state of a job."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE orchestrator_jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE job_id = ?",
+                (status, json.dumps(result, default=str) if result is not None else None, error, _utc_now(), job_id),
+            )
+
+    def _get_unlocked(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT * FROM orchestrator_jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return self._row_to_job(row)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._get_unlocked(job_id)
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Return jobs newest first, optionally filtered by status."""
+        query = "SELECT * FROM orchestrator_jobs"
+        params: List[Any] = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY created_at DESC, rowid DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def count_by_status(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS total FROM orchestrator_jobs GROUP BY status"
+            ).fetchall()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update({row["status"]: row["total"] for row in rows})
+        return counts
+
+    def requeue_interrupted(self, max_attempts: Optional[int] = None) -> int:
+        """
+        Return jobs left running by a previous process to the queue.
+
+        Jobs that have already been claimed ``max_attempts`` times are marked failed
+        instead, so a job that keeps crashing the process is not re-submitted forever.
+        """
+        with self._lock:
+            if max_attempts is not None:
+                self._conn.execute(
+                    "UPDATE orchestrator_jobs SET status = ?, error = ?, finished_at = ? "
+                    "WHERE status = ? AND attempts >= ?",
+                    (
+                        JOB_STATUS_FAILED,
+                        f"Interrupted after {max_attempts} attempt(s); not re-queued",
+                        _utc_now(),
+                        JOB_STATUS_RUNNING,
+                        max_attempts,
+                    ),
+                )
+            cursor = self._conn.execute(
+                "UPDATE orchestrator_jobs SET status = ?, started_at = NULL WHERE status = ?",
+                (JOB_STATUS_QUEUED, JOB_STATUS_RUNNING),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class OrchestratorWorkerPool:
+    """Pool of async workers that pull queued jobs and run them through a handler."""
+
+    def __init__(
+        self,
+        store: JobStore,
+        handler: JobHandler,
+        worker_count: int = 1,
+        poll_interval: float = 5.0,
+        max_attempts: Optional[int] = None,
+    ):
+        self.store = store
+        self.handler = handler
+        self.worker_count = max(1, worker_count)
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        requeued = await asyncio.to_thread(self.store.requeue_interrupted, self.max_attempts)
+        if requeued:
+            print(f"🧵 [JOB-QUEUE] Re-queued {requeued} job(s) interrupted by a previous shutdown")
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(index), name=f"orchestrator-worker-{index}")
+            for index in range(1, self.worker_count + 1)
+        ]
+        print(f"🧵 [JOB-QUEUE] Started {self.worker_count} orchestrator worker(s)")
+
+    async def stop(self) -> None:
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        # Jobs cancelled mid-run go back to the queue for the next process (up to max_attempts).
+        await asyncio.to_thread(self.store.requeue_interrupted, self.max_attempts)
+        print("🧵 [JOB-QUEUE] Orchestrator workers stopped")
+
+    def notify(self) -> None:
+        """Wake idle workers after a new job has been submitted."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _wait_for_work(self) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _worker_loop(self, worker_index: int) -> None:
+        label = f"[WORKER-{worker_index}]"
+        while not self._stopping:
+            job = await asyncio.to_thread(self.store.claim_next)
+            if job is None:
+                await self._wait_for_work()
+                continue
+
+            job_id = job["job_id"]
+            print(f"🧵 {label} Running job {job_id} (attempt {job['attempts']})")
+            try:
+                result = await self.handler(job["payload"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"🧵 {label} ❌ Job {job_id} raised: {e}")
+                print(traceback.format_exc())
+                await asyncio.to_thread(
+                    self.store.finish, job_id, JOB_STATUS_FAILED, None, str(e)
+                )
+                continue
+
+            status = JOB_STATUS_COMPLETED if result.get("success") else JOB_STATUS_FAILED
+            await asyncio.to_thread(
+                self.store.finish, job_id, status, result, result.get("error")
+            )
+            print(f"🧵 {label} Job {job_id} finished with status '{status}'")
+
+
+_job_store: Optional[JobStore] = None
+_worker_pool: Optional[OrchestratorWorkerPool] = None
+
+
+def get_job_store() -> JobStore:
+    """Return the process-wide job store, creating it on first use."""
+    global _job_store
+    if _job_store is None:
+        from config.orchestrator_config import JOB_DB_PATH
+
+        _job_store = JobStore(JOB_DB_PATH)
+    return _job_store
+
+
+def get_worker_pool(handler: Optional[JobHandler] = None) -> OrchestratorWorkerPool:
+    """Return the process-wide worker pool, creating it with ``handler`` on first use."""
+    global _worker_pool
+    if _worker_pool is None:
+        if handler is None:
+            raise RuntimeError("Worker pool has not been initialised with a job handler")
+        from config.orchestrator_config import (
+            JOB_MAX_ATTEMPTS,
+            JOB_POLL_INTERVAL_SECONDS,
+            PIPELINE_MAX_IN_FLIGHT,
+            PIPELINE_MODE,
+            WORKER_COUNT,
+        )
+
+        _worker_pool = OrchestratorWorkerPool(
+            get_job_store(),
+            handler,
+            worker_count=PIPELINE_MAX_IN_FLIGHT if PIPELINE_MODE else WORKER_COUNT,
+            poll_interval=JOB_POLL_INTERVAL_SECONDS,
+            max_attempts=JOB_MAX_ATTEMPTS,
+        )
+    return _worker_pool
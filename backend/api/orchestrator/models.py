@@ -5,7 +5,7 @@ Purpose: Pydantic models for orchestrator workflow requests and responses.
 """
 
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 class OrchestratorRequest(BaseModel):
@@ -30,3 +30,35 @@ class OrchestratorResponse(BaseModel):
     re_rolled_songs: Optional[int] = None
     error: Optional[str] = None
     workflow_details: Optional[Dict[str, Any]] = None
+
+
+class JobSubmitResponse(BaseModel):
+    """Response model returned immediately after queueing a workflow job."""
+
+    success: bool
+    message: str
+    job_id: Optional[str] = None
+    status: Optional[str] = None
+    error: Optional[str] = None
+
+
+class JobStatusResponse(BaseModel):
+    """Response model describing a single queued workflow job."""
+
+    job_id: str
+    status: str
+    request: Dict[str, Any]
+    attempts: int = 0
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class JobListResponse(BaseModel):
+    """Response model for listing queued workflow jobs."""
+
+    success: bool
+    jobs: List[JobStatusResponse]
+    counts: Dict[str, int]
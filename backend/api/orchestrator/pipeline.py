@@ -0,0 +1,277 @@
+"""
+System: Suno Automation
+Module: Orchestrator Pipeline
+File URL: backend/api/orchestrator/pipeline.py
+Purpose: Run passages through generation, download, and review stages linked by bounded queues
+         so the browser can start the next passage while the previous one downloads and reviews.
+"""
+
+import asyncio
+import os
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from . import utils as workflow
+
+
+@dataclass
+class PassageRun:
+    """Tracks one passage as it moves between pipeline stages."""
+
+    book_name: str
+    chapter: int
+    verse_range: str
+    style: str
+    title: str
+    future: asyncio.Future
+    max_attempts: int = workflow.MAX_WORKFLOW_ATTEMPTS
+    attempt: int = 0
+    pg1_id: Optional[int] = None
+    song_ids: List[str] = field(default_factory=list)
+    downloaded_songs: List[Dict[str, Any]] = field(default_factory=list)
+    final_attempt_songs: List[Dict[str, Any]] = field(default_factory=list)
+    attempt_details: Dict[str, Any] = field(default_factory=dict)
+    workflow_details: Dict[str, Any] = field(default_factory=lambda: {
+        "attempts": [],
+        "total_songs_generated": 0,
+        "total_songs_reviewed": 0,
+        "songs_kept": 0,
+        "songs_deleted": 0,
+        "mode": "pipeline",
+    })
+
+    @property
+    def label(self) -> str:
+        return f"{self.book_name} {self.chapter}:{self.verse_range}"
+
+    @property
+    def is_final_attempt(self) -> bool:
+        return self.attempt >= self.max_attempts
+
+
+def extract_generated_song_ids(generation_result: Dict[str, Any]) -> List[str]:
+    """Return every Suno song ID from a generate_songs result."""
+    result = generation_result.get("result") or {}
+    song_ids = result.get("song_ids") or []
+    if not song_ids and result.get("song_id"):
+        song_ids = [result["song_id"]]
+    return song_ids
+
+
+class PassagePipeline:
+    """
+    Three-stage pipeline: generation -> download -> review.
+
+    Generation and download run a single consumer each, so browser and CDN
+    concurrency match the serial workflow, but different passages occupy
+    different stages at once. The review stage runs ``review_workers``
+    consumers so several passages can be reviewed together when concurrent
+    review is enabled. Retries re-enter the generation stage; its queue is
+    unbounded because the number of passages in flight is already capped by
+    the caller.
+    """
+
+    def __init__(self, stage_queue_size: int = 1, review_workers: int = 1):
+        self.stage_queue_size = max(1, stage_queue_size)
+        self.review_workers = max(1, review_workers)
+        self._generation_queue: Optional[asyncio.Queue] = None
+        self._download_queue: Optional[asyncio.Queue] = None
+        self._review_queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def _ensure_started(self) -> None:
+        if self.running:
+            return
+        self._generation_queue = asyncio.Queue()
+        self._download_queue = asyncio.Queue(maxsize=self.stage_queue_size)
+        self._review_queue = asyncio.Queue(maxsize=self.stage_queue_size)
+        self._tasks = [
+            asyncio.create_task(self._stage_loop("GENERATE", self._generation_queue, self._generate_stage)),
+            asyncio.create_task(self._stage_loop("DOWNLOAD", self._download_queue, self._download_stage)),
+        ]
+        self._tasks.extend(
+            asyncio.create_task(self._stage_loop("REVIEW", self._review_queue, self._review_stage))
+            for _ in range(self.review_workers)
+        )
+        print(
+            f"🚰 [PIPELINE] Stages started (stage queue size: {self.stage_queue_size}, "
+            f"review workers: {self.review_workers})"
+        )
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        print("🚰 [PIPELINE] Stages stopped")
+
+    async def run(
+        self,
+        book_name: str,
+        chapter: int,
+        verse_range: str,
+        style: str,
+        title: str,
+        song_structure_id: int = None
+    ) -> Dict[str, Any]:
+        """Submit one passage and wait for its workflow result."""
+        self._ensure_started()
+        for directory in (workflow.PENDING_REVIEW_DIR, workflow.FAILSAFE_DIR, workflow.verify_final_destination_folder()):
+            os.makedirs(directory, exist_ok=True)
+
+        run = PassageRun(
+            book_name=book_name,
+            chapter=chapter,
+            verse_range=verse_range,
+            style=style,
+            title=title,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._start_attempt(run)
+        return await run.future
+
+    def _start_attempt(self, run: PassageRun) -> None:
+        run.attempt += 1
+        run.pg1_id = None
+        run.song_ids = []
+        run.downloaded_songs = []
+        run.attempt_details = {
+            "attempt_number": run.attempt,
+            "generation_success": False,
+            "downloads": [],
+            "reviews": [],
+            "final_action": None,
+        }
+        print(f"🚰 [PIPELINE] {run.label} queued for generation (attempt {run.attempt}/{run.max_attempts})")
+        self._generation_queue.put_nowait(run)
+
+    def _finish(self, run: PassageRun, result: Dict[str, Any]) -> None:
+        if not run.future.done():
+            run.future.set_result(result)
+
+    async def _end_attempt(self, run: PassageRun, final_action: str) -> None:
+        """Record a failed attempt, then retry or finish the passage."""
+        run.attempt_details["final_action"] = final_action
+        run.workflow_details["attempts"].append(run.attempt_details)
+        if not run.is_final_attempt:
+            self._start_attempt(run)
+            return
+        if final_action.startswith("exception"):
+            self._finish(run, {
+                "success": False,
+                "message": f"🎼 Workflow failed after {run.max_attempts} attempts",
+                "total_attempts": run.attempt,
+                "final_songs_count": 0,
+                "error": final_action,
+                "workflow_details": run.workflow_details,
+            })
+            return
+        self._finish(run, await workflow.finalize_exhausted_workflow(
+            run.workflow_details, run.final_attempt_songs, run.max_attempts
+        ))
+
+    async def _stage_loop(self, stage_name: str, queue: asyncio.Queue, handler) -> None:
+        while True:
+            run: PassageRun = await queue.get()
+            try:
+                await handler(run)
+            except asyncio.CancelledError:
+                if not run.future.done():
+                    run.future.cancel()
+                raise
+            except Exception as e:
+                error_msg = f"Critical error on attempt {run.attempt}: {str(e)}"
+                print(f"🚰 [PIPELINE-{stage_name}] {run.label}: {error_msg}")
+                print(traceback.format_exc())
+                await self._end_attempt(run, f"exception: {error_msg}")
+            finally:
+                queue.task_done()
+
+    async def _generate_stage(self, run: PassageRun) -> None:
+        generation_result = await workflow.generate_songs(
+            run.book_name, run.chapter, run.verse_range, run.style, run.title
+        )
+        if not generation_result["success"]:
+            error_msg = generation_result.get("error", "Unknown generation error")
+            await self._end_attempt(run, f"generation_failed: {error_msg}")
+            return
+
+        run.attempt_details["generation_success"] = True
+        run.workflow_details["total_songs_generated"] += 2  # Suno generates 2 songs
+        run.pg1_id = generation_result.get("pg1_id")
+        run.song_ids = extract_generated_song_ids(generation_result)
+        print(f"🚰 [PIPELINE-GENERATE] {run.label} submitted to Suno: {run.song_ids}")
+        # Blocks while the download stage is saturated, applying backpressure to the browser
+        await self._download_queue.put(run)
+
+    async def _download_stage(self, run: PassageRun) -> None:
+        if any(workflow._is_real_song_id(song_id) for song_id in run.song_ids):
+            run.attempt_details["readiness"] = await workflow.wait_for_songs_ready(run.song_ids)
+        else:
+            await asyncio.sleep(workflow.SUNO_READY_FALLBACK_WAIT_SECONDS)
+
+        download_results = await workflow.download_both_songs(
+            run.title, workflow.PENDING_REVIEW_DIR, run.song_ids
+        )
+        if not download_results["success"]:
+            error_msg = download_results.get("error", "Unknown download error")
+            await self._end_attempt(run, f"download_failed: {error_msg}")
+            return
+
+        run.downloaded_songs = download_results["downloads"]
+        run.attempt_details["downloads"] = run.downloaded_songs
+        if run.is_final_attempt:
+            run.final_attempt_songs = run.downloaded_songs.copy()
+        await self._review_queue.put(run)
+
+    async def _review_stage(self, run: PassageRun) -> None:
+        review_results = await workflow.review_all_songs(run.downloaded_songs, run.pg1_id)
+        run.attempt_details["reviews"] = review_results
+        run.workflow_details["total_songs_reviewed"] += len(review_results)
+
+        final_dir = workflow.verify_final_destination_folder()
+        if run.is_final_attempt:
+            verdict_result = await workflow.process_song_verdicts_final_attempt(review_results, final_dir)
+        else:
+            verdict_result = await workflow.process_song_verdicts(review_results, final_dir)
+
+        run.workflow_details["songs_kept"] += verdict_result["kept_count"]
+        run.workflow_details["songs_deleted"] += verdict_result["deleted_count"]
+
+        if verdict_result["kept_count"] > 0:
+            run.attempt_details["final_action"] = f"success: {verdict_result['kept_count']} songs kept"
+            run.workflow_details["attempts"].append(run.attempt_details)
+            self._finish(run, {
+                "success": True,
+                "message": f"🎼 Workflow completed successfully on attempt {run.attempt}!",
+                "total_attempts": run.attempt,
+                "final_songs_count": verdict_result["kept_count"],
+                "good_songs": verdict_result["kept_count"],
+                "re_rolled_songs": verdict_result["deleted_count"],
+                "workflow_details": run.workflow_details,
+            })
+            return
+
+        await self._end_attempt(run, f"all_songs_rejected: retrying_attempt_{run.attempt + 1}")
+
+
+_pipeline: Optional[PassagePipeline] = None
+
+
+def get_pipeline() -> PassagePipeline:
+    """Return the process-wide passage pipeline, creating it on first use."""
+    global _pipeline
+    if _pipeline is None:
+        from config.ai_review_config import PROCESS_SEQUENTIALLY, REVIEW_MAX_CONCURRENCY
+        from config.orchestrator_config import PIPELINE_STAGE_QUEUE_SIZE
+
+        _pipeline = PassagePipeline(
+            stage_queue_size=PIPELINE_STAGE_QUEUE_SIZE,
+            review_workers=1 if PROCESS_SEQUENTIALLY else REVIEW_MAX_CONCURRENCY,
+        )
+    return _pipeline
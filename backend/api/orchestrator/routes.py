@@ -5,13 +5,23 @@ Purpose: API routes for orchestrator workflow operations - the "mission control"
          for complex song generation, download, and review workflows.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+import asyncio
 import os
 import traceback
 from pydantic import BaseModel
-from typing import Optional
-from .models import OrchestratorRequest, OrchestratorResponse
+from typing import Any, Dict, Optional
+from .models import (
+    OrchestratorRequest,
+    OrchestratorResponse,
+    JobSubmitResponse,
+    JobStatusResponse,
+    JobListResponse,
+)
+from .job_queue import JOB_STATUSES, get_job_store, get_worker_pool, payload_dedupe_key
+from .pipeline import get_pipeline
 from .utils import execute_song_workflow, download_both_songs
+from services.single_flight import get_generation_flights
 
 router = APIRouter(prefix="/api/v1/orchestrator", tags=["orchestrator"])
 
@@ -55,6 +65,47 @@ class ReviewTestResponse(BaseModel):
     error: Optional[str] = None
 
 
+async def run_orchestrator_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one OrchestratorRequest payload through the core workflow."""
+    from config.orchestrator_config import PIPELINE_MODE
+
+    request = OrchestratorRequest(**payload)
+    workflow_runner = get_pipeline().run if PIPELINE_MODE else execute_song_workflow
+    return await workflow_runner(
+        book_name=request.strBookName,
+        chapter=request.intBookChapter,
+        verse_range=request.strVerseRange,
+        style=request.strStyle,
+        title=request.strTitle,
+        song_structure_id=request.song_structure_id
+    )
+
+
+async def start_job_workers() -> None:
+    """Start the orchestrator worker pool (called from the application lifespan)."""
+    await get_worker_pool(run_orchestrator_job).start()
+
+
+async def stop_job_workers() -> None:
+    """Stop the orchestrator worker pool (called from the application lifespan)."""
+    await get_worker_pool(run_orchestrator_job).stop()
+    await get_pipeline().stop()
+
+
+def _job_to_response(job: Dict[str, Any]) -> JobStatusResponse:
+    return JobStatusResponse(
+        job_id=job["job_id"],
+        status=job["status"],
+        request=job["payload"],
+        attempts=job["attempts"],
+        created_at=job["created_at"],
+        started_at=job["started_at"],
+        finished_at=job["finished_at"],
+        result=job["result"],
+        error=job["error"],
+    )
+
+
 @router.post("/workflow", response_model=OrchestratorResponse)
 async def song_workflow_orchestrator(request: OrchestratorRequest):
     """
@@ -64,7 +115,7 @@ async def song_workflow_orchestrator(request: OrchestratorRequest):
     
     This orchestrates the entire song creation process:
     1. Generate 2 songs on Suno.com (single generation creates 2 variants)
-    2. Wait for Suno processing (3 minutes)
+    2. Wait for Suno processing (CDN readiness probe)
     3. Download both songs using negative indexing (-1, -2) 
     4. AI review each song for quality
     5. Handle verdicts:
@@ -93,13 +144,11 @@ async def song_workflow_orchestrator(request: OrchestratorRequest):
     
     try:
         # Execute the core workflow
-        workflow_result = await execute_song_workflow(
-            book_name=request.strBookName,
-            chapter=request.intBookChapter,
-            verse_range=request.strVerseRange,
-            style=request.strStyle,
-            title=request.strTitle,
-            song_structure_id=request.song_structure_id
+        # Concurrent identical requests share one workflow run
+        payload = request.model_dump()
+        workflow_result = await get_generation_flights().run(
+            ("workflow", payload_dedupe_key(payload)),
+            lambda: run_orchestrator_job(payload),
         )
         
         print(f"🎼 [ORCHESTRATOR] === WORKFLOW COMPLETED ===")
@@ -132,6 +181,89 @@ async def song_workflow_orchestrator(request: OrchestratorRequest):
         )
 
 
+@router.post("/jobs", response_model=JobSubmitResponse)
+async def submit_workflow_job(request: OrchestratorRequest):
+    """
+    Queue a song workflow and return its job id immediately.
+
+    The job is persisted before this endpoint returns, and is picked up by the
+    orchestrator worker pool. Poll /jobs/{job_id} for progress and results.
+    While an identical job (same book, passage, style, title and structure) is
+    queued or running, its id is returned instead of queueing a duplicate.
+
+    Args:
+        request: OrchestratorRequest with book, chapter, verse range, style, and title
+
+    Returns:
+        JobSubmitResponse: The queued job id and status
+    """
+    try:
+        job, created = await asyncio.to_thread(
+            get_job_store().enqueue_unique, request.model_dump(), payload_dedupe_key(request.model_dump())
+        )
+        if not created:
+            print(f"🧵 [JOB-QUEUE] Job {job['job_id']} is already {job['status']} for {request.strBookName} {request.intBookChapter}:{request.strVerseRange}")
+            return JobSubmitResponse(
+                success=True,
+                message="Identical workflow job already queued",
+                job_id=job["job_id"],
+                status=job["status"],
+            )
+        get_worker_pool(run_orchestrator_job).notify()
+        print(f"🧵 [JOB-QUEUE] Queued job {job['job_id']} for {request.strBookName} {request.intBookChapter}:{request.strVerseRange}")
+        return JobSubmitResponse(
+            success=True,
+            message="Workflow job queued",
+            job_id=job["job_id"],
+            status=job["status"],
+        )
+    except Exception as e:
+        error_msg = f"Failed to queue workflow job: {str(e)}"
+        print(f"🧵 [JOB-QUEUE] {error_msg}")
+        print(traceback.format_exc())
+        return JobSubmitResponse(
+            success=False,
+            message="Workflow job could not be queued",
+            error=error_msg,
+        )
+
+
+@router.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_workflow_job(job_id: str):
+    """
+    Get the status, request, and (once finished) result of a queued workflow job.
+    """
+    job = await asyncio.to_thread(get_job_store().get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return _job_to_response(job)
+
+
+@router.get("/jobs", response_model=JobListResponse)
+async def list_workflow_jobs(status: Optional[str] = None, limit: Optional[int] = None):
+    """
+    List workflow jobs newest first, optionally filtered by status.
+
+    Args:
+        status: One of queued, running, completed, failed
+        limit: Maximum number of jobs to return
+    """
+    from config.orchestrator_config import DEFAULT_JOB_LIST_LIMIT, MAX_JOB_LIST_LIMIT
+
+    if status and status not in JOB_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Invalid status '{status}'. Expected one of: {', '.join(JOB_STATUSES)}")
+    resolved_limit = min(max(1, limit or DEFAULT_JOB_LIST_LIMIT), MAX_JOB_LIST_LIMIT)
+
+    store = get_job_store()
+    jobs = await asyncio.to_thread(store.list_jobs, status, resolved_limit)
+    counts = await asyncio.to_thread(store.count_by_status)
+    return JobListResponse(
+        success=True,
+        jobs=[_job_to_response(job) for job in jobs],
+        counts=counts,
+    )
+
+
 @router.get("/status")
 async def orchestrator_status():
     """
@@ -145,6 +277,8 @@ async def orchestrator_status():
         "version": "1.0.0",
         "endpoints": [
             "/orchestrator/workflow - Main workflow execution",
+            "/orchestrator/jobs - Queue a workflow job (POST) or list jobs (GET)",
+            "/orchestrator/jobs/{job_id} - Queued job status and result",
             "/orchestrator/status - Service health check",
             "/orchestrator/debug/download - Test hybrid download (CDN + fallback)",
             "/orchestrator/debug/cdn-download - Test direct CDN download",
@@ -155,6 +289,8 @@ async def orchestrator_status():
             "Intelligent download with negative indexing",
             "AI-powered quality review",
             "3-attempt retry logic with fallback",
+            "Durable job queue drained by a configurable worker pool",
+            "Optional cross-passage pipeline (generate / download / review stages)",
             "Automatic file management and organization"
         ]
     }
@@ -0,0 +1,135 @@
+"""
+System: Suno Automation
+Module: Orchestrator Job Queue Tests
+File URL: backend/api/orchestrator/tests/test_job_queue.py
+Purpose: Validate durable job persistence and worker pool draining behaviour.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+PROJECT_ROOT = Path(__file__).resolve().parents[3]  # noqa: E402
+BACKEND_ROOT = PROJECT_ROOT / 'backend'  # noqa: E402
+for sys_path in (PROJECT_ROOT, BACKEND_ROOT):  # noqa: E402
+    sys_path_str = str(sys_path)  # noqa: E402
+    if sys_path_str not in sys.path:  # noqa: E402
+        sys.path.append(sys_path_str)  # noqa: E402
+
+from api.orchestrator.job_queue import (  # noqa: E402
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
+    JobStore,
+    OrchestratorWorkerPool,
+    payload_dedupe_key,
+)
+
+
+def _payload(verse_range: str) -> Dict[str, Any]:
+    return {
+        "strBookName": "Genesis",
+        "intBookChapter": 1,
+        "strVerseRange": verse_range,
+        "strStyle": "Pop",
+        "strTitle": f"Genesis 1:{verse_range}",
+    }
+
+
+def test_job_store_persists_and_claims_in_order(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "jobs.db")
+    store = JobStore(db_path)
+    first = store.enqueue(_payload("1-5"))
+    second = store.enqueue(_payload("6-10"))
+    store.close()
+
+    reopened = JobStore(db_path)
+    claimed = reopened.claim_next()
+    assert claimed["job_id"] == first["job_id"]
+    assert claimed["status"] == JOB_STATUS_RUNNING
+    assert claimed["attempts"] == 1
+
+    assert reopened.requeue_interrupted() == 1
+    assert reopened.get(first["job_id"])["status"] == JOB_STATUS_QUEUED
+
+    reopened.finish(second["job_id"], JOB_STATUS_COMPLETED, {"success": True})
+    assert reopened.get(second["job_id"])["result"] == {"success": True}
+    assert reopened.count_by_status()[JOB_STATUS_COMPLETED] == 1
+    assert [job["job_id"] for job in reopened.list_jobs(status=JOB_STATUS_QUEUED)] == [first["job_id"]]
+
+
+
+def test_requeue_interrupted_fails_jobs_past_max_attempts(tmp_path: Path) -> None:
+    store = JobStore(str(tmp_path / "jobs.db"))
+    job = store.enqueue(_payload("1-5"))
+
+    for attempt in range(1, 3):
+        assert store.claim_next()["attempts"] == attempt
+        assert store.requeue_interrupted(max_attempts=2) == (1 if attempt < 2 else 0)
+
+    failed = store.get(job["job_id"])
+    assert failed["status"] == JOB_STATUS_FAILED
+    assert failed["attempts"] == 2
+    assert "not re-queued" in failed["error"]
+    assert store.claim_next() is None
+
+@pytest.mark.asyncio
+async def test_worker_pool_drains_queue(tmp_path: Path) -> None:
+    store = JobStore(str(tmp_path / "jobs.db"))
+    handled: List[str] = []
+
+    async def handler(payload: Dict[str, Any]) -> Dict[str, Any]:
+        handled.append(payload["strVerseRange"])
+        if payload["strVerseRange"] == "11-15":
+            raise RuntimeError("browser crashed")
+        return {"success": payload["strVerseRange"] != "6-10", "error": None}
+
+    jobs = [store.enqueue(_payload(verse_range)) for verse_range in ("1-5", "6-10", "11-15")]
+
+    pool = OrchestratorWorkerPool(store, handler, worker_count=2, poll_interval=0.05)
+    await pool.start()
+    for _ in range(100):
+        if store.count_by_status()[JOB_STATUS_QUEUED] == 0 and store.count_by_status()[JOB_STATUS_RUNNING] == 0:
+            break
+        await asyncio.sleep(0.02)
+    await pool.stop()
+
+    assert sorted(handled) == ["1-5", "11-15", "6-10"]
+    assert store.get(jobs[0]["job_id"])["status"] == JOB_STATUS_COMPLETED
+    assert store.get(jobs[1]["job_id"])["status"] == JOB_STATUS_FAILED
+    failed_with_exception = store.get(jobs[2]["job_id"])
+    assert failed_with_exception["status"] == JOB_STATUS_FAILED
+    assert "browser crashed" in failed_with_exception["error"]
+
+
+def test_enqueue_unique_returns_active_job_for_identical_request(tmp_path) -> None:
+    store = JobStore(str(tmp_path / "jobs.db"))
+    payload = _payload("1-10")
+    first, created = store.enqueue_unique(payload, payload_dedupe_key(payload))
+    assert created
+
+    duplicate, created = store.enqueue_unique(dict(payload), payload_dedupe_key(dict(reversed(list(payload.items())))))
+    assert not created
+    assert duplicate["job_id"] == first["job_id"]
+
+    claimed = store.claim_next()
+    store.finish(claimed["job_id"], JOB_STATUS_COMPLETED, result={"success": True})
+    requeued, created = store.enqueue_unique(payload, payload_dedupe_key(payload))
+    assert created
+    assert requeued["job_id"] != first["job_id"]
+
+
+def test_different_style_for_same_passage_is_a_separate_job(tmp_path) -> None:
+    store = JobStore(str(tmp_path / "jobs.db"))
+    pop = _payload("1-10")
+    rock = {**pop, "strStyle": "Rock"}
+    first, _ = store.enqueue_unique(pop, payload_dedupe_key(pop))
+    second, created = store.enqueue_unique(rock, payload_dedupe_key(rock))
+    assert created
+    assert second["job_id"] != first["job_id"]
+    assert second["payload"]["strStyle"] == "Rock"
@@ -0,0 +1,79 @@
+"""
+System: Suno Automation
+Module: Orchestrator Pipeline Tests
+File URL: backend/api/orchestrator/tests/test_pipeline.py
+Purpose: Validate cross-passage stage overlap and retry routing in the passage pipeline.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+PROJECT_ROOT = Path(__file__).resolve().parents[3]  # noqa: E402
+BACKEND_ROOT = PROJECT_ROOT / 'backend'  # noqa: E402
+for sys_path in (PROJECT_ROOT, BACKEND_ROOT):  # noqa: E402
+    sys_path_str = str(sys_path)  # noqa: E402
+    if sys_path_str not in sys.path:  # noqa: E402
+        sys.path.append(sys_path_str)  # noqa: E402
+
+from api.orchestrator.pipeline import PassagePipeline  # noqa: E402
+
+
+@pytest.mark.asyncio
+async def test_pipeline_overlaps_passages_and_retries(monkeypatch, tmp_path: Path) -> None:
+    events: List[str] = []
+    review_calls: Dict[str, int] = {}
+
+    monkeypatch.setattr("api.orchestrator.utils.PENDING_REVIEW_DIR", str(tmp_path / "pending"))
+    monkeypatch.setattr("api.orchestrator.utils.FAILSAFE_DIR", str(tmp_path / "fail_safe"))
+    monkeypatch.setattr("api.orchestrator.utils.verify_final_destination_folder", lambda: str(tmp_path / "final"))
+
+    async def fake_generate(book_name, chapter, verse_range, style, title) -> Dict[str, Any]:
+        events.append(f"generate:{verse_range}")
+        await asyncio.sleep(0.01)
+        return {"success": True, "pg1_id": 1, "result": {"song_ids": [f"pending_{verse_range}"]}}
+
+    async def fake_download(title: str, temp_dir: str, song_ids: list = None) -> Dict[str, Any]:
+        events.append(f"download:{title}")
+        await asyncio.sleep(0.05)
+        return {"success": True, "downloads": [{"file_path": f"{title}.mp3", "title": title, "song_id": None}]}
+
+    async def fake_review(downloaded_songs: List[Dict], pg1_id: int) -> List[Dict[str, Any]]:
+        title = downloaded_songs[0]["title"]
+        review_calls[title] = review_calls.get(title, 0) + 1
+        events.append(f"review:{title}")
+        await asyncio.sleep(0.05)
+        verdict = "re-roll" if title == "1-5" and review_calls[title] == 1 else "continue"
+        return [{**downloaded_songs[0], "verdict": verdict}]
+
+    async def fake_verdicts(review_results: List[Dict], final_dir: str) -> Dict[str, int]:
+        kept = sum(1 for result in review_results if result["verdict"] == "continue")
+        return {"kept_count": kept, "deleted_count": len(review_results) - kept}
+
+    async def no_sleep(_seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr("api.orchestrator.utils.generate_songs", fake_generate)
+    monkeypatch.setattr("api.orchestrator.utils.download_both_songs", fake_download)
+    monkeypatch.setattr("api.orchestrator.utils.review_all_songs", fake_review)
+    monkeypatch.setattr("api.orchestrator.utils.process_song_verdicts", fake_verdicts)
+    monkeypatch.setattr("api.orchestrator.utils.SUNO_READY_FALLBACK_WAIT_SECONDS", 0)
+
+    pipeline = PassagePipeline(stage_queue_size=1)
+    try:
+        results = await asyncio.gather(*[
+            pipeline.run("Genesis", 1, verse_range, "Pop", verse_range)
+            for verse_range in ("1-5", "6-10")
+        ])
+    finally:
+        await pipeline.stop()
+
+    assert [result["success"] for result in results] == [True, True]
+    assert results[0]["total_attempts"] == 2
+    assert results[1]["total_attempts"] == 1
+    # Passage 2 is generated before passage 1 has finished its first review
+    assert events.index("generate:6-10") < events.index("review:1-5")
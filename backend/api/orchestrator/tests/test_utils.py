@@ -25,19 +25,29 @@ for sys_path in (PROJECT_ROOT, BACKEND_ROOT):  # noqa: E402
 from api.orchestrator.utils import (  # noqa: E402
     downloadSongsFromCdn,
     download_both_songs,
+    review_all_songs,
+    wait_for_songs_ready,
 )
 
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, no padding -> 417-byte frames of 1152 samples
+MP3_FRAME = b"\xff\xfb\x90\x00" + b"\x00" * 413
+
+
+def build_mp3(frame_count: int = 20) -> bytes:
+    """Minimal ID3v2 tag followed by complete MPEG frames."""
+    return b"ID3\x03\x00\x00\x00\x00\x00\x00" + MP3_FRAME * frame_count
+
 
 @pytest.mark.asyncio
 async def test_downloadSongsFromCdn_success(tmp_path: Path) -> None:
     async def handler(request: web.Request) -> web.Response:
-        return web.Response(body=b"ID3-test-audio")
+        return web.Response(body=build_mp3())
 
     app = web.Application()
     app.router.add_get("/song-success.mp3", handler)
 
     async with TestServer(app) as server:
-        base_url = str(server.make_url(""))[:-1]
+        base_url = str(server.make_url("")).rstrip("/")
         result = await downloadSongsFromCdn(
             song_id="song-success",
             download_dir=str(tmp_path),
@@ -47,7 +57,8 @@ async def test_downloadSongsFromCdn_success(tmp_path: Path) -> None:
     assert result["success"] is True
     downloaded_file = Path(result["file_path"])
     assert downloaded_file.exists()
-    assert downloaded_file.read_bytes().startswith(b"ID3-test-audio")
+    assert downloaded_file.read_bytes() == build_mp3()
+    assert result["duration_seconds"] == round(20 * 1152 / 44100, 2)
 
 
 @pytest.mark.asyncio
@@ -55,7 +66,7 @@ async def test_downloadSongsFromCdn_not_found(tmp_path: Path) -> None:
     app = web.Application()
 
     async with TestServer(app) as server:
-        base_url = str(server.make_url(""))[:-1]
+        base_url = str(server.make_url("")).rstrip("/")
         result = await downloadSongsFromCdn(
             song_id="missing",
             download_dir=str(tmp_path),
@@ -75,7 +86,7 @@ async def test_downloadSongsFromCdn_server_error(tmp_path: Path) -> None:
     app.router.add_get("/song-error.mp3", handler)
 
     async with TestServer(app) as server:
-        base_url = str(server.make_url(""))[:-1]
+        base_url = str(server.make_url("")).rstrip("/")
         result = await downloadSongsFromCdn(
             song_id="song-error",
             download_dir=str(tmp_path),
@@ -96,7 +107,7 @@ async def test_downloadSongsFromCdn_timeout(tmp_path: Path) -> None:
     app.router.add_get("/song-slow.mp3", handler)
 
     async with TestServer(app) as server:
-        base_url = str(server.make_url(""))[:-1]
+        base_url = str(server.make_url("")).rstrip("/")
         result = await downloadSongsFromCdn(
             song_id="song-slow",
             download_dir=str(tmp_path),
@@ -118,7 +129,7 @@ async def test_downloadSongsFromCdn_invalid_mp3(tmp_path: Path) -> None:
     app.router.add_get("/song-bad.mp3", handler)
 
     async with TestServer(app) as server:
-        base_url = str(server.make_url(""))[:-1]
+        base_url = str(server.make_url("")).rstrip("/")
         result = await downloadSongsFromCdn(
             song_id="song-bad",
             download_dir=str(tmp_path),
@@ -130,10 +141,70 @@ async def test_downloadSongsFromCdn_invalid_mp3(tmp_path: Path) -> None:
     assert not any(tmp_path.iterdir())
 
 
+@pytest.mark.asyncio
+async def test_downloadSongsFromCdn_resumes_interrupted_stream(tmp_path: Path) -> None:
+    payload = build_mp3(40)
+    range_headers = []
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        range_header = request.headers.get("Range")
+        range_headers.append(range_header)
+        if range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            return web.Response(
+                status=206,
+                body=payload[start:],
+                headers={"Content-Range": f"bytes {start}-{len(payload) - 1}/{len(payload)}"},
+            )
+        response = web.StreamResponse()
+        response.content_length = len(payload)
+        await response.prepare(request)
+        await response.write(payload[: len(payload) // 2])
+        request.transport.close()
+        return response
+
+    app = web.Application()
+    app.router.add_get("/song-resume.mp3", handler)
+
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+        result = await downloadSongsFromCdn(
+            song_id="song-resume",
+            download_dir=str(tmp_path),
+            base_url=base_url,
+        )
+
+    assert result["success"] is True
+    assert Path(result["file_path"]).read_bytes() == payload
+    assert range_headers[0] is None
+    assert range_headers[-1] is not None and range_headers[-1].startswith("bytes=")
+
+
+@pytest.mark.asyncio
+async def test_downloadSongsFromCdn_rejects_truncated_mp3(tmp_path: Path) -> None:
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(body=build_mp3()[:-100])
+
+    app = web.Application()
+    app.router.add_get("/song-cut.mp3", handler)
+
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+        result = await downloadSongsFromCdn(
+            song_id="song-cut",
+            download_dir=str(tmp_path),
+            base_url=base_url,
+        )
+
+    assert result["success"] is False
+    assert "Truncated MP3" in result["error"]
+    assert not any(tmp_path.iterdir())
+
+
 @pytest.mark.asyncio
 async def test_download_both_songs_hybrid_flow(monkeypatch, tmp_path: Path) -> None:
     async def good_handler(request: web.Request) -> web.Response:
-        return web.Response(body=b"ID3-good-audio")
+        return web.Response(body=build_mp3())
 
     async def bad_handler(request: web.Request) -> web.Response:
         return web.Response(status=500)
@@ -143,7 +214,7 @@ async def test_download_both_songs_hybrid_flow(monkeypatch, tmp_path: Path) -> N
     app.router.add_get("/song-bad.mp3", bad_handler)
 
     async with TestServer(app) as server:
-        base_url = str(server.make_url(""))[:-1]
+        base_url = str(server.make_url("")).rstrip("/")
 
         monkeypatch.setattr(
             "api.orchestrator.utils.CDN_BASE_URL",
@@ -180,3 +251,83 @@ async def test_download_both_songs_hybrid_flow(monkeypatch, tmp_path: Path) -> N
     file_paths = {entry["song_id"]: Path(entry["file_path"]) for entry in result["downloads"]}
     assert "song-good" in file_paths and file_paths["song-good"].exists()
     assert "song-bad" in file_paths and file_paths["song-bad"].exists()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_songs_ready_polls_until_available() -> None:
+    probe_counts: Dict[str, int] = {"song-fast": 0, "song-slow": 0}
+
+    async def handler(request: web.Request) -> web.Response:
+        song_id = request.match_info["song_id"]
+        probe_counts[song_id] += 1
+        ready_after = 1 if song_id == "song-fast" else 3
+        if probe_counts[song_id] < ready_after:
+            return web.Response(status=404)
+        return web.Response(status=206, body=b"ID3-partial")
+
+    app = web.Application()
+    app.router.add_get("/{song_id}.mp3", handler)
+
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+        result = await wait_for_songs_ready(
+            ["song-fast", "song-slow", "pending_123"],
+            base_url=base_url,
+            initial_delay=0,
+            backoff_start=0.01,
+            backoff_max=0.02,
+            max_wait=5,
+        )
+
+    assert result["ready"] == ["song-fast", "song-slow"]
+    assert result["pending"] == []
+    assert probe_counts == {"song-fast": 1, "song-slow": 3}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_songs_ready_gives_up_after_max_wait() -> None:
+    app = web.Application()
+
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+        result = await wait_for_songs_ready(
+            ["song-never"],
+            base_url=base_url,
+            initial_delay=0,
+            backoff_start=0.05,
+            backoff_max=0.05,
+            max_wait=0.2,
+        )
+
+    assert result["ready"] == []
+    assert result["pending"] == ["song-never"]
+
+
+@pytest.mark.asyncio
+async def test_review_all_songs_concurrent_preserves_order(monkeypatch, tmp_path: Path) -> None:
+    in_flight = {"current": 0, "peak": 0}
+    durations = {"a.mp3": 0.15, "b.mp3": 0.05, "c.mp3": 0.01}
+
+    async def fake_call_review_api(file_path: str, pg1_id: int) -> Dict[str, Any]:
+        in_flight["current"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+        await asyncio.sleep(durations[Path(file_path).name])
+        in_flight["current"] -= 1
+        return {"success": True, "verdict": "continue"}
+
+    monkeypatch.setattr("api.orchestrator.utils.call_review_api", fake_call_review_api)
+    monkeypatch.setattr("api.orchestrator.utils.PROCESS_SEQUENTIALLY", False)
+    monkeypatch.setattr("api.orchestrator.utils.REVIEW_MAX_CONCURRENCY", 2)
+    monkeypatch.setattr("api.orchestrator.utils._review_semaphore_state", None)
+
+    songs = []
+    for name in durations:
+        song_path = tmp_path / name
+        song_path.write_bytes(b"ID3")
+        songs.append({"file_path": str(song_path), "title": "Concurrent", "song_id": name})
+
+    results = await review_all_songs(songs, pg1_id=7)
+
+    assert [result["song_id"] for result in results] == ["a.mp3", "b.mp3", "c.mp3"]
+    assert all(result["verdict"] == "continue" for result in results)
+    assert in_flight["peak"] == 2
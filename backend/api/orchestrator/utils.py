@@ -14,17 +14,37 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Set
 
 import aiohttp
-from camoufox import AsyncCamoufox
 
+from config.ai_review_config import PROCESS_SEQUENTIALLY, REVIEW_MAX_CONCURRENCY
+from middleware.gemini_files import upload_file_to_google_ai
+from services.progress_repository import ProgressStatus, get_progress_repository
+from utils.http_session import get_http_session
+from utils.mp3_integrity import scan_mp3_frames
 from utils.delete_song import delete_song
-from configs.browser_config import config
 
 
-# CDN-first download strategy attempts CDN once per song ID before falling back to browser automation.
+# CDN-first download strategy streams each song ID over plain HTTP before falling back to browser automation.
 # A 30-second timeout and timestamp-based collision handling protect existing pending_review assets.
 CDN_BASE_URL = "https://cdn1.suno.ai"
 CDN_TIMEOUT_SECONDS = 30
 CDN_STREAM_CHUNK_SIZE = 64 * 1024
+# Interrupted or short streams are resumed with HTTP Range requests from the last byte received.
+CDN_RESUME_ATTEMPTS = 3
+
+# Readiness probing replaces a fixed post-generation sleep: the CDN is polled with a small
+# Range request and exponential backoff until each MP3 exists, so fast renders download early.
+SUNO_READY_INITIAL_DELAY_SECONDS = 10
+SUNO_READY_BACKOFF_START_SECONDS = 3
+SUNO_READY_BACKOFF_MAX_SECONDS = 20
+SUNO_READY_MAX_WAIT_SECONDS = 240
+SUNO_READY_PROBE_TIMEOUT_SECONDS = 10
+SUNO_READY_FALLBACK_WAIT_SECONDS = 60
+
+MAX_WORKFLOW_ATTEMPTS = 3
+PENDING_REVIEW_DIR = "backend/songs/pending_review"
+FAILSAFE_DIR = "backend/songs/fail_safe"
+
+_review_semaphore_state: Optional[tuple] = None
 
 def _is_likely_mp3_header(header_bytes: bytes) -> bool:
     if not header_bytes or len(header_bytes) < 2:
@@ -33,6 +53,19 @@ def _is_likely_mp3_header(header_bytes: bytes) -> bool:
         return True
     return header_bytes[0] == 0xFF and (header_bytes[1] & 0xE0) == 0xE0
 
+def _expected_cdn_size(response: aiohttp.ClientResponse, offset: int) -> Optional[int]:
+    """Total file size advertised by Content-Range (206) or Content-Length (200)."""
+    content_range = response.headers.get("Content-Range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1].strip()
+        if total.isdigit():
+            return int(total)
+    if response.content_length is None:
+        return None
+    if response.status == 206:
+        return offset + response.content_length
+    return response.content_length
+
 def _resolve_collision_path(candidate_path: Path) -> Path:
     if not candidate_path.exists():
         return candidate_path
@@ -43,6 +76,89 @@ def _remove_path_if_exists(target_path: Path) -> None:
     if target_path.exists():
         target_path.unlink()
 
+def _is_real_song_id(song_id: Optional[str]) -> bool:
+    return bool(song_id) and not str(song_id).startswith("pending_")
+
+
+async def _record_progress_status(song_ids: List[Optional[str]], status: int, increment_reviews: bool = False) -> None:
+    """Update the tblprogress_v1 rows of these clips in place; tracking failures never stop the workflow."""
+    real_song_ids = [song_id for song_id in song_ids if _is_real_song_id(song_id)]
+    if not real_song_ids:
+        return
+    try:
+        await get_progress_repository().update_status_async(real_song_ids, status, increment_reviews)
+    except Exception as e:
+        print(f"🗄️ [PROGRESS] ⚠️ Could not record status {status} for {real_song_ids}: {e}")
+
+async def _probe_cdn_mp3(session: aiohttp.ClientSession, cdn_url: str) -> bool:
+    """Return True when the CDN serves MP3 bytes for the URL (first bytes only)."""
+    timeout = aiohttp.ClientTimeout(total=SUNO_READY_PROBE_TIMEOUT_SECONDS)
+    try:
+        async with session.get(cdn_url, headers={"Range": "bytes=0-15"}, timeout=timeout) as response:
+            if response.status not in (200, 206):
+                return False
+            header_bytes = await response.content.read(16)
+            return _is_likely_mp3_header(header_bytes)
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return False
+
+async def wait_for_songs_ready(
+    song_ids: List[str],
+    *,
+    base_url: Optional[str] = None,
+    initial_delay: float = SUNO_READY_INITIAL_DELAY_SECONDS,
+    backoff_start: float = SUNO_READY_BACKOFF_START_SECONDS,
+    backoff_max: float = SUNO_READY_BACKOFF_MAX_SECONDS,
+    max_wait: float = SUNO_READY_MAX_WAIT_SECONDS,
+) -> Dict[str, Any]:
+    """
+    Poll the CDN until every song's MP3 is available or max_wait elapses.
+
+    Args:
+        song_ids: Suno song IDs returned by generation
+        base_url: Optional CDN base URL override
+        initial_delay: Seconds to wait before the first probe
+        backoff_start: First delay between probes, doubled after each round
+        backoff_max: Upper bound for the delay between probes
+        max_wait: Total time budget for readiness detection
+
+    Returns:
+        Dict[str, Any]: ready and pending song ID lists plus elapsed_seconds
+    """
+    resolved_base_url = (base_url or CDN_BASE_URL).rstrip("/")
+    pending = [song_id for song_id in song_ids if _is_real_song_id(song_id)]
+    ready: List[str] = []
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+
+    if not pending:
+        return {"ready": ready, "pending": pending, "elapsed_seconds": 0.0}
+
+    await asyncio.sleep(min(initial_delay, max_wait))
+    delay = backoff_start
+    session = await get_http_session()
+    while pending:
+        probe_results = await asyncio.gather(*[
+            _probe_cdn_mp3(session, f"{resolved_base_url}/{song_id}.mp3")
+            for song_id in pending
+        ])
+        for song_id, is_ready in zip(list(pending), probe_results):
+            if is_ready:
+                pending.remove(song_id)
+                ready.append(song_id)
+                print(f"⏱️ [READY] {song_id} available after {loop.time() - started_at:.1f}s")
+
+        remaining = max_wait - (loop.time() - started_at)
+        if not pending or remaining <= 0:
+            break
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, backoff_max)
+
+    elapsed = loop.time() - started_at
+    if pending:
+        print(f"⏱️ [READY] ⚠️ Still pending after {elapsed:.1f}s: {pending}")
+    return {"ready": ready, "pending": pending, "elapsed_seconds": round(elapsed, 1)}
+
 async def execute_song_workflow(
     book_name: str,
     chapter: int,
@@ -58,7 +174,7 @@ async def execute_song_workflow(
     
     WORKFLOW STEPS:
     1. Generate 2 songs on Suno.com (single generation creates 2 variants)
-    2. Wait for Suno processing
+    2. Wait for Suno processing (CDN readiness probe with backoff)
     3. Download both songs using negative indexing (-1, -2)
     4. AI review each song for quality
     5. Handle verdicts:
@@ -82,8 +198,8 @@ async def execute_song_workflow(
     
     # Use verification function to ensure we have the correct final destination
     final_dir = verify_final_destination_folder()
-    temp_dir = "backend/songs/pending_review"
-    failsafe_dir = "backend/songs/fail_safe"
+    temp_dir = PENDING_REVIEW_DIR
+    failsafe_dir = FAILSAFE_DIR
 
     # Ensure required directories exist
     os.makedirs(temp_dir, exist_ok=True)
@@ -102,7 +218,7 @@ async def execute_song_workflow(
         "songs_deleted": 0
     }
     
-    max_attempts = 3
+    max_attempts = MAX_WORKFLOW_ATTEMPTS
     final_attempt_songs = []  # Track final attempt songs for fail-safe
     
     for attempt in range(1, max_attempts + 1):
@@ -171,11 +287,16 @@ async def execute_song_workflow(
                 print(f"🎼 [WORKFLOW] pg1_id: {pg1_id}")
 
             # STEP 2: Wait for Suno processing
-            wait_time_seconds = 60
-            print(f"🎼 [WORKFLOW] Step 2: Waiting for Suno processing ({wait_time_seconds} seconds)...")
-            print(f"🎼 [WORKFLOW] ⏳ Starting wait at: {asyncio.get_event_loop().time()}")
-            await asyncio.sleep(wait_time_seconds)
-            print(f"🎼 [WORKFLOW] ⏰ Wait completed at: {asyncio.get_event_loop().time()}")
+            if any(_is_real_song_id(current_id) for current_id in song_ids):
+                print("🎼 [WORKFLOW] Step 2: Probing CDN until songs are ready...")
+                readiness = await wait_for_songs_ready(song_ids)
+                attempt_details["readiness"] = readiness
+                print(f"🎼 [WORKFLOW] ⏰ Readiness check finished after {readiness['elapsed_seconds']}s (ready={readiness['ready']}, pending={readiness['pending']})")
+            else:
+                # Without song IDs there is nothing to probe; the browser fallback waits on the menu itself
+                wait_time_seconds = SUNO_READY_FALLBACK_WAIT_SECONDS
+                print(f"🎼 [WORKFLOW] Step 2: No song IDs to probe, waiting {wait_time_seconds} seconds for Suno processing...")
+                await asyncio.sleep(wait_time_seconds)
 
             # STEP 3: Download both songs
             print("🎼 [WORKFLOW] Step 3: Downloading both generated songs...")
@@ -265,6 +386,28 @@ async def execute_song_workflow(
     
     # If we reach here, all attempts failed but no exception on last attempt
     # This means all songs were consistently rejected across all attempts
+    return await finalize_exhausted_workflow(workflow_details, final_attempt_songs, max_attempts)
+
+
+async def finalize_exhausted_workflow(
+    workflow_details: Dict[str, Any],
+    final_attempt_songs: List[Dict[str, Any]],
+    max_attempts: int = MAX_WORKFLOW_ATTEMPTS
+) -> Dict[str, Any]:
+    """
+    Build the workflow result once every attempt was used without keeping a song.
+
+    Applies the emergency fail-safe: songs from the final attempt that survived
+    verdict processing (review errors) are moved to the fail_safe directory.
+
+    Args:
+        workflow_details (Dict[str, Any]): Accumulated per-attempt workflow tracking
+        final_attempt_songs (List[Dict[str, Any]]): Songs downloaded in the final attempt
+        max_attempts (int): Number of attempts that were allowed
+
+    Returns:
+        Dict[str, Any]: Workflow result in the execute_song_workflow format
+    """
     print(f"🎼 [WORKFLOW] All {max_attempts} attempts completed, no songs met quality standards")
 
     # FAIL-SAFE: Only activate if absolutely NO songs remain (all were deleted)
@@ -374,7 +517,7 @@ async def downloadSongsFromCdn(
     timeout_seconds: int = CDN_TIMEOUT_SECONDS,
     chunk_size: int = CDN_STREAM_CHUNK_SIZE
 ) -> Dict[str, Any]:
-    """Fetch an MP3 from the CDN using Camoufox browser automation."""
+    """Stream an MP3 from the CDN into a .part file and atomically rename it once complete."""
     if not song_id:
         return {
             "success": False,
@@ -390,80 +533,103 @@ async def downloadSongsFromCdn(
 
     candidate_path = download_directory / f"{song_id}.mp3"
     final_path = _resolve_collision_path(candidate_path)
+    part_path = final_path.with_name(f"{final_path.name}.part")
 
-    try:
-        print(f"📥 [CDN] Fetching {song_id} from {cdn_url} using Camoufox")
-
-        async with AsyncCamoufox(**config) as browser:
-            # Create a new page with download directory configured
-            page = await browser.new_page()
-
-            # Set up download directory
-            await page.context.set_extra_http_headers({
-                "Accept": "audio/mpeg,*/*;q=0.9"
-            })
-
-            # Navigate directly to the CDN URL
-            response = await page.goto(cdn_url, timeout=timeout_seconds * 1000)
-
-            if not response or response.status != 200:
-                error_message = f"HTTP {response.status if response else 'No Response'}: Failed to access CDN URL"
-                print(f"📥 [CDN] ❌ {error_message}")
-                await page.close()
-                return {
-                    "success": False,
-                    "song_id": song_id,
-                    "error": error_message
-                }
-
-            # Get the MP3 content directly from response body
-            content = await response.body()
-
-            if not content or len(content) < 100:
-                error_message = "Empty or invalid MP3 content"
-                print(f"📥 [CDN] ❌ {error_message}")
-                await page.close()
-                return {
-                    "success": False,
-                    "song_id": song_id,
-                    "error": error_message
-                }
+    def _failure(error_message: str) -> Dict[str, Any]:
+        print(f"📥 [CDN] ❌ {error_message}")
+        _remove_path_if_exists(part_path)
+        return {
+            "success": False,
+            "song_id": song_id,
+            "error": error_message
+        }
 
-            # Save to file
-            with open(final_path, 'wb') as f:
-                f.write(content)
+    http_session = session or await get_http_session()
+    timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+    bytes_received = 0
+    expected_size: Optional[int] = None
+    header_bytes = b""
 
-            # Verify file was saved
-            if final_path.exists() and final_path.stat().st_size > 0:
-                file_size = final_path.stat().st_size
-                print(f"📥 [CDN] ✅ Downloaded {song_id} ({file_size:,} bytes) -> {final_path}")
-                await page.close()
-                return {
-                    "success": True,
-                    "song_id": song_id,
-                    "file_path": str(final_path),
-                    "message": "Downloaded from CDN via Camoufox"
-                }
+    try:
+        for attempt in range(CDN_RESUME_ATTEMPTS + 1):
+            request_headers = {
+                "Accept": "audio/mpeg,*/*;q=0.9",
+                "Accept-Encoding": "identity"
+            }
+            if bytes_received:
+                request_headers["Range"] = f"bytes={bytes_received}-"
+                print(f"📥 [CDN] Resuming {song_id} from byte {bytes_received:,} (attempt {attempt + 1})")
             else:
-                error_message = "File save failed"
-                print(f"📥 [CDN] ❌ {error_message}")
-                await page.close()
-                return {
-                    "success": False,
-                    "song_id": song_id,
-                    "error": error_message
-                }
+                print(f"📥 [CDN] Fetching {song_id} from {cdn_url}")
+
+            try:
+                async with http_session.get(cdn_url, timeout=timeout, headers=request_headers) as response:
+                    if bytes_received and response.status == 206:
+                        file_mode = "ab"
+                    elif response.status == 200:
+                        # First request, or the server ignored our Range header: start over
+                        file_mode = "wb"
+                        bytes_received = 0
+                        header_bytes = b""
+                    else:
+                        return _failure(f"HTTP {response.status}: Failed to access CDN URL")
+
+                    expected_size = _expected_cdn_size(response, bytes_received) or expected_size
+
+                    with open(part_path, file_mode) as part_file:
+                        async for chunk in response.content.iter_chunked(chunk_size):
+                            if not chunk:
+                                continue
+                            if len(header_bytes) < 3:
+                                header_bytes += chunk[:3 - len(header_bytes)]
+                                if len(header_bytes) >= 3 and not _is_likely_mp3_header(header_bytes):
+                                    break
+                            part_file.write(chunk)
+                            bytes_received += len(chunk)
+            except (aiohttp.ClientPayloadError, aiohttp.ServerDisconnectedError, asyncio.TimeoutError) as exc:
+                if not bytes_received:
+                    raise
+                print(f"📥 [CDN] ⚠️ Stream for {song_id} interrupted after {bytes_received:,} bytes: {exc!r}")
+                continue
 
-    except Exception as exc:
-        error_message = f"CDN download error: {str(exc)}"
-        print(f"📥 [CDN] ❌ {error_message}")
-        print(traceback.format_exc())
+            if header_bytes and not _is_likely_mp3_header(header_bytes):
+                break
+            if expected_size is None or bytes_received >= expected_size:
+                break
+            print(f"📥 [CDN] ⚠️ Short read for {song_id}: {bytes_received:,} of {expected_size:,} bytes")
+
+        if not header_bytes:
+            return _failure("Empty MP3 content")
+        if not _is_likely_mp3_header(header_bytes):
+            return _failure("Invalid MP3 header")
+        if expected_size is not None and bytes_received != expected_size:
+            return _failure(f"Incomplete download: received {bytes_received:,} of {expected_size:,} bytes")
+
+        scan = await asyncio.to_thread(scan_mp3_frames, str(part_path))
+        if not scan["valid"]:
+            return _failure(f"MP3 integrity check failed: {scan['error']}")
+
+        os.replace(part_path, final_path)
+        print(
+            f"📥 [CDN] ✅ Downloaded {song_id} ({bytes_received:,} bytes, "
+            f"{scan['frame_count']} frames, {scan['duration_seconds']}s) -> {final_path}"
+        )
         return {
-            "success": False,
+            "success": True,
             "song_id": song_id,
-            "error": error_message
+            "file_path": str(final_path),
+            "duration_seconds": scan["duration_seconds"],
+            "message": "Downloaded from CDN"
         }
 
+    except asyncio.TimeoutError:
+        return _failure(f"CDN request timed out after {timeout_seconds}s")
+    except aiohttp.ClientError as exc:
+        return _failure(f"CDN request failed: {str(exc)}")
+    except Exception as exc:
+        print(traceback.format_exc())
+        return _failure(f"CDN download error: {str(exc)}")
+
 
 async def download_both_songs(title: str, temp_dir: str, song_ids: list = None) -> Dict[str, Any]:
     """Download both songs via CDN-first strategy with Playwright fallback for resilience.
@@ -487,17 +653,17 @@ async def download_both_songs(title: str, temp_dir: str, song_ids: list = None)
 
         if song_ids:
             print("\n📥 [CDN] Starting CDN-first download attempts...")
-            for config in index_configs:
+            cdn_configs = [config for config in index_configs if config["song_id"]]
+            # Both songs stream concurrently over the shared HTTP session
+            cdn_results = await asyncio.gather(*[
+                downloadSongsFromCdn(song_id=config["song_id"], download_dir=temp_dir)
+                for config in cdn_configs
+            ])
+
+            for config, cdn_result in zip(cdn_configs, cdn_results):
                 current_song_id = config["song_id"]
                 label = config["label"]
                 index_value = config["index"]
-                if not current_song_id:
-                    continue
-
-                cdn_result = await downloadSongsFromCdn(
-                    song_id=current_song_id,
-                    download_dir=temp_dir
-                )
 
                 if cdn_result.get("success"):
                     file_path = cdn_result.get("file_path")
@@ -506,7 +672,8 @@ async def download_both_songs(title: str, temp_dir: str, song_ids: list = None)
                         downloaded_songs.append({
                             "file_path": file_path,
                             "title": title,
-                            "song_id": current_song_id
+                            "song_id": current_song_id,
+                            "duration_seconds": cdn_result.get("duration_seconds")
                         })
                         existing_file_paths.add(file_path)
                         if os.path.exists(file_path):
@@ -588,6 +755,8 @@ async def download_both_songs(title: str, temp_dir: str, song_ids: list = None)
         if len(downloaded_songs) == 1:
             print("🎼 [DOWNLOAD] Warning: Only downloaded 1 of 2 songs")
 
+        await _record_progress_status([song.get("song_id") for song in downloaded_songs], ProgressStatus.DOWNLOADED)
+
         return {
             "success": True,
             "downloads": downloaded_songs,
@@ -602,8 +771,23 @@ async def download_both_songs(title: str, temp_dir: str, song_ids: list = None)
         }
 
 
+def _review_semaphore() -> asyncio.Semaphore:
+    """Process-wide cap on songs under review at once (REVIEW_MAX_CONCURRENCY), one per event loop."""
+    global _review_semaphore_state
+    loop = asyncio.get_running_loop()
+    if _review_semaphore_state is None or _review_semaphore_state[0] is not loop:
+        _review_semaphore_state = (loop, asyncio.Semaphore(max(1, REVIEW_MAX_CONCURRENCY)))
+    return _review_semaphore_state[1]
+
+
 async def review_all_songs(downloaded_songs: List[Dict], pg1_id: int) -> List[Dict[str, Any]]:
-    """Review all downloaded songs sequentially to respect API rate limits."""
+    """
+    Review all downloaded songs, returning results in input order.
+
+    With PROCESS_SEQUENTIALLY the songs are reviewed one after another; otherwise they
+    are reviewed concurrently, bounded by a semaphore shared with every other passage.
+    Gemini request rate is enforced separately by the shared token-bucket limiter.
+    """
     
     print(f"\n{'='*80}")
     print(f"🎵 [REVIEW-SESSION] Starting review session at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -699,50 +883,53 @@ async def review_all_songs(downloaded_songs: List[Dict], pg1_id: int) -> List[Di
     if not downloaded_songs:
         return []
 
-    # Process reviews sequentially to respect API rate limits
-    print("\n🎼 [REVIEW-QUEUE] Starting sequential processing...")
-    print(f"🎼 [REVIEW-QUEUE] Songs in queue: {[os.path.basename(s['file_path']) for s in downloaded_songs]}")
-    final_results = []
-    
-    for i, song in enumerate(downloaded_songs):
+    def review_error_result(song: Dict[str, Any], e: Exception) -> Dict[str, Any]:
+        error_msg = f"Exception during review for {song['file_path']}: {e}"
+        print("\n❌ [REVIEW-ERROR] Critical error occurred!")
+        print(f"❌ [REVIEW-ERROR] Song: {os.path.basename(song['file_path'])}")
+        print(f"❌ [REVIEW-ERROR] Error type: {type(e).__name__}")
+        print(f"❌ [REVIEW-ERROR] Error message: {str(e)}")
+        print("❌ [REVIEW-ERROR] Full traceback:")
+        print(traceback.format_exc())
+        return {
+            "file_path": song["file_path"],
+            "title": song["title"],
+            "song_id": song.get("song_id"),
+            "verdict": "error",
+            "review_details": {"error": error_msg}
+        }
+
+    async def review_with_progress(i: int, song: Dict[str, Any]) -> Dict[str, Any]:
         try:
             print(f"\n🔄 [REVIEW-PROGRESS] Processing song {i+1}/{len(downloaded_songs)}")
             print(f"🔄 [REVIEW-PROGRESS] Start time: {datetime.now().strftime('%H:%M:%S')}")
-            
+
             result = await review_single_song(song)
-            final_results.append(result)
-            
+
             print(f"✅ [REVIEW-PROGRESS] Song {i+1} complete. Verdict: {result.get('verdict', 'unknown')}")
-            
-            # Add delay between reviews if there are more to process
-            # This helps avoid hitting rate limits
-            if i < len(downloaded_songs) - 1:
-                try:
-                    from config.ai_review_config import DELAY_BETWEEN_SONGS
-                    wait_time = DELAY_BETWEEN_SONGS
-                except ImportError:
-                    wait_time = 10  # Fallback: Wait 10 seconds between songs (Gemini Flash)
-                print(f"\n⏳ [RATE-LIMIT] Waiting {wait_time} seconds before next review...")
-                print("⏳ [RATE-LIMIT] Reason: Respecting API rate limits (Free tier: 15 RPM for Gemini Flash)")
-                for remaining in range(wait_time, 0, -10):
-                    print(f"⏳ [RATE-LIMIT] Time remaining: {remaining} seconds...")
-                    await asyncio.sleep(min(10, remaining))
-                
+            return result
         except Exception as e:
-            error_msg = f"Exception during review for {song['file_path']}: {e}"
-            print("\n❌ [REVIEW-ERROR] Critical error occurred!")
-            print(f"❌ [REVIEW-ERROR] Song: {os.path.basename(song['file_path'])}")
-            print(f"❌ [REVIEW-ERROR] Error type: {type(e).__name__}")
-            print(f"❌ [REVIEW-ERROR] Error message: {str(e)}")
-            print("❌ [REVIEW-ERROR] Full traceback:")
-            print(traceback.format_exc())
-            final_results.append({
-                "file_path": song["file_path"],
-                "title": song["title"],
-                "song_id": song.get("song_id"),
-                "verdict": "error",
-                "review_details": {"error": error_msg}
-            })
+            return review_error_result(song, e)
+
+    print(f"🎼 [REVIEW-QUEUE] Songs in queue: {[os.path.basename(s['file_path']) for s in downloaded_songs]}")
+
+    if PROCESS_SEQUENTIALLY:
+        print("\n🎼 [REVIEW-QUEUE] Starting sequential processing...")
+        final_results = []
+        for i, song in enumerate(downloaded_songs):
+            final_results.append(await review_with_progress(i, song))
+    else:
+        print(f"\n🎼 [REVIEW-QUEUE] Starting concurrent processing (max {REVIEW_MAX_CONCURRENCY} songs at once)...")
+        semaphore = _review_semaphore()
+
+        async def review_bounded(i: int, song: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await review_with_progress(i, song)
+
+        # gather preserves input order regardless of completion order
+        final_results = list(await asyncio.gather(*[
+            review_bounded(i, song) for i, song in enumerate(downloaded_songs)
+        ]))
     
     print(f"\n{'='*80}")
     print(f"🎵 [REVIEW-SESSION] Review session completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -751,87 +938,17 @@ async def review_all_songs(downloaded_songs: List[Dict], pg1_id: int) -> List[Di
     print(f"🎵 [REVIEW-SESSION] Re-rolls needed: {sum(1 for r in final_results if r.get('verdict') == 're-roll')}")
     print(f"🎵 [REVIEW-SESSION] Errors: {sum(1 for r in final_results if r.get('verdict') == 'error')}")
     print(f"{'='*80}\n")
+
+    # Record each verdict on the song's progress row (one update per distinct verdict)
+    song_ids_by_status: Dict[int, List[Optional[str]]] = {}
+    for result in final_results:
+        song_ids_by_status.setdefault(ProgressStatus.from_verdict(result.get("verdict")), []).append(result.get("song_id"))
+    for status, status_song_ids in song_ids_by_status.items():
+        await _record_progress_status(status_song_ids, status, increment_reviews=True)
     
     return final_results
 
 
-async def upload_file_to_google_ai(file_path: str, api_key: str) -> Optional[Dict[str, Any]]:
-    """
-    Uploads a file to Google AI Files API using resumable upload protocol.
-
-    This function handles the entire upload process including:
-    1. Initializing the resumable upload session
-    2. Uploading the file content
-    3. Finalizing the upload
-
-    Args:
-        file_path (str): Absolute path to the file to upload
-        api_key (str): Google AI API key for authentication
-
-    Returns:
-        Optional[Dict[str, Any]]: Dictionary containing file metadata (name, uri, mimeType)
-        on success, None on failure
-    """
-    try:
-        import aiohttp
-        import os
-        
-        # Get file info
-        file_size = os.path.getsize(file_path)
-        file_name = os.path.basename(file_path)
-        
-        # Determine MIME type
-        mime_type = "audio/mpeg" if file_path.endswith(".mp3") else "audio/wav"
-        
-        async with aiohttp.ClientSession() as session:
-            # Step 1: Initialize resumable upload
-            init_url = f"https://generativelanguage.googleapis.com/upload/v1beta/files?key={api_key}"
-            init_headers = {
-                "X-Goog-Upload-Protocol": "resumable",
-                "X-Goog-Upload-Command": "start",
-                "X-Goog-Upload-Header-Content-Length": str(file_size),
-                "X-Goog-Upload-Header-Content-Type": mime_type,
-                "Content-Type": "application/json"
-            }
-            init_data = {
-                "file": {
-                    "display_name": file_name
-                }
-            }
-            
-            async with session.post(init_url, headers=init_headers, json=init_data) as resp:
-                if resp.status != 200:
-                    print(f"Failed to initialize upload: {resp.status}")
-                    return None
-                    
-                upload_url = resp.headers.get("X-Goog-Upload-URL")
-                if not upload_url:
-                    print("No upload URL received")
-                    return None
-            
-            # Step 2: Upload the file
-            upload_headers = {
-                "Content-Length": str(file_size),
-                "X-Goog-Upload-Offset": "0",
-                "X-Goog-Upload-Command": "upload, finalize"
-            }
-            
-            with open(file_path, "rb") as f:
-                file_data = f.read()
-                
-            async with session.put(upload_url, headers=upload_headers, data=file_data) as resp:
-                if resp.status != 200:
-                    print(f"Failed to upload file: {resp.status}")
-                    return None
-                    
-                result = await resp.json()
-                return result.get("file")
-                
-    except Exception as e:
-        print(f"Error uploading file to Google AI: {e}")
-        return None
-
-
 async def send_prompt_to_google_ai(
     prompt: str,
     file_uri: Optional[str] = None,
@@ -935,7 +1052,7 @@ async def review_song_with_ai(
         service = SupabaseService()
         try:
             print(f"Fetching song data for ID: {pg1_id}")
-            song_data = service.get_song_with_lyrics(pg1_id)
+            song_data = await service.get_song_with_lyrics_async(pg1_id)
             if not song_data or not song_data.get('lyrics'):
                 error_msg = f"No lyrics data found for pg1_id: {pg1_id}"
                 print(error_msg)
@@ -1019,19 +1136,6 @@ async def review_song_with_ai(
         mime_type = file_metadata.get("mimeType", "audio/mpeg")
         print(f"File uploaded successfully. URI: {file_uri[:30]}...")  # Truncate for security
         
-        # Add delay after upload to respect API rate limits
-        try:
-            from backend.config.ai_review_config import DELAY_BETWEEN_API_CALLS
-            wait_time = DELAY_BETWEEN_API_CALLS
-        except ImportError:
-            wait_time = 5  # Fallback: 5 seconds for Gemini Flash free tier
-        
-        print(f"⏳ [RATE-LIMIT] Waiting {wait_time} seconds after file upload...")
-        print("⏳ [RATE-LIMIT] Reason: Respecting API rate limits between upload and first prompt")
-        for remaining in range(wait_time, 0, -10):
-            print(f"⏳ [RATE-LIMIT] Time remaining: {remaining} seconds...")
-            await asyncio.sleep(min(10, remaining))
-        
         # First prompt - transcription and initial review
         first_prompt = """This is a song generated by AI and we need to check it's quality. The AI has a tendency of making a few common mistakes. Please write out the lyrics that you hear and note what is spoken and what is rapped, and what is sung. If the song is unclear or sounds messy and unmusical, the song needs to be deleted and remade. If it is more than 30% spoken it needs to be deleted and remade. If it cuts off abruptly and doesnt resolve naturally, it needs to be deleted and remade, and if the song feels like it ends, but then it picks back up again, it needs to be deleted and remade. Please write out the lyrics as requested and let me know if any red flags require the song to be deleted and remade. Don't attempt to recognize the lyrics source and infer what they should be, just write what you hear without inference or adjustment. If a word doesn't make sense, just spell it out phonetically. Add final verdict by ending with 'Final Verdict: [re-roll] or [continue]'"""
         
@@ -1053,19 +1157,6 @@ async def review_song_with_ai(
         
         print("First AI response received successfully")
         
-        # Add delay between first and second prompt to respect API rate limits
-        try:
-            from backend.config.ai_review_config import DELAY_BETWEEN_API_CALLS
-            wait_time = DELAY_BETWEEN_API_CALLS
-        except ImportError:
-            wait_time = 5  # Fallback: 5 seconds for Gemini Flash free tier
-        
-        print(f"⏳ [RATE-LIMIT] Waiting {wait_time} seconds before second prompt...")
-        print("⏳ [RATE-LIMIT] Reason: Respecting API rate limits between first and second prompt")
-        for remaining in range(wait_time, 0, -10):
-            print(f"⏳ [RATE-LIMIT] Time remaining: {remaining} seconds...")
-            await asyncio.sleep(min(10, remaining))
-        
         # Prepare conversation history for second prompt
         conversation_history = [
             {
@@ -1460,7 +1551,7 @@ async def handle_failsafe_songs(final_attempt_songs: List[Dict], final_dir: str
     error_count = 0
 
     # Use dedicated fail_safe directory instead of final_review
-    failsafe_dir = "backend/songs/fail_safe"
+    failsafe_dir = FAILSAFE_DIR
     os.makedirs(failsafe_dir, exist_ok=True)
 
     print(f"🛡️ [FAIL-SAFE] Processing {len(final_attempt_songs)} songs from final attempt")
@@ -13,13 +13,15 @@ import importlib.util
 import traceback
 import time
 from typing import Dict, Any, Union
-from camoufox import AsyncCamoufox
-from configs.browser_config import config
 from configs.suno_selectors import SunoSelectors
 
 # Add path for download module import
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 from utils.download_song_v2 import download_song_v2
+from utils.browser_pool import get_browser_pool
+from services.progress_repository import get_progress_repository
+from services.query_cache import get_structure_cache, structure_key
+from services.supabase_async import execute_async, run_blocking
 
 # TODO: Future Improvements
 # 1. Implement retry logic with exponential backoff for browser automation failures
@@ -165,29 +167,36 @@ async def generate_song(
     """
     from utils.converter import song_strcture_to_lyrics
 
-    song_structure_dict = (
-        supabase.table("song_structure_tbl")
-        .select("id, song_structure")
-        .eq("book_name", strBookName)
-        .eq("chapter", intBookChapter)
-        .eq("verse_range", strVerseRange)
-        .execute()
-    )
-
-    print(f"Database query result for {strBookName} {intBookChapter}:{strVerseRange}:")
-    print(
-        f"  Data count: {len(song_structure_dict.data) if song_structure_dict.data else 0}"
-    )
-    print(f"  Data: {song_structure_dict.data}")
+    structure_cache = get_structure_cache()
+    passage_key = structure_key(strBookName, intBookChapter, strVerseRange)
+    song_structure_row = structure_cache.get(passage_key)
+    if song_structure_row is None:
+        song_structure_dict = await execute_async(
+            supabase.table("song_structure_tbl")
+            .select("id, song_structure, tone, styles")
+            .eq("book_name", strBookName)
+            .eq("chapter", intBookChapter)
+            .eq("verse_range", strVerseRange)
+        )
 
-    # Check if data exists
-    if not song_structure_dict.data or len(song_structure_dict.data) == 0:
-        raise ValueError(
-            f"No song structure found for {strBookName} {intBookChapter}:{strVerseRange}"
+        print(f"Database query result for {strBookName} {intBookChapter}:{strVerseRange}:")
+        print(
+            f"  Data count: {len(song_structure_dict.data) if song_structure_dict.data else 0}"
         )
+        print(f"  Data: {song_structure_dict.data}")
+
+        # Check if data exists
+        if not song_structure_dict.data or len(song_structure_dict.data) == 0:
+            raise ValueError(
+                f"No song structure found for {strBookName} {intBookChapter}:{strVerseRange}"
+            )
+        song_structure_row = song_structure_dict.data[0]
+        structure_cache.set(passage_key, song_structure_row)
+    else:
+        print(f"Using cached song structure for {strBookName} {intBookChapter}:{strVerseRange}")
 
-    song_structure_id = song_structure_dict.data[0]["id"]
-    song_structure_json_string = song_structure_dict.data[0]["song_structure"]
+    song_structure_id = song_structure_row["id"]
+    song_structure_json_string = song_structure_row["song_structure"]
     print(f"  song_structure field value: {song_structure_json_string}")
     print(f"  song_structure type: {type(song_structure_json_string)}")
 
@@ -204,7 +213,9 @@ async def generate_song(
             f"Invalid JSON in song structure for {strBookName} {intBookChapter}:{strVerseRange}: {e}"
         )
 
-    song_structure_verses = song_strcture_to_lyrics(
+    # Verse lookups may hit the database, so run them off the event loop
+    song_structure_verses = await run_blocking(
+        song_strcture_to_lyrics,
         song_structure_id, parsed_song_structure, strBookName, intBookChapter, strStyle
     )
     print(f"Converted song structure verses: {song_structure_verses}")
@@ -237,16 +248,7 @@ async def generate_song(
         raise ValueError("Generated lyrics are empty. Cannot proceed.")
 
     try:
-        async with AsyncCamoufox(
-            headless=SunoSelectors.BROWSER_CONFIG["headless"],
-            persistent_context=SunoSelectors.BROWSER_CONFIG["persistent_context"],
-            user_data_dir=SunoSelectors.BROWSER_CONFIG["user_data_dir"],
-            os=SunoSelectors.BROWSER_CONFIG["os"],
-            config=config,
-            humanize=SunoSelectors.BROWSER_CONFIG["humanize"],
-            i_know_what_im_doing=SunoSelectors.BROWSER_CONFIG["i_know_what_im_doing"],
-        ) as browser:
-            page = await browser.new_page()
+        async with get_browser_pool().page() as page:
             print("[INFO] Navigating to suno.com...")
             await page.goto(SunoSelectors.CREATE_URL)
             print("[INFO] Waiting for page to load...")
@@ -580,82 +582,34 @@ async def generate_song(
                 # Suno creates 1-2 songs per request, we should save all created songs
                 print("[DATABASE] Attempting to save both songs to tblprogress_v1...")
                 
-                # Prepare data for both songs
-                songs_to_save = []
-                for idx, song_id in enumerate(song_ids):  # Process all extracted song IDs (1-2 songs)
+                # One progress row per Suno clip, upserted on (pg1_song_struct_id, pg1_song_id)
+                # If we only have one song ID (fallback case), still save it
+                songs_to_save = song_ids if song_ids else [suno_song_id]
+                for idx, song_id in enumerate(songs_to_save):  # Process all extracted song IDs (1-2 songs)
                     print(f"[DATABASE] Data to save for song {idx + 1}:")
                     print(f"  - pg1_song_struct_id: {song_structure_id}")
                     print(f"  - pg1_song_id: {song_id}")
                     print(f"  - pg1_style: {strStyle}")
                     print(f"  - pg1_lyrics length: {len(strLyrics) if strLyrics else 0} chars")
-                    
-                    songs_to_save.append({
-                        "pg1_song_struct_id": song_structure_id,
-                        "pg1_lyrics": strLyrics,
-                        "pg1_status": 0,
-                        "pg1_reviews": 0,
-                        "pg1_song_id": song_id,
-                        "pg1_style": strStyle,
-                    })
-                
-                # If we only have one song ID (fallback case), still save it
-                if not songs_to_save and suno_song_id:
-                    songs_to_save.append({
-                        "pg1_song_struct_id": song_structure_id,
-                        "pg1_lyrics": strLyrics,
-                        "pg1_status": 0,
-                        "pg1_reviews": 0,
-                        "pg1_song_id": suno_song_id,
-                        "pg1_style": strStyle,
-                    })
                 
                 try:
-                    # Insert all songs in a single batch operation
-                    response = (
-                        supabase.table("tblprogress_v1")
-                        .insert(songs_to_save)
-                        .execute()
+                    # Upsert all songs in a single batch operation
+                    saved_pg1_ids = await get_progress_repository().upsert_songs_async(
+                        song_structure_id, songs_to_save, strLyrics, strStyle
                     )
-                    
-                    # DEBUG: Log the full response structure
-                    print("[DATABASE] Full response from Supabase:")
-                    print("  - response.data: {}".format(response.data))
-                    print("  - response.data type: {}".format(type(response.data)))
-                    print(f"[DATABASE] Number of records inserted: {len(response.data) if response.data else 0}")
-                    
-                    # Store all pg1_ids from the response
-                    pg1_ids = []
-                    if response.data:
-                        print("[DATABASE] response.data exists, extracting pg1_ids...")
-                        for i, record in enumerate(response.data):
-                            print("[DATABASE] Record {}: {}".format(i + 1, record))
-                            
-                            # Try to get pg1_id from the response
-                            record_pg1_id = record.get('pg1_id')
-                            if record_pg1_id is None:
-                                # Try alternative column names
-                                record_pg1_id = record.get('id')
-                                if record_pg1_id:
-                                    print(f"[DATABASE] Found pg1_id under 'id' column for record {i + 1}: {record_pg1_id}")
-                            else:
-                                print(f"[DATABASE] Successfully extracted pg1_id for record {i + 1}: {record_pg1_id}")
-                            
-                            if record_pg1_id:
-                                pg1_ids.append(record_pg1_id)
-                        
+                    print(f"[DATABASE] Number of records saved: {len(saved_pg1_ids)}")
+
+                    pg1_ids = list(saved_pg1_ids.values())
+                    if pg1_ids:
                         # Use the first pg1_id for backward compatibility
-                        pg1_id = pg1_ids[0] if pg1_ids else None
-                        
-                        # Log all available keys for debugging
-                        if response.data:
-                            print(f"[DATABASE] Available keys in first record: {response.data[0].keys()}")
-                            print("[DATABASE] All pg1_ids saved: {}".format(pg1_ids))
+                        pg1_id = pg1_ids[0]
+                        print("[DATABASE] All pg1_ids saved: {}".format(saved_pg1_ids))
                     else:
-                        print("[DATABASE] WARNING: response.data is empty or None")
+                        print("[DATABASE] WARNING: no pg1_ids returned")
                         pg1_id = None
                         
                 except Exception as db_error:
-                    print(f"[DATABASE] ERROR saving to Supabase: {db_error}")
+                    print(f"[DATABASE] ERROR saving progress rows: {db_error}")
                     print(f"[DATABASE] Error type: {type(db_error).__name__}")
                     print("[DATABASE] Traceback: {}".format(traceback.format_exc()))
                     # Continue without pg1_id but log the issue
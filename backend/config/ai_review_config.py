@@ -4,6 +4,9 @@ This module contains configuration settings for the AI review system,
 including rate limiting and model selection options.
 """
 
+import os
+from pathlib import Path
+
 # Model Configuration
 # Switch between 'gemini-2.5-pro' and 'gemini-2.5-flash' based on your needs
 # Pro: More accurate but only 2 RPM on free tier
@@ -15,19 +18,15 @@ USE_FLASH_MODEL = True  # Set to True to use Flash model with higher rate limits
 if USE_FLASH_MODEL:
     # Gemini 2.5 Flash limits (free tier)
     REQUESTS_PER_MINUTE = 15
-    DELAY_BETWEEN_API_CALLS = 5  # seconds (60/15) - Used between upload, 1st prompt, 2nd prompt
-    DELAY_BETWEEN_SONGS = 10  # seconds - Used between different song reviews
 else:
     # Gemini 2.5 Pro limits (free tier) 
     REQUESTS_PER_MINUTE = 2
-    DELAY_BETWEEN_API_CALLS = 31  # seconds (60/2) - Used between upload, 1st prompt, 2nd prompt
-    DELAY_BETWEEN_SONGS = 31  # seconds - Used between different song reviews
     
 # Note: Each song review makes 3 API calls:
 # 1. Upload file to Google AI
 # 2. First prompt (transcription and initial review)
 # 3. Second prompt (lyrics comparison)
-# DELAY_BETWEEN_API_CALLS is applied after each of these to prevent quota errors
+# Each of these takes a token from the shared rate limiter (see RATE_LIMIT_* below)
 
 # Paid tier limits (if you upgrade)
 # Pro: 360 RPM, Flash: 1000 RPM
@@ -35,12 +34,27 @@ PAID_TIER = False
 if PAID_TIER:
     if USE_FLASH_MODEL:
         REQUESTS_PER_MINUTE = 1000
-        DELAY_BETWEEN_API_CALLS = 0.06  # seconds
-        DELAY_BETWEEN_SONGS = 0.15  # seconds
     else:
         REQUESTS_PER_MINUTE = 360
-        DELAY_BETWEEN_API_CALLS = 0.17  # seconds  
-        DELAY_BETWEEN_SONGS = 0.4  # seconds
+
+# Shared token-bucket limiter (middleware/rate_limiter.py)
+# Every Gemini prompt and file upload takes a token; the bucket refills at REQUESTS_PER_MINUTE.
+RATE_LIMIT_BURST = 3  # requests that may be sent back-to-back when the bucket is full
+RATE_LIMIT_MAX_RETRIES = 3  # retries for a call rejected with 429
+RATE_LIMIT_DEFAULT_BACKOFF_SECONDS = 30  # pause after a 429 without a retry-after hint
 
 # Processing mode
-PROCESS_SEQUENTIALLY = True  # Set to False to process in parallel (only with paid tier)
\ No newline at end of file
+PROCESS_SEQUENTIALLY = True  # Set to False to process in parallel (only with paid tier)
+# Concurrent mode: songs under review at once, across attempts and passages.
+# Gemini request rate is still capped by REQUESTS_PER_MINUTE through the shared limiter.
+REVIEW_MAX_CONCURRENCY = 4
+
+# Upload Cache
+# Google AI keeps uploaded files for 48 hours. Uploads are cached by the SHA-256 of the
+# audio so re-reviews (retries, fail-safe songs, debug runs) reuse the existing file URI.
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+UPLOAD_CACHE_DB_PATH = os.getenv("GEMINI_UPLOAD_CACHE_DB") or str(
+    BACKEND_ROOT / "data" / "gemini_uploads.db"
+)
+UPLOAD_CACHE_MIN_REMAINING_SECONDS = 3600  # re-upload when a cached file expires within this window
+UPLOAD_DEFAULT_TTL_HOURS = 48  # assumed lifetime when the API omits expirationTime
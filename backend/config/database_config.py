@@ -0,0 +1,35 @@
+"""Database Configuration
+
+This module contains configuration settings for the process-wide PostgreSQL
+connection pool used by SupabaseService. Values can be overridden through
+environment variables.
+"""
+
+import os
+
+# Connection Pool Configuration
+# Connections to the Supabase session pooler are reused across requests instead of
+# paying a TCP+TLS handshake per service instance. DB_POOL_MAX_SIZE also bounds the
+# worker threads that run blocking queries for async callers.
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE") or 1)
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE") or 5)
+DB_POOL_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT") or 30)
+
+# Connections idle for longer than this are checked with SELECT 1 before reuse
+DB_POOL_HEALTHCHECK_IDLE_SECONDS = float(os.getenv("DB_POOL_HEALTHCHECK_IDLE_SECONDS") or 30)
+
+# Hot queries are PREPAREd once per connection. Disable when connecting through a
+# transaction-mode pooler, which does not keep prepared statements between transactions.
+DB_USE_PREPARED_STATEMENTS = (os.getenv("DB_USE_PREPARED_STATEMENTS") or "true").lower() in ("1", "true", "yes")
+
+# supabase-py (PostgREST) calls are synchronous; async handlers run them on a bounded
+# thread pool of this size (services/supabase_async.py) instead of on the event loop.
+SUPABASE_MAX_CONCURRENCY = int(os.getenv("SUPABASE_MAX_CONCURRENCY") or 8)
+
+# Read-through caches (services/query_cache.py)
+# Song structures are effectively immutable once generated; writes invalidate them explicitly.
+STRUCTURE_CACHE_MAX_ENTRIES = int(os.getenv("STRUCTURE_CACHE_MAX_ENTRIES") or 1024)
+STRUCTURE_CACHE_TTL_SECONDS = float(os.getenv("STRUCTURE_CACHE_TTL_SECONDS") or 3600)
+# Progress rows (song + lyrics by pg1_id) are read once per reviewed song and rarely change
+PROGRESS_CACHE_MAX_ENTRIES = int(os.getenv("PROGRESS_CACHE_MAX_ENTRIES") or 512)
+PROGRESS_CACHE_TTL_SECONDS = float(os.getenv("PROGRESS_CACHE_TTL_SECONDS") or 300)
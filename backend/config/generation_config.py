@@ -0,0 +1,40 @@
+"""Generation Configuration
+
+This module contains configuration settings for verse-range and song structure
+generation. Values can be overridden through environment variables.
+"""
+
+import os
+from pathlib import Path
+
+# Verse Ranges
+# Chapters are split locally into near-equal contiguous ranges (utils/bible_utils.py).
+# Enable to ask Gemini for the split instead (one extra request per chapter); the local
+# split is still used when the model's answer is missing or does not cover the chapter.
+VERSE_RANGES_USE_LLM = (os.getenv("GENERATION_VERSE_RANGES_USE_LLM") or "false").lower() in ("1", "true", "yes")
+
+# Response Cache
+# Generation prompts are deterministic for a passage, so answers are kept in a SQLite
+# cache keyed by model, prompt hash and generation config (middleware/gemini_response_cache.py).
+# Regeneration requests bypass it explicitly.
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+RESPONSE_CACHE_ENABLED = (os.getenv("GENERATION_RESPONSE_CACHE") or "true").lower() in ("1", "true", "yes")
+RESPONSE_CACHE_DB_PATH = os.getenv("GENERATION_RESPONSE_CACHE_DB") or str(
+    BACKEND_ROOT / "data" / "llm_responses.db"
+)
+RESPONSE_CACHE_TTL_HOURS = float(os.getenv("GENERATION_RESPONSE_CACHE_TTL_HOURS") or 24 * 30)
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("GENERATION_RESPONSE_CACHE_MAX_ENTRIES") or 5000)
+
+# Song Structure
+# Structure and tone are requested together in one schema-constrained call
+# (utils/song_structure_schema.py); the separate structure and tone prompts are only
+# used when that reply fails validation. Disable to always use the separate prompts.
+STRUCTURE_COMBINED_CALL = (os.getenv("GENERATION_STRUCTURE_COMBINED_CALL") or "true").lower() in ("1", "true", "yes")
+
+# Book Batch
+# POST /api/v1/ai-generation/book-structures generates every missing passage of a book.
+# Passages in flight at once; the Gemini request rate is still capped by the shared
+# limiter (config/ai_review_config.py REQUESTS_PER_MINUTE).
+BOOK_BATCH_CONCURRENCY = int(os.getenv("GENERATION_BOOK_BATCH_CONCURRENCY") or 8)
+# Generated structures are written to song_structure_tbl in bulk every this many passages
+BOOK_BATCH_WRITE_SIZE = int(os.getenv("GENERATION_BOOK_BATCH_WRITE_SIZE") or 25)
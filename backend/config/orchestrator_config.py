@@ -0,0 +1,37 @@
+"""Orchestrator Configuration
+
+This module contains configuration settings for the orchestrator job queue
+and worker pool. Values can be overridden through environment variables.
+"""
+
+import os
+from pathlib import Path
+
+# Job Queue Configuration
+# Jobs are persisted in a local SQLite file so queued passages survive restarts.
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+JOB_DB_PATH = os.getenv("ORCHESTRATOR_JOB_DB") or str(
+    BACKEND_ROOT / "data" / "orchestrator_jobs.db"
+)
+
+# Worker Pool Configuration
+# Each worker drives one passage at a time through execute_song_workflow.
+# Keep this low unless the Suno account and Gemini quota can absorb the load.
+WORKER_COUNT = int(os.getenv("ORCHESTRATOR_WORKERS") or 1)
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("ORCHESTRATOR_POLL_INTERVAL") or 5)
+# A job interrupted by a shutdown or crash is re-queued until it has been claimed this
+# many times, then marked failed (each attempt may submit new Suno generations).
+JOB_MAX_ATTEMPTS = int(os.getenv("ORCHESTRATOR_JOB_MAX_ATTEMPTS") or 3)
+
+# Pipeline Mode
+# When enabled, queued passages flow through separate generation, download and
+# review stages so passage N+1 is generated while passage N downloads/reviews.
+# Generation and download handle one passage at a time; PIPELINE_MAX_IN_FLIGHT caps
+# how many passages are between stages at once (and replaces WORKER_COUNT).
+PIPELINE_MODE = (os.getenv("ORCHESTRATOR_PIPELINE_MODE") or "false").lower() in ("1", "true", "yes")
+PIPELINE_MAX_IN_FLIGHT = int(os.getenv("ORCHESTRATOR_PIPELINE_IN_FLIGHT") or 3)
+PIPELINE_STAGE_QUEUE_SIZE = int(os.getenv("ORCHESTRATOR_PIPELINE_QUEUE_SIZE") or 1)
+
+# Listing Configuration
+DEFAULT_JOB_LIST_LIMIT = 50
+MAX_JOB_LIST_LIMIT = 500
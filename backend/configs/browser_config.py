@@ -1,3 +1,5 @@
+import os
+
 config = {
     "window.outerHeight": 1056,
     "window.outerWidth": 1920,
@@ -17,3 +19,14 @@ config = {
     "navigator.productSub": "20030107",
     "navigator.maxTouchPoints": 10,
 }
+
+# Shared browser pool settings (see utils/browser_pool.py)
+# The browser is relaunched after serving this many pages, or when its process
+# tree grows above BROWSER_POOL_MAX_RSS_MB (requires psutil). 0 disables a limit.
+BROWSER_POOL_MAX_USES = int(os.getenv("BROWSER_POOL_MAX_USES") or 25)
+BROWSER_POOL_MAX_RSS_MB = int(os.getenv("BROWSER_POOL_MAX_RSS_MB") or 1500)
+BROWSER_POOL_PRELAUNCH = (os.getenv("BROWSER_POOL_PRELAUNCH") or "true").lower() in ("1", "true", "yes")
+# Song generation has always run in a visible browser (SunoSelectors.BROWSER_CONFIG), so the
+# shared browser stays headed by default; downloads and deletions, which were headless on their
+# own, now share that window. Set to true to run every pooled operation headless.
+BROWSER_POOL_HEADLESS = (os.getenv("BROWSER_POOL_HEADLESS") or "false").lower() in ("1", "true", "yes")
@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+import argparse
+from dotenv import load_dotenv
+
+# Add the parent directory to the Python path for module resolution
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from lib.supabase import get_db_connection
+from services.bulk_write import copy_rows
+from utils.verse_store import BIBLE_VERSES_DUMP_DIR, iter_dump_rows
+
+# Load environment variables from .env file
+load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
+
+TABLE_NAME = "bible_verses_tbl"
+
+
+def load_bible_verses(dump_dir=BIBLE_VERSES_DUMP_DIR, truncate=False):
+    """
+    Bulk-load the bundled bible_verses_tbl dumps with COPY in a single transaction.
+
+    The dumps are INSERT statements in table column order; their values are parsed
+    and streamed to COPY ... FROM STDIN instead of being replayed one by one.
+    """
+    conn = get_db_connection()
+    started = time.perf_counter()
+    try:
+        if truncate:
+            with conn.cursor() as cur:
+                print(f"Truncating {TABLE_NAME}...")
+                cur.execute(f"TRUNCATE {TABLE_NAME}")
+        print(f"Copying verses from {dump_dir} into {TABLE_NAME}...")
+        copied = copy_rows(conn, TABLE_NAME, iter_dump_rows(dump_dir))
+        conn.commit()
+        print(f"Loaded {copied:,} verses in {time.perf_counter() - started:.1f}s")
+    except Exception as e:
+        conn.rollback()
+        print(f"Loading verses failed: {e}")
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-load bible_verses_tbl from the bundled SQL dumps")
+    parser.add_argument("--dump-dir", default=BIBLE_VERSES_DUMP_DIR, help="Directory with output_part_*.txt dumps")
+    parser.add_argument("--truncate", action="store_true", help="Empty the table before loading")
+    args = parser.parse_args()
+    load_bible_verses(args.dump_dir, truncate=args.truncate)
+
+
+if __name__ == "__main__":
+    main()
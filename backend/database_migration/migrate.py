@@ -7,35 +7,108 @@ from dotenv import load_dotenv
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
-from lib.supabase import get_db_connection
-
 # Load environment variables from .env file
 load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
 
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "migrations")
+# Arbitrary key for pg_advisory_lock so concurrent runs apply migrations one at a time
+MIGRATION_LOCK_KEY = 7_340_001
 
-def migrate():
-    """Runs database migrations to create tables."""
-    conn = get_db_connection()
-    try:
-        tables_dir = os.path.join(os.path.dirname(__file__), "tables")
-        for filename in sorted(os.listdir(tables_dir)):
-            if filename.endswith(".py") and not filename.startswith("__"):
-                module_name = filename[:-3]
-                module_path = os.path.join(tables_dir, filename)
 
-                spec = importlib.util.spec_from_file_location(module_name, module_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
+def load_migrations(migrations_dir=MIGRATIONS_DIR):
+    """
+    Load migration modules in version order.
+
+    Each file in migrations/ defines VERSION, DESCRIPTION and upgrade(conn).
+    """
+    migrations = []
+    for filename in sorted(os.listdir(migrations_dir)):
+        if filename.endswith(".py") and not filename.startswith("__"):
+            module_path = os.path.join(migrations_dir, filename)
+            spec = importlib.util.spec_from_file_location(f"migration_{filename[:-3]}", module_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            migrations.append(module)
+
+    versions = [module.VERSION for module in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"Duplicate migration versions in {migrations_dir}: {versions}")
+    return sorted(migrations, key=lambda module: module.VERSION)
+
+
+def ensure_migrations_table(conn):
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version varchar primary key,
+                description text,
+                applied_at timestamptz default now()
+            );
+            """
+        )
+    conn.commit()
+
 
-                print(f"Creating table for {module.TABLE_NAME}...")
-                module.create_table(conn)
+def get_applied_versions(conn):
+    with conn.cursor() as cur:
+        cur.execute("SELECT version FROM schema_migrations")
+        return {row[0] for row in cur.fetchall()}
 
-        conn.commit()
-        print("Table creation completed successfully.")
+
+def apply_migrations(conn, migrations):
+    """
+    Apply pending migrations in order, each in its own transaction.
+
+    Returns:
+        list: Versions applied by this run
+    """
+    ensure_migrations_table(conn)
+    applied = get_applied_versions(conn)
+    newly_applied = []
+    for module in migrations:
+        if module.VERSION in applied:
+            continue
+        print(f"Applying migration {module.VERSION}: {module.DESCRIPTION}")
+        try:
+            module.upgrade(conn)
+            with conn.cursor() as cur:
+                cur.execute(
+                    "INSERT INTO schema_migrations (version, description) VALUES (%s, %s)",
+                    (module.VERSION, module.DESCRIPTION),
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        newly_applied.append(module.VERSION)
+    return newly_applied
+
+
+def migrate():
+    """Runs pending versioned database migrations."""
+    # Imported here so the runner functions above can be used without Supabase settings
+    from lib.supabase import get_db_connection
+
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_KEY,))
+        newly_applied = apply_migrations(conn, load_migrations())
+        if newly_applied:
+            print(f"Applied migrations: {', '.join(newly_applied)}")
+        else:
+            print("Database schema is up to date.")
     except Exception as e:
         conn.rollback()
-        print(f"Table creation failed: {e}")
+        print(f"Migration failed: {e}")
     finally:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_KEY,))
+            conn.commit()
+        except Exception:
+            pass
         conn.close()
 
 
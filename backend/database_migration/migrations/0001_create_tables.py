@@ -0,0 +1,21 @@
+"""Baseline: create every table defined in database_migration/tables/ (idempotent)."""
+
+import importlib.util
+import os
+
+VERSION = "0001"
+DESCRIPTION = "Create tables from database_migration/tables"
+
+TABLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tables")
+
+
+def upgrade(conn):
+    for filename in sorted(os.listdir(TABLES_DIR)):
+        if filename.endswith(".py") and not filename.startswith("__"):
+            module_path = os.path.join(TABLES_DIR, filename)
+            spec = importlib.util.spec_from_file_location(filename[:-3], module_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            print(f"Creating table for {module.TABLE_NAME}...")
+            module.create_table(conn)
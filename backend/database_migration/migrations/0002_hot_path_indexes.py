@@ -0,0 +1,32 @@
+"""Composite indexes for the lookups the API runs on every song and review."""
+
+VERSION = "0002"
+DESCRIPTION = "Add hot-path indexes on song structures, progress rows and verses"
+
+# (index name, table, column list)
+INDEXES = [
+    # generate_song / get_verse_ranges / generate_song_structure_handler look up by passage
+    ("idx_song_structure_passage", "song_structure_tbl", "book_name, chapter, verse_range"),
+    # progress rows of a structure, newest first
+    ("idx_progress_struct_created", "tblprogress_v1", "pg1_song_struct_id, pg1_created_at DESC"),
+    # progress row of a Suno song id
+    ("idx_progress_song_id", "tblprogress_v1", "pg1_song_id"),
+    # ranged verse fetch in utils/converter.py
+    ("idx_bible_verses_chapter", "bible_verses_tbl", "book, chapter, start_verse"),
+]
+
+
+def upgrade(conn):
+    with conn.cursor() as cur:
+        for index_name, table_name, columns in INDEXES:
+            cur.execute("SELECT to_regclass(%s)", (table_name,))
+            if cur.fetchone()[0] is None:
+                # Fail rather than record 0002 as applied without this index; the
+                # migration is retried on the next run once the table exists.
+                raise RuntimeError(
+                    f"Cannot create {index_name}: table {table_name} does not exist yet "
+                    f"(create or load it, then re-run the migrations)"
+                )
+            print(f"Creating index {index_name} on {table_name} ({columns})...")
+            cur.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({columns})")
+            cur.execute(f"ANALYZE {table_name}")
@@ -0,0 +1,43 @@
+"""One tblprogress_v1 row per (structure, Suno clip), enforced by a partial unique index."""
+
+VERSION = "0003"
+DESCRIPTION = "Deduplicate progress rows and add unique (pg1_song_struct_id, pg1_song_id)"
+
+
+def upgrade(conn):
+    with conn.cursor() as cur:
+        # Keep the newest row of each (structure, clip) pair
+        cur.execute(
+            """
+            DELETE FROM tblprogress_v1 older
+            USING tblprogress_v1 newer
+            WHERE older.pg1_song_id IS NOT NULL
+              AND older.pg1_song_struct_id = newer.pg1_song_struct_id
+              AND older.pg1_song_id = newer.pg1_song_id
+              AND older.pg1_id < newer.pg1_id
+            """
+        )
+        print(f"Removed {cur.rowcount} duplicate progress rows")
+
+        # Rows written before song creation (no clip id) are redundant once the
+        # structure has rows for its clips
+        cur.execute(
+            """
+            DELETE FROM tblprogress_v1 orphan
+            WHERE orphan.pg1_song_id IS NULL
+              AND EXISTS (
+                  SELECT 1 FROM tblprogress_v1 clip
+                  WHERE clip.pg1_song_struct_id = orphan.pg1_song_struct_id
+                    AND clip.pg1_song_id IS NOT NULL
+              )
+            """
+        )
+        print(f"Removed {cur.rowcount} orphan progress rows without a song id")
+
+        cur.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS uq_progress_struct_song
+            ON tblprogress_v1 (pg1_song_struct_id, pg1_song_id)
+            WHERE pg1_song_id IS NOT NULL
+            """
+        )
@@ -1,5 +1,7 @@
 from datetime import datetime
 
+from services.bulk_write import insert_rows
+
 
 def get_seeds(conn):
     with conn.cursor() as cur:
@@ -29,15 +31,23 @@ def get_seeds(conn):
     return seeds
 
 
+SEED_COLUMNS = (
+    "pg1_song_struct_id",
+    "pg1_style",
+    "pg1_lyrics",
+    "pg1_song_id",
+    "pg1_status",
+    "pg1_reviews",
+    "pg1_updated_at",
+)
+
+
 def insert_seeds(conn):
     seeds = get_seeds(conn)
-    with conn.cursor() as cur:
-        for seed in seeds:
-            cur.execute(
-                """
-                INSERT INTO tblprogress_v1 (pg1_song_struct_id, pg1_style, pg1_lyrics, pg1_song_id, pg1_status, pg1_reviews, pg1_updated_at)
-                VALUES (%(pg1_song_struct_id)s, %(pg1_style)s, %(pg1_lyrics)s, %(pg1_song_id)s, %(pg1_status)s, %(pg1_reviews)s, %(pg1_updated_at)s)
-            """,
-                seed,
-            )
+    insert_rows(
+        conn,
+        "tblprogress_v1",
+        SEED_COLUMNS,
+        [tuple(seed[column] for column in SEED_COLUMNS) for seed in seeds],
+    )
     conn.commit()
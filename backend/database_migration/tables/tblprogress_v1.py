@@ -5,7 +5,7 @@ def create_table(conn):
     with conn.cursor() as cur:
         cur.execute(
             f"""
-            CREATE TABLE {TABLE_NAME} (
+            CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
                 pg1_id bigserial primary key,
                 pg1_created_at timestamptz default now(),
                 pg1_song_struct_id bigint references song_structure_tbl(id),
@@ -12,41 +12,49 @@ key: str = os.getenv("SUPABASE_KEY")
 supabase: Client = create_client(url, key)
 
 
+def get_db_connection_kwargs() -> dict:
+    """
+    Session-pooler connection parameters from environment variables.
+
+    Raises:
+        RuntimeError: If any required variable is missing
+    """
+    # Load individual connection parameters from environment variables
+    required_vars = {
+        "USER": os.getenv("USER"),
+        "PASSWORD": os.getenv("PASSWORD"),
+        "HOST": os.getenv("HOST"),
+        "PORT": os.getenv("PORT"),
+        "DBNAME": os.getenv("DBNAME"),
+    }
+    missing_vars = [key for key, value in required_vars.items() if not value]
+    if missing_vars:
+        raise RuntimeError(
+            f"The following environment variables are not set: {', '.join(missing_vars)}"
+        )
+
+    return {
+        "dbname": required_vars["DBNAME"],
+        "user": required_vars["USER"],
+        "password": required_vars["PASSWORD"],
+        "host": required_vars["HOST"],
+        "port": required_vars["PORT"],
+    }
+
+
 def get_db_connection():
-    """Establishes a connection to the database using credentials from environment variables for the session pooler."""
-    try:
-        # Load individual connection parameters from environment variables
-        db_user = os.getenv("USER")
-        db_password = os.getenv("PASSWORD")
-        db_host = os.getenv("HOST")
-        db_port = os.getenv("PORT")
-        db_name = os.getenv("DBNAME")
-
-        # Check if all required environment variables are set
-        required_vars = {
-            "USER": db_user,
-            "PASSWORD": db_password,
-            "HOST": db_host,
-            "PORT": db_port,
-            "DBNAME": db_name,
-        }
-        missing_vars = [key for key, value in required_vars.items() if not value]
-
-        if missing_vars:
-            print(
-                f"Error: The following environment variables are not set: {', '.join(missing_vars)}"
-            )
-            sys.exit(1)
+    """Establishes a connection to the database using credentials from environment variables for the session pooler.
 
+    Intended for command-line scripts (migrations, seeders): exits the process on failure.
+    The API server uses the pool in services/db_pool.py instead.
+    """
+    try:
         # Establish the connection using the individual parameters
-        conn = psycopg2.connect(
-            dbname=db_name,
-            user=db_user,
-            password=db_password,
-            host=db_host,
-            port=db_port,
-        )
+        conn = psycopg2.connect(**get_db_connection_kwargs())
         return conn
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     except psycopg2.OperationalError as e:
         print(f"Database connection failed: {e}")
         sys.exit(1)
@@ -4,15 +4,43 @@ Module: main
 Purpose: Main FastAPI application setup, including routing, middleware, and API endpoints for song generation and related functionalities.
 """
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from api.song.routes import router as song_router
 from api.ai_review.routes import router as ai_review_router
 from api.ai_generation.routes import router as ai_generation_router
-from api.orchestrator.routes import router as orchestrator_router
+from api.orchestrator.routes import (
+    router as orchestrator_router,
+    start_job_workers,
+    stop_job_workers,
+)
 from routes.songs import router as songs_router
+from services.db_pool import close_db_pool
+from services.supabase_async import close_supabase_executor
+from services.supabase_service import DEFAULT_LIST_LIMIT, MAX_LIST_LIMIT, SupabaseService
+from utils.browser_pool import get_browser_pool
+from utils.http_session import close_http_session
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start application-scoped background services and stop them on shutdown."""
+    await get_browser_pool().start()
+    await start_job_workers()
+    try:
+        yield
+    finally:
+        await stop_job_workers()
+        await get_browser_pool().stop()
+        await close_http_session()
+        close_db_pool()
+        close_supabase_executor()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 
 # Define a specific list of allowed origins.
 # This should be managed via environment variables for different deployments.
@@ -66,7 +94,9 @@ async def login_endpoint():
     """
     from utils.suno_functions import login_suno
 
-    is_successful = await login_suno()
+    # Login opens its own browser on the same profile; keep the shared one closed meanwhile
+    async with get_browser_pool().exclusive():
+        is_successful = await login_suno()
     return {"success": is_successful}
 
 
@@ -83,8 +113,9 @@ async def login_with_microsoft_endpoint():
     """
     from lib.login import login_google, suno_login_microsoft
 
-    await login_google()
-    is_successful = await suno_login_microsoft()
+    async with get_browser_pool().exclusive():
+        await login_google()
+        is_successful = await suno_login_microsoft()
     return {"success": is_successful}
 
 
@@ -108,34 +139,51 @@ async def manual_login_endpoint():
     """
     from lib.login import manual_login_suno
 
-    is_successful = await manual_login_suno()
+    async with get_browser_pool().exclusive():
+        is_successful = await manual_login_suno()
     return {"success": is_successful, "method": "manual"}
 
 
 @app.get("/debug/song-structures")
-def debug_song_structures_endpoint():
+async def debug_song_structures_endpoint(
+    after_id: Optional[int] = None,
+    limit: int = Query(DEFAULT_LIST_LIMIT, ge=1, le=MAX_LIST_LIMIT),
+    columns: Optional[str] = None,
+    book_name: Optional[str] = None,
+    chapter: Optional[int] = None,
+    tone: Optional[int] = None,
+):
     """
-    Debug endpoint to retrieve and display song structures from the database.
+    Debug endpoint to page through song structures in the database.
 
-    This endpoint queries the 'song_structure_tbl' table in the Supabase database
-    and returns the found records. It includes error handling for database
-    retrieval issues.
+    Rows come back in id order, one page at a time: pass the returned
+    ``next_cursor`` as ``after_id`` to fetch the next page. Only the requested
+    ``columns`` (comma-separated; default id, book_name, chapter, verse_range)
+    are returned, and results can be filtered by book, chapter and tone.
 
     Returns:
         dict: A JSON response with the success status, a message indicating the
-              number of song structures found, and the data itself, or an error
+              number of song structures in this page, the data itself and the
+              cursor of the next page (null on the last page), or an error
               message if retrieval fails.
     """
-    """Debug endpoint to see what song structures are available in the database"""
     try:
-        from lib.supabase import supabase
-
-        result = supabase.table("song_structure_tbl").select("*").execute()
+        page = await SupabaseService().list_song_structures_async(
+            after_id=after_id,
+            limit=limit,
+            columns=[column.strip() for column in columns.split(",") if column.strip()] if columns else None,
+            book_name=book_name,
+            chapter=chapter,
+            tone=tone,
+        )
         return {
             "success": True,
-            "message": f"Found {len(result.data)} song structures",
-            "data": result.data,
+            "message": f"Found {len(page['items'])} song structures",
+            "data": page["items"],
+            "next_cursor": page["next_cursor"],
         }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         return {"error": str(e), "message": "Failed to retrieve song structures"}
 
@@ -99,7 +99,6 @@ a = Analysis(
         'python-dotenv',
         'pythonbible',
         'supabase',
-        'pandas',
         'psycopg2',
         'python-slugify',
         'google-adk',
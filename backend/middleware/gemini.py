@@ -2,6 +2,8 @@ import os
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+from middleware.rate_limiter import RateLimitedModel
+
 load_dotenv()
 
 api_key = os.getenv("GOOGLE_AI_API_KEY") or os.getenv("GEMINI_API_KEY")
@@ -10,5 +12,6 @@ if not api_key:
 
 genai.configure(api_key=api_key)
 
-model_pro = genai.GenerativeModel('gemini-2.5-pro')
-model_flash = genai.GenerativeModel('gemini-2.5-flash')
+# Both models share the process-wide token bucket (config/ai_review_config.REQUESTS_PER_MINUTE)
+model_pro = RateLimitedModel(genai.GenerativeModel('gemini-2.5-pro'))
+model_flash = RateLimitedModel(genai.GenerativeModel('gemini-2.5-flash'))
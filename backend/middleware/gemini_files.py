@@ -0,0 +1,305 @@
+"""
+System: Suno Automation
+Module: Gemini Files API
+File URL: backend/middleware/gemini_files.py
+Purpose: Upload audio to the Google AI Files API through the shared rate limiter and HTTP session,
+         reusing still-valid uploads from a persistent SHA-256 keyed cache.
+"""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Optional, Union
+
+import aiohttp
+
+from config.ai_review_config import (
+    UPLOAD_CACHE_DB_PATH,
+    UPLOAD_CACHE_MIN_REMAINING_SECONDS,
+    UPLOAD_DEFAULT_TTL_HOURS,
+)
+from middleware.rate_limiter import RateLimitExceeded, get_gemini_rate_limiter, retry_after_from_headers
+from utils.http_session import get_http_session
+
+GOOGLE_AI_UPLOAD_URL = "https://generativelanguage.googleapis.com/upload/v1beta/files"
+HASH_CHUNK_SIZE = 1024 * 1024
+# Uploads stream from disk in chunks over the shared keep-alive session and resume
+# from the offset the server confirms (X-Goog-Upload-Size-Received) after a failure.
+UPLOAD_CHUNK_SIZE = 256 * 1024
+UPLOAD_RESUME_ATTEMPTS = 3
+
+
+def _parse_expiration(value: Optional[str]) -> Optional[datetime]:
+    """Parse the API's RFC 3339 expirationTime (nanosecond precision, trailing Z)."""
+    if not value:
+        return None
+    try:
+        text = value.rstrip("Z")
+        if "." in text:
+            seconds, fraction = text.split(".", 1)
+            text = f"{seconds}.{fraction[:6]}"
+        return datetime.fromisoformat(text).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def file_sha256(file_path: str) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class UploadCache:
+    """Persistent map of audio SHA-256 -> Google AI file metadata, backed by SQLite."""
+
+    def __init__(self, db_path: str, min_remaining_seconds: float = UPLOAD_CACHE_MIN_REMAINING_SECONDS):
+        self.db_path = db_path
+        self.min_remaining_seconds = min_remaining_seconds
+        self._lock = threading.Lock()
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS gemini_uploads (
+                sha256 TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                uri TEXT NOT NULL,
+                mime_type TEXT NOT NULL,
+                expires_at TEXT NOT NULL,
+                uploaded_at TEXT NOT NULL
+            )
+            """
+        )
+
+    def get(self, sha256: str) -> Optional[Dict[str, Any]]:
+        """Return cached file metadata if it stays valid for at least min_remaining_seconds."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM gemini_uploads WHERE sha256 = ?", (sha256,)).fetchone()
+        if row is None:
+            return None
+        expires_at = _parse_expiration(row["expires_at"])
+        cutoff = datetime.now(timezone.utc) + timedelta(seconds=self.min_remaining_seconds)
+        if expires_at is None or expires_at <= cutoff:
+            self.delete(sha256)
+            return None
+        return {
+            "name": row["name"],
+            "uri": row["uri"],
+            "mimeType": row["mime_type"],
+            "expirationTime": row["expires_at"],
+        }
+
+    def put(self, sha256: str, file_metadata: Dict[str, Any], default_mime_type: str) -> None:
+        now = datetime.now(timezone.utc)
+        expires_at = _parse_expiration(file_metadata.get("expirationTime")) or (
+            now + timedelta(hours=UPLOAD_DEFAULT_TTL_HOURS)
+        )
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO gemini_uploads (sha256, name, uri, mime_type, expires_at, uploaded_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    sha256,
+                    file_metadata.get("name", ""),
+                    file_metadata["uri"],
+                    file_metadata.get("mimeType") or default_mime_type,
+                    expires_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+                    now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                ),
+            )
+
+    def delete(self, sha256: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM gemini_uploads WHERE sha256 = ?", (sha256,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_upload_cache: Optional[UploadCache] = None
+
+
+def get_upload_cache() -> UploadCache:
+    """Return the process-wide upload cache, creating it on first use."""
+    global _upload_cache
+    if _upload_cache is None:
+        _upload_cache = UploadCache(UPLOAD_CACHE_DB_PATH)
+    return _upload_cache
+
+
+class _RetriableUploadError(Exception):
+    """Server-side (5xx) failure while sending upload bytes; the upload can be resumed."""
+
+
+async def _read_file_chunks(file_path: str, offset: int, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield the file from ``offset`` in chunks so the upload never holds the whole file in memory."""
+    f = await asyncio.to_thread(open, file_path, "rb")
+    try:
+        f.seek(offset)
+        while True:
+            chunk = await asyncio.to_thread(f.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        f.close()
+
+
+async def _send_upload_bytes(
+    session: aiohttp.ClientSession,
+    upload_url: str,
+    file_path: str,
+    file_size: int,
+    offset: int,
+) -> Optional[Dict[str, Any]]:
+    """Stream the remainder of the file from ``offset`` and finalize the upload."""
+    upload_headers = {
+        "Content-Length": str(file_size - offset),
+        "X-Goog-Upload-Offset": str(offset),
+        "X-Goog-Upload-Command": "upload, finalize"
+    }
+
+    async with session.put(upload_url, headers=upload_headers, data=_read_file_chunks(file_path, offset)) as resp:
+        if resp.status == 429:
+            raise RateLimitExceeded("File upload rate limited (429)", retry_after_from_headers(resp.headers))
+        if resp.status >= 500:
+            raise _RetriableUploadError(f"Upload failed with HTTP {resp.status}")
+        if resp.status != 200:
+            print(f"Failed to upload file: {resp.status}")
+            return None
+
+        result = await resp.json()
+        return result.get("file")
+
+
+async def _query_upload_status(session: aiohttp.ClientSession, upload_url: str) -> Union[int, Dict[str, Any], None]:
+    """
+    Ask the upload session how many bytes it has persisted.
+
+    Returns the confirmed offset for an active session, the file metadata when the
+    session is already final, or None when the status cannot be determined.
+    """
+    try:
+        async with session.post(upload_url, headers={"X-Goog-Upload-Command": "query"}) as resp:
+            if resp.status != 200:
+                return None
+            upload_status = resp.headers.get("X-Goog-Upload-Status", "")
+            if upload_status == "final":
+                result = await resp.json(content_type=None)
+                return (result or {}).get("file")
+            size_received = resp.headers.get("X-Goog-Upload-Size-Received")
+            return int(size_received) if size_received is not None else None
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        return None
+
+
+async def _upload_file_once(file_path: str, api_key: str) -> Optional[Dict[str, Any]]:
+    """Resumable upload of one file; raises RateLimitExceeded on HTTP 429."""
+    # Get file info
+    file_size = os.path.getsize(file_path)
+    file_name = os.path.basename(file_path)
+
+    # Determine MIME type
+    mime_type = "audio/mpeg" if file_path.endswith(".mp3") else "audio/wav"
+
+    session = await get_http_session()
+
+    # Step 1: Initialize resumable upload
+    init_url = f"{GOOGLE_AI_UPLOAD_URL}?key={api_key}"
+    init_headers = {
+        "X-Goog-Upload-Protocol": "resumable",
+        "X-Goog-Upload-Command": "start",
+        "X-Goog-Upload-Header-Content-Length": str(file_size),
+        "X-Goog-Upload-Header-Content-Type": mime_type,
+        "Content-Type": "application/json"
+    }
+    init_data = {
+        "file": {
+            "display_name": file_name
+        }
+    }
+
+    async with session.post(init_url, headers=init_headers, json=init_data) as resp:
+        if resp.status == 429:
+            raise RateLimitExceeded("Upload initialization rate limited (429)", retry_after_from_headers(resp.headers))
+        if resp.status != 200:
+            print(f"Failed to initialize upload: {resp.status}")
+            return None
+
+        upload_url = resp.headers.get("X-Goog-Upload-URL")
+        if not upload_url:
+            print("No upload URL received")
+            return None
+
+    # Step 2: Stream the file, resuming from the server-confirmed offset after a failure
+    offset = 0
+    for attempt in range(UPLOAD_RESUME_ATTEMPTS + 1):
+        try:
+            return await _send_upload_bytes(session, upload_url, file_path, file_size, offset)
+        except (aiohttp.ClientError, asyncio.TimeoutError, _RetriableUploadError) as e:
+            if attempt >= UPLOAD_RESUME_ATTEMPTS:
+                raise
+            confirmed = await _query_upload_status(session, upload_url)
+            if confirmed is None:
+                raise
+            if isinstance(confirmed, dict):
+                # The server finalized the upload before the connection dropped
+                return confirmed
+            offset = confirmed
+            print(f"⬆️ [UPLOAD] {file_name} interrupted ({e!r}); resuming from byte {offset:,} of {file_size:,}")
+    return None
+
+
+async def upload_file_to_google_ai(file_path: str, api_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Uploads a file to Google AI Files API using resumable upload protocol.
+
+    This function handles the entire upload process including:
+    1. Initializing the resumable upload session
+    2. Streaming the file content from disk (resuming after interruptions)
+    3. Finalizing the upload
+
+    Files whose SHA-256 is in the upload cache with a URI that is still valid are
+    not uploaded again. Otherwise the upload takes a token from the shared Gemini
+    rate limiter, is retried after back-off when the API answers 429, and its
+    metadata is cached.
+
+    Args:
+        file_path (str): Absolute path to the file to upload
+        api_key (str): Google AI API key for authentication
+
+    Returns:
+        Optional[Dict[str, Any]]: Dictionary containing file metadata (name, uri, mimeType)
+        on success, None on failure
+
+    Raises:
+        None: Errors are caught and logged internally
+    """
+    try:
+        # Hashing and the SQLite cache are blocking file I/O; keep them off the event loop
+        sha256 = await asyncio.to_thread(file_sha256, file_path)
+        cache = await asyncio.to_thread(get_upload_cache)
+        cached = await asyncio.to_thread(cache.get, sha256)
+        if cached:
+            print(f"♻️ [UPLOAD-CACHE] Reusing {cached['name']} for {os.path.basename(file_path)}")
+            return cached
+
+        file_metadata = await get_gemini_rate_limiter().run(lambda: _upload_file_once(file_path, api_key))
+        if file_metadata and file_metadata.get("uri"):
+            mime_type = "audio/mpeg" if file_path.endswith(".mp3") else "audio/wav"
+            await asyncio.to_thread(cache.put, sha256, file_metadata, mime_type)
+        return file_metadata
+    except Exception as e:
+        print(f"Error uploading file to Google AI: {e}")
+        return None
@@ -0,0 +1,128 @@
+"""
+System: Suno Automation
+Module: LLM Response Cache
+File URL: backend/middleware/gemini_response_cache.py
+Purpose: Persistent prompt -> response cache for generation prompts, keyed by model, prompt hash
+         and generation config, with TTL expiry and least-recently-used eviction.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from config.generation_config import (
+    RESPONSE_CACHE_DB_PATH,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_TTL_HOURS,
+)
+
+
+def make_cache_key(model: str, prompt: str, generation_config: Optional[Any] = None) -> str:
+    """SHA-256 over the model name, the prompt and the (JSON-serialised) generation config."""
+    payload = json.dumps(
+        {"model": model, "prompt": prompt, "generation_config": generation_config},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """LLM responses backed by SQLite; entries expire after ttl_seconds and at most max_entries are kept."""
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_HOURS * 3600,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses (last_used_at)")
+
+    def get(self, cache_key: str) -> Optional[str]:
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_responses WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, created_at = row
+            if now - created_at >= self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (cache_key,))
+                return None
+            self._conn.execute("UPDATE llm_responses SET last_used_at = ? WHERE cache_key = ?", (now, cache_key))
+        return response
+
+    def put(self, cache_key: str, model: str, response: str) -> None:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_responses (cache_key, model, response, created_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (cache_key, model, response, now, now),
+            )
+            self._conn.execute(
+                """
+                DELETE FROM llm_responses WHERE cache_key IN (
+                    SELECT cache_key FROM llm_responses ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    async def get_async(self, cache_key: str) -> Optional[str]:
+        """get() in a worker thread, for callers on the event loop."""
+        return await asyncio.to_thread(self.get, cache_key)
+
+    async def put_async(self, cache_key: str, model: str, response: str) -> None:
+        """put() in a worker thread, for callers on the event loop."""
+        await asyncio.to_thread(self.put, cache_key, model, response)
+
+    def delete(self, cache_key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (cache_key,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, creating it on first use."""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache(RESPONSE_CACHE_DB_PATH)
+    return _response_cache
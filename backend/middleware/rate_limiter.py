@@ -0,0 +1,181 @@
+"""
+System: Suno Automation
+Module: Gemini Rate Limiter
+File URL: backend/middleware/rate_limiter.py
+Purpose: Process-wide async token bucket shared by every Gemini prompt and file upload,
+         with adaptive back-off when the API answers 429 or sends a retry-after hint.
+"""
+
+import asyncio
+import re
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from config.ai_review_config import (
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_DEFAULT_BACKOFF_SECONDS,
+    RATE_LIMIT_MAX_RETRIES,
+    REQUESTS_PER_MINUTE,
+)
+
+# Gemini 429 bodies carry either "retry_delay { seconds: 12 }" or "Please retry in 12.3s"
+_RETRY_HINT_PATTERNS = (
+    re.compile(r"retry_delay\s*\{\s*seconds:\s*(\d+(?:\.\d+)?)"),
+    re.compile(r"retry in\s*(\d+(?:\.\d+)?)\s*s", re.IGNORECASE),
+    re.compile(r"retryDelay\"?\s*:\s*\"?(\d+(?:\.\d+)?)s"),
+)
+
+
+class RateLimitExceeded(Exception):
+    """Raised by callers (e.g. raw HTTP uploads) that received a 429 response."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """True for 429 / RESOURCE_EXHAUSTED errors from the Gemini SDK or raw HTTP calls."""
+    if isinstance(exc, RateLimitExceeded):
+        return True
+    if getattr(exc, "code", None) == 429 or getattr(exc, "status", None) == 429:
+        return True
+    message = str(exc)
+    if re.search(r"\b429\b", message):
+        return True
+    return "RESOURCE_EXHAUSTED" in message or "Resource has been exhausted" in message
+
+
+def parse_retry_after(exc: BaseException) -> Optional[float]:
+    """Extract a retry-after hint (seconds) from an exception, if one is present."""
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        return float(retry_after)
+    message = str(exc)
+    for pattern in _RETRY_HINT_PATTERNS:
+        match = pattern.search(message)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+def retry_after_from_headers(headers: Any) -> Optional[float]:
+    """Numeric Retry-After header value in seconds, if present."""
+    value = headers.get("Retry-After") if headers else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class TokenBucketRateLimiter:
+    """
+    Async token bucket refilled at ``requests_per_minute / 60`` tokens per second.
+
+    A 429 pauses every caller until the retry-after hint (or a default back-off) has
+    passed and halves the refill rate; each successful call restores it gradually.
+    """
+
+    def __init__(self, requests_per_minute: float = REQUESTS_PER_MINUTE, burst: int = RATE_LIMIT_BURST):
+        self.requests_per_minute = float(requests_per_minute)
+        self.capacity = max(1, int(burst))
+        self._rate = self.requests_per_minute / 60.0
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        # Created per event loop on first acquire(): the limiter is a process-wide singleton
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def current_rpm(self) -> float:
+        return round(self._rate * 60.0, 2)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(float(self.capacity), self._tokens + elapsed * self._rate)
+            self._updated_at = now
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Return the FIFO lock, creating it for the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        # The lock keeps callers in FIFO order while one of them sleeps for the next token
+        async with self._get_lock():
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def report_success(self) -> None:
+        """Recover the refill rate after throttling, 10% per successful call."""
+        base_rate = self.requests_per_minute / 60.0
+        if self._rate < base_rate:
+            self._rate = min(base_rate, self._rate * 1.1)
+
+    def report_rate_limited(self, retry_after: Optional[float] = None) -> float:
+        """Pause all callers and halve the refill rate; returns the pause in seconds."""
+        delay = retry_after if retry_after and retry_after > 0 else RATE_LIMIT_DEFAULT_BACKOFF_SECONDS
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + delay)
+        self._rate = max(self._rate / 2, 1 / 60.0)
+        self._tokens = 0.0
+        self._updated_at = now
+        print(f"🚦 [RATE-LIMIT] 429 received: pausing {delay:.1f}s, rate now {self.current_rpm} RPM")
+        return delay
+
+    async def run(self, call: Callable[[], Awaitable[Any]], max_retries: int = RATE_LIMIT_MAX_RETRIES) -> Any:
+        """Acquire a token, run ``call`` and retry it after back-off when it is rate limited."""
+        attempt = 0
+        while True:
+            await self.acquire()
+            try:
+                result = await call()
+            except Exception as exc:
+                if not is_rate_limit_error(exc) or attempt >= max_retries:
+                    raise
+                attempt += 1
+                self.report_rate_limited(parse_retry_after(exc))
+                print(f"🚦 [RATE-LIMIT] Retrying rate-limited call ({attempt}/{max_retries})")
+                continue
+            self.report_success()
+            return result
+
+
+class RateLimitedModel:
+    """Proxy for a GenerativeModel whose async generation goes through the shared limiter."""
+
+    def __init__(self, model: Any, limiter: Optional[TokenBucketRateLimiter] = None):
+        self._model = model
+        self._limiter = limiter
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._model, name)
+
+    async def generate_content_async(self, *args: Any, **kwargs: Any) -> Any:
+        limiter = self._limiter or get_gemini_rate_limiter()
+        return await limiter.run(lambda: self._model.generate_content_async(*args, **kwargs))
+
+
+_gemini_rate_limiter: Optional[TokenBucketRateLimiter] = None
+
+
+def get_gemini_rate_limiter() -> TokenBucketRateLimiter:
+    """Return the process-wide Gemini limiter, creating it on first use."""
+    global _gemini_rate_limiter
+    if _gemini_rate_limiter is None:
+        _gemini_rate_limiter = TokenBucketRateLimiter()
+    return _gemini_rate_limiter
@@ -0,0 +1,88 @@
+"""
+System: Suno Automation
+Module: Bulk Writes
+File URL: backend/services/bulk_write.py
+Purpose: Send many rows to PostgreSQL in as few round-trips as possible: multi-row INSERTs
+         via execute_values, or COPY ... FROM STDIN for large loads. Callers own the transaction.
+"""
+
+import csv
+import io
+from typing import Any, Iterable, List, Optional, Sequence
+
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+
+# Rows per multi-row INSERT statement
+INSERT_PAGE_SIZE = 1000
+# Rows buffered in memory per COPY chunk
+COPY_BATCH_ROWS = 20000
+
+
+def insert_rows(
+    conn: Any,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    page_size: int = INSERT_PAGE_SIZE,
+) -> int:
+    """
+    Insert rows with multi-row INSERT statements (page_size rows per round-trip).
+
+    Returns:
+        int: Number of rows sent
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+    query = sql.SQL("INSERT INTO {table} ({columns}) VALUES %s").format(
+        table=sql.Identifier(table),
+        columns=sql.SQL(", ").join(sql.Identifier(column) for column in columns),
+    )
+    with conn.cursor() as cursor:
+        execute_values(cursor, query.as_string(cursor), rows, page_size=page_size)
+    return len(rows)
+
+
+def _csv_chunk(rows: List[Sequence[Any]]) -> io.StringIO:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    # COPY csv reads an unquoted empty field as NULL; None is written that way
+    writer.writerows(rows)
+    buffer.seek(0)
+    return buffer
+
+
+def copy_rows(
+    conn: Any,
+    table: str,
+    rows: Iterable[Sequence[Any]],
+    columns: Optional[Sequence[str]] = None,
+    batch_rows: int = COPY_BATCH_ROWS,
+) -> int:
+    """
+    Stream rows into a table with COPY ... FROM STDIN (CSV), batch_rows at a time.
+
+    Without ``columns`` the values are matched to the table's columns by position.
+
+    Returns:
+        int: Number of rows copied
+    """
+    target = sql.Identifier(table)
+    if columns:
+        target = sql.SQL("{} ({})").format(target, sql.SQL(", ").join(sql.Identifier(column) for column in columns))
+
+    copied = 0
+    with conn.cursor() as cursor:
+        statement = sql.SQL("COPY {} FROM STDIN WITH (FORMAT csv)").format(target).as_string(cursor)
+        batch: List[Sequence[Any]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_rows:
+                cursor.copy_expert(statement, _csv_chunk(batch))
+                copied += len(batch)
+                batch = []
+        if batch:
+            cursor.copy_expert(statement, _csv_chunk(batch))
+            copied += len(batch)
+    return copied
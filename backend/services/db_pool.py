@@ -0,0 +1,229 @@
+"""
+System: Suno Automation
+Module: Database Connection Pool
+File URL: backend/services/db_pool.py
+Purpose: Bounded, health-checked pool of psycopg2 connections shared by the whole process,
+         with per-connection prepared statements and an executor for async callers.
+"""
+
+import asyncio
+import functools
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import psycopg2
+
+from config.database_config import (
+    DB_POOL_ACQUIRE_TIMEOUT_SECONDS,
+    DB_POOL_HEALTHCHECK_IDLE_SECONDS,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_MIN_SIZE,
+    DB_USE_PREPARED_STATEMENTS,
+)
+
+_POSITIONAL_PARAM = re.compile(r"\$\d+")
+
+
+class DatabasePoolError(Exception):
+    """Raised when no database connection can be obtained from the pool."""
+
+
+def _connect_from_env():
+    """Open a new connection using the session-pooler credentials from the environment."""
+    from lib.supabase import get_db_connection_kwargs
+
+    return psycopg2.connect(**get_db_connection_kwargs())
+
+
+class DatabasePool:
+    """
+    Thread-safe LIFO pool of database connections.
+
+    At most ``max_size`` connections exist at once; callers block (up to
+    ``acquire_timeout`` seconds) when all of them are checked out. Connections
+    idle for longer than ``healthcheck_idle_seconds`` are probed before reuse and
+    broken ones are replaced transparently.
+    """
+
+    def __init__(
+        self,
+        connect: Optional[Callable[[], Any]] = None,
+        min_size: int = DB_POOL_MIN_SIZE,
+        max_size: int = DB_POOL_MAX_SIZE,
+        acquire_timeout: float = DB_POOL_ACQUIRE_TIMEOUT_SECONDS,
+        healthcheck_idle_seconds: float = DB_POOL_HEALTHCHECK_IDLE_SECONDS,
+        use_prepared_statements: bool = DB_USE_PREPARED_STATEMENTS,
+    ):
+        self._connect = connect or _connect_from_env
+        self.max_size = max(1, max_size)
+        self.min_size = max(0, min(min_size, self.max_size))
+        self.acquire_timeout = acquire_timeout
+        self.healthcheck_idle_seconds = healthcheck_idle_seconds
+        self.use_prepared_statements = use_prepared_statements
+        self._idle: List[Tuple[Any, float]] = []
+        self._prepared: Dict[int, Set[str]] = {}
+        self._open_count = 0
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"open": self._open_count, "idle": len(self._idle), "max_size": self.max_size}
+
+    def warm_up(self) -> None:
+        """Open min_size connections ahead of the first request."""
+        while True:
+            with self._lock:
+                if self._open_count >= self.min_size:
+                    return
+            if not self._slots.acquire(timeout=self.acquire_timeout):
+                return
+            try:
+                conn = self._new_connection()
+            except Exception:
+                self._slots.release()
+                raise
+            self._release(conn)
+
+    def _new_connection(self) -> Any:
+        conn = self._connect()
+        with self._lock:
+            self._open_count += 1
+            self._prepared[id(conn)] = set()
+        return conn
+
+    def _discard(self, conn: Any) -> None:
+        with self._lock:
+            self._open_count -= 1
+            self._prepared.pop(id(conn), None)
+        try:
+            if not conn.closed:
+                conn.close()
+        except Exception:
+            pass
+
+    def _is_healthy(self, conn: Any, last_used: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - last_used < self.healthcheck_idle_seconds:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception as e:
+            print(f"🗄️ [DB-POOL] Discarding unhealthy connection: {e}")
+            return False
+
+    def _checkout(self) -> Any:
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise DatabasePoolError(
+                f"Timed out after {self.acquire_timeout}s waiting for one of {self.max_size} database connections"
+            )
+        try:
+            while True:
+                with self._lock:
+                    idle = self._idle.pop() if self._idle else None
+                if idle is None:
+                    return self._new_connection()
+                conn, last_used = idle
+                if self._is_healthy(conn, last_used):
+                    return conn
+                self._discard(conn)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, conn: Any, broken: bool = False) -> None:
+        try:
+            if not broken and not conn.closed:
+                # End any read transaction so pooled connections never sit idle in transaction
+                conn.rollback()
+        except Exception:
+            broken = True
+        if broken or conn.closed:
+            self._discard(conn)
+        else:
+            with self._lock:
+                self._idle.append((conn, time.monotonic()))
+        self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrow a connection; it is rolled back and returned (or replaced if broken) afterwards."""
+        conn = self._checkout()
+        broken = False
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            raise
+        finally:
+            self._release(conn, broken=broken)
+
+    def execute_prepared(self, conn: Any, name: str, sql: str, params: Sequence[Any]) -> List[tuple]:
+        """
+        Run a hot query by name, PREPAREing it on first use of this connection.
+
+        ``sql`` uses PostgreSQL positional parameters ($1, $2, ...). When prepared
+        statements are disabled it is executed as a plain parameterised query.
+        """
+        with conn.cursor() as cursor:
+            if not self.use_prepared_statements:
+                cursor.execute(_POSITIONAL_PARAM.sub("%s", sql), tuple(params))
+                return cursor.fetchall()
+
+            prepared = self._prepared.setdefault(id(conn), set())
+            if name not in prepared:
+                cursor.execute(f"PREPARE {name} AS {sql}")
+                prepared.add(name)
+            placeholders = ", ".join(["%s"] * len(params))
+            cursor.execute(f"EXECUTE {name} ({placeholders})" if params else f"EXECUTE {name}", tuple(params))
+            return cursor.fetchall()
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking database call on the pool's executor without blocking the event loop."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_size, thread_name_prefix="db-pool")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def close(self) -> None:
+        """Close idle connections and stop the executor."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            executor, self._executor = self._executor, None
+        for conn, _ in idle:
+            self._discard(conn)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+_db_pool: Optional[DatabasePool] = None
+_db_pool_lock = threading.Lock()
+
+
+def get_db_pool() -> DatabasePool:
+    """Return the process-wide database pool, creating it on first use."""
+    global _db_pool
+    if _db_pool is None:
+        with _db_pool_lock:
+            if _db_pool is None:
+                _db_pool = DatabasePool()
+    return _db_pool
+
+
+def close_db_pool() -> None:
+    """Close the process-wide pool if it was created (called from the application lifespan)."""
+    global _db_pool
+    if _db_pool is not None:
+        _db_pool.close()
+        _db_pool = None
@@ -0,0 +1,135 @@
+"""
+System: Suno Automation
+Module: Progress Repository
+File URL: backend/services/progress_repository.py
+Purpose: Keep exactly one tblprogress_v1 row per Suno clip: upsert on (pg1_song_struct_id, pg1_song_id)
+         when songs are created and update their status in place through download, review and verdict.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from psycopg2.extras import execute_values
+
+from services.db_pool import DatabasePool, get_db_pool
+from services.query_cache import get_progress_cache
+
+
+class ProgressStatus:
+    """Values stored in tblprogress_v1.pg1_status."""
+
+    CREATED = 0
+    DOWNLOADED = 1
+    APPROVED = 2
+    REJECTED = 3
+    REVIEW_FAILED = 4
+
+    @classmethod
+    def from_verdict(cls, verdict: Optional[str]) -> int:
+        """Map an AI review verdict ('continue', 're-roll', 'error') to a status."""
+        if verdict == "continue":
+            return cls.APPROVED
+        if verdict == "re-roll":
+            return cls.REJECTED
+        return cls.REVIEW_FAILED
+
+
+# Matches the partial unique index added by migration 0003
+UPSERT_SONGS_SQL = """
+INSERT INTO tblprogress_v1 (pg1_song_struct_id, pg1_song_id, pg1_lyrics, pg1_style, pg1_status, pg1_reviews)
+VALUES %s
+ON CONFLICT (pg1_song_struct_id, pg1_song_id) WHERE pg1_song_id IS NOT NULL
+DO UPDATE SET
+    pg1_lyrics = EXCLUDED.pg1_lyrics,
+    pg1_style = EXCLUDED.pg1_style,
+    pg1_updated_at = now()
+RETURNING pg1_song_id, pg1_id
+"""
+
+UPDATE_STATUS_SQL = """
+UPDATE tblprogress_v1
+SET pg1_status = %s,
+    pg1_reviews = COALESCE(pg1_reviews, 0) + %s,
+    pg1_updated_at = now()
+WHERE pg1_song_id = ANY(%s)
+"""
+
+
+class ProgressRepository:
+    """Writes to tblprogress_v1 through the shared connection pool."""
+
+    def __init__(self, pool: Optional[DatabasePool] = None):
+        self.pool = pool or get_db_pool()
+
+    def upsert_songs(
+        self, song_struct_id: int, song_ids: Iterable[str], lyrics: str, style: str
+    ) -> Dict[str, int]:
+        """
+        Create (or refresh) one progress row per Suno clip of a generation.
+
+        Returns:
+            Dict[str, int]: Suno song id -> pg1_id, in the order the ids were given
+        """
+        unique_song_ids = list(dict.fromkeys(song_id for song_id in song_ids if song_id))
+        if not unique_song_ids:
+            return {}
+
+        rows = [
+            (song_struct_id, song_id, lyrics, style, ProgressStatus.CREATED, 0)
+            for song_id in unique_song_ids
+        ]
+        with self.pool.connection() as conn:
+            with conn.cursor() as cursor:
+                returned = execute_values(cursor, UPSERT_SONGS_SQL, rows, fetch=True)
+            conn.commit()
+
+        pg1_ids = {song_id: pg1_id for song_id, pg1_id in returned}
+        self._invalidate(unique_song_ids)
+        return {song_id: pg1_ids[song_id] for song_id in unique_song_ids if song_id in pg1_ids}
+
+    def update_status(self, song_ids: Iterable[str], status: int, increment_reviews: bool = False) -> int:
+        """Set the status of the rows of the given Suno clips; returns the number of rows updated."""
+        song_ids = list(dict.fromkeys(song_id for song_id in song_ids if song_id))
+        if not song_ids:
+            return 0
+
+        with self.pool.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(UPDATE_STATUS_SQL, (status, 1 if increment_reviews else 0, song_ids))
+                updated = cursor.rowcount
+            conn.commit()
+
+        self._invalidate(song_ids)
+        return updated
+
+    async def upsert_songs_async(
+        self, song_struct_id: int, song_ids: Iterable[str], lyrics: str, style: str
+    ) -> Dict[str, int]:
+        return await self.pool.run(self.upsert_songs, song_struct_id, list(song_ids), lyrics, style)
+
+    async def update_status_async(
+        self, song_ids: Iterable[str], status: int, increment_reviews: bool = False
+    ) -> int:
+        return await self.pool.run(self.update_status, list(song_ids), status, increment_reviews)
+
+    @staticmethod
+    def _invalidate(song_ids: List[str]) -> None:
+        """Drop cached get_song_with_lyrics results of the touched rows."""
+        touched = set(song_ids)
+        get_progress_cache().invalidate_where(
+            lambda _pg1_id, row: any(lyric.get("pg1_song_id") in touched for lyric in row.get("lyrics") or [])
+        )
+
+
+_progress_repository: Optional[ProgressRepository] = None
+_progress_repository_lock = threading.Lock()
+
+
+def get_progress_repository() -> ProgressRepository:
+    """Return the process-wide progress repository, creating it on first use."""
+    global _progress_repository
+    if _progress_repository is None:
+        with _progress_repository_lock:
+            if _progress_repository is None:
+                _progress_repository = ProgressRepository()
+    return _progress_repository
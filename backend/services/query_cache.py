@@ -0,0 +1,154 @@
+"""
+System: Suno Automation
+Module: Query Cache
+File URL: backend/services/query_cache.py
+Purpose: In-process read-through caches (TTL + size-bounded LRU) for song structure and
+         progress rows, with explicit invalidation from the code paths that write them.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from config.database_config import (
+    PROGRESS_CACHE_MAX_ENTRIES,
+    PROGRESS_CACHE_TTL_SECONDS,
+    STRUCTURE_CACHE_MAX_ENTRIES,
+    STRUCTURE_CACHE_TTL_SECONDS,
+)
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire ``ttl_seconds`` after being stored.
+
+    Values are deep-copied on the way in and out so callers can mutate what they
+    get back without corrupting the cache. ``None`` is never cached.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if value is None:
+            return
+        stored = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Optional[Any]:
+        """Return the cached value, or call ``loader`` and cache its (non-None) result."""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        value = loader()
+        self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """Drop every entry for which ``predicate(key, value)`` is true; returns how many."""
+        with self._lock:
+            doomed = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+            for key in doomed:
+                del self._entries[key]
+        return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def structure_key(book_name: str, chapter: int, verse_range: str) -> Tuple[str, str, int, str]:
+    """Cache key of a song_structure_tbl row looked up by passage."""
+    return ("passage", book_name, int(chapter), verse_range.strip())
+
+
+def verse_ranges_key(book_name: str, chapter: int) -> Tuple[str, str, int]:
+    """Cache key of the list of verse ranges stored for a chapter."""
+    return ("verse_ranges", book_name, int(chapter))
+
+
+def structure_id_key(structure_id: int) -> Tuple[str, int]:
+    """Cache key of a song_structure_tbl row looked up by id."""
+    return ("id", int(structure_id))
+
+
+def invalidate_passage(book_name: str, chapter: int, verse_range: Optional[str] = None) -> None:
+    """
+    Forget cached rows of a passage after a write to song_structure_tbl.
+
+    Without ``verse_range`` every cached row of the chapter is dropped.
+    """
+    cache = get_structure_cache()
+    cache.invalidate(verse_ranges_key(book_name, chapter))
+
+    def matches(key: Hashable, value: Any) -> bool:
+        if isinstance(key, tuple) and key[:3] == ("passage", book_name, int(chapter)):
+            return verse_range is None or key[3] == verse_range.strip()
+        return (
+            isinstance(value, dict)
+            and value.get("book_name") == book_name
+            and str(value.get("chapter")) == str(chapter)
+            and (verse_range is None or str(value.get("verse_range", "")).strip() == verse_range.strip())
+        )
+
+    cache.invalidate_where(matches)
+
+
+_structure_cache: Optional[TTLCache] = None
+_progress_cache: Optional[TTLCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_structure_cache() -> TTLCache:
+    """Return the process-wide song structure cache, creating it on first use."""
+    global _structure_cache
+    if _structure_cache is None:
+        with _cache_lock:
+            if _structure_cache is None:
+                _structure_cache = TTLCache(STRUCTURE_CACHE_MAX_ENTRIES, STRUCTURE_CACHE_TTL_SECONDS)
+    return _structure_cache
+
+
+def get_progress_cache() -> TTLCache:
+    """Return the process-wide cache of progress rows keyed by pg1_id, creating it on first use."""
+    global _progress_cache
+    if _progress_cache is None:
+        with _cache_lock:
+            if _progress_cache is None:
+                _progress_cache = TTLCache(PROGRESS_CACHE_MAX_ENTRIES, PROGRESS_CACHE_TTL_SECONDS)
+    return _progress_cache
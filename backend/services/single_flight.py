@@ -0,0 +1,71 @@
+"""
+System: Suno Automation
+Module: Single-Flight Requests
+File URL: backend/services/single_flight.py
+Purpose: Coalesce concurrent identical async computations (e.g. generating the same passage)
+         so callers with the same key await one in-flight call instead of repeating it.
+"""
+
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    """
+    Per-key deduplication of concurrent coroutine calls.
+
+    The first caller for a key starts the computation; callers arriving while it runs
+    await the same result (or exception). Nothing is cached once it completes. The
+    computation is shielded, so a cancelled caller does not cancel it for the others.
+    """
+
+    def __init__(self, name: str = "single-flight"):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._in_flight
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``factory()`` for ``key`` unless an identical call is already in flight.
+
+        Followers receive a deep copy of the leader's result so callers may mutate it.
+        """
+        existing = self._in_flight.get(key)
+        if existing is not None:
+            print(f"🔁 [{self.name.upper()}] Joining in-flight request {key}")
+            result = await asyncio.shield(existing)
+            return copy.deepcopy(result)
+
+        task = asyncio.ensure_future(factory())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda _: self._release(key, task))
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Retrieve the exception so an unobserved failure is not logged as never retrieved
+        if not task.cancelled():
+            task.exception()
+
+
+_flights: Optional[SingleFlight] = None
+_flights_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_generation_flights() -> SingleFlight:
+    """Single-flight group for AI generation and orchestrator runs, created for the running loop if needed."""
+    global _flights, _flights_loop
+    loop = asyncio.get_running_loop()
+    if _flights is None or _flights_loop is not loop:
+        _flights = SingleFlight("generation")
+        _flights_loop = loop
+    return _flights
+
+
+def passage_key(kind: str, book_name: str, chapter: int, verse_range: Optional[str] = None) -> tuple:
+    """Normalised (kind, book, chapter, verse_range) flight key."""
+    return (kind, book_name.strip(), int(chapter), verse_range.strip() if verse_range else None)
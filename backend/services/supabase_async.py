@@ -0,0 +1,73 @@
+"""
+System: Suno Automation
+Module: Async Supabase Access
+File URL: backend/services/supabase_async.py
+Purpose: Run synchronous supabase-py queries and other blocking database work from async code
+         on a bounded thread pool, so a slow PostgREST call never stalls the event loop.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from config.database_config import SUPABASE_MAX_CONCURRENCY
+
+# Rows per multi-row insert request
+SUPABASE_INSERT_CHUNK_SIZE = 500
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=SUPABASE_MAX_CONCURRENCY, thread_name_prefix="supabase"
+                )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking function that talks to the database on the bounded executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+
+
+async def execute_async(query: Any) -> Any:
+    """
+    Execute a supabase-py query builder without blocking the event loop.
+
+    Build the query as usual and pass it instead of calling ``.execute()``:
+        response = await execute_async(supabase.table("t").select("*").eq("id", 1))
+    """
+    return await run_blocking(query.execute)
+
+
+async def insert_many_async(
+    client: Any, table: str, records: List[Dict[str, Any]], chunk_size: int = SUPABASE_INSERT_CHUNK_SIZE
+) -> List[Dict[str, Any]]:
+    """
+    Insert records with one multi-row PostgREST request per chunk instead of one per row.
+
+    Returns:
+        List[Dict[str, Any]]: The inserted rows as returned by the API
+    """
+    inserted: List[Dict[str, Any]] = []
+    for start in range(0, len(records), chunk_size):
+        response = await execute_async(client.table(table).insert(records[start:start + chunk_size]))
+        inserted.extend(response.data or [])
+    return inserted
+
+
+def close_supabase_executor() -> None:
+    """Stop the executor (called from the application lifespan)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
@@ -1,24 +1,72 @@
 import sys
 import os
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
+
+from psycopg2 import sql
 
 # Add the parent directory to the path to import from lib
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from lib.supabase import get_db_connection
+from services.db_pool import DatabasePool, get_db_pool
+from services.query_cache import get_progress_cache, get_structure_cache, structure_id_key
+
+# Song structure listings
+LISTABLE_COLUMNS = ("id", "book_name", "chapter", "verse_range", "song_structure", "tone", "styles")
+DEFAULT_LIST_COLUMNS = ("id", "book_name", "chapter", "verse_range")
+DEFAULT_LIST_LIMIT = 50
+MAX_LIST_LIMIT = 500
+
+# Hot queries run as prepared statements on each pooled connection ($n parameters)
+SONG_STRUCTURE_BY_ID_SQL = """
+SELECT
+    id,
+    book_name,
+    chapter,
+    verse_range,
+    song_structure,
+    tone,
+    styles
+FROM song_structure_tbl
+WHERE id = $1
+"""
+
+SONG_WITH_LYRICS_SQL = """
+SELECT
+    s.id,
+    s.book_name,
+    s.chapter,
+    s.verse_range,
+    s.song_structure,
+    s.tone,
+    s.styles,
+    p.pg1_id,
+    p.pg1_created_at,
+    p.pg1_style,
+    p.pg1_lyrics,
+    p.pg1_song_id,
+    p.pg1_status,
+    p.pg1_reviews,
+    p.pg1_updated_at
+FROM tblprogress_v1 p
+LEFT JOIN song_structure_tbl s ON s.id = p.pg1_song_struct_id
+WHERE p.pg1_id = $1
+"""
 
 
 class SupabaseService:
-    """Service class for database operations with song_structure_tbl and tblprogress_v1"""
+    """Service class for database operations with song_structure_tbl and tblprogress_v1
 
-    def __init__(self):
-        self.connection = None
+    Connections are borrowed from the process-wide pool for each call and returned
+    afterwards, so creating a service is cheap. The ``*_async`` methods run the
+    blocking queries on the pool's executor for use inside async handlers.
+    Song structures and combined progress rows are read through the shared query
+    caches (services/query_cache.py).
+    """
 
-    def get_connection(self):
-        """Get database connection"""
-        if not self.connection or self.connection.closed:
-            self.connection = get_db_connection()
-        return self.connection
+    def __init__(self, pool: Optional[DatabasePool] = None):
+        self.pool = pool or get_db_pool()
+        self.structure_cache = get_structure_cache()
+        self.progress_cache = get_progress_cache()
 
     def get_song_structure_by_id(self, structure_id: int) -> Optional[Dict]:
         """
@@ -30,25 +78,17 @@ class SupabaseService:
         Returns:
             Optional[Dict]: Song structure data or None if not found
         """
+        return self.structure_cache.get_or_load(
+            structure_id_key(structure_id), lambda: self._query_song_structure_by_id(structure_id)
+        )
+
+    def _query_song_structure_by_id(self, structure_id: int) -> Optional[Dict]:
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            query = """
-            SELECT 
-                id,
-                book_name,
-                chapter,
-                verse_range,
-                song_structure,
-                tone,
-                styles
-            FROM song_structure_tbl 
-            WHERE id = %s
-            """
-            
-            cursor.execute(query, (structure_id,))
-            result = cursor.fetchone()
+            with self.pool.connection() as conn:
+                rows = self.pool.execute_prepared(
+                    conn, "song_structure_by_id", SONG_STRUCTURE_BY_ID_SQL, (structure_id,)
+                )
+            result = rows[0] if rows else None
             
             if result:
                 return {
@@ -65,9 +105,10 @@ class SupabaseService:
         except Exception as e:
             print(f"Error retrieving song structure by ID {structure_id}: {e}")
             return None
-        finally:
-            if cursor:
-                cursor.close()
+
+    async def get_song_structure_by_id_async(self, structure_id: int) -> Optional[Dict]:
+        """Non-blocking variant of get_song_structure_by_id"""
+        return await self.pool.run(self.get_song_structure_by_id, structure_id)
 
     def get_lyrics_by_song_struct_id(self, song_struct_id: int) -> List[Dict]:
         """
@@ -80,9 +121,6 @@ class SupabaseService:
             List[Dict]: List of lyrics data matching the song_struct_id
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
             query = """
             SELECT 
                 pg1_id,
@@ -99,8 +137,10 @@ class SupabaseService:
             ORDER BY pg1_created_at DESC
             """
             
-            cursor.execute(query, (song_struct_id,))
-            results = cursor.fetchall()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, (song_struct_id,))
+                    results = cursor.fetchall()
             
             lyrics_data = []
             for result in results:
@@ -121,9 +161,6 @@ class SupabaseService:
         except Exception as e:
             print(f"Error retrieving lyrics by song_struct_id {song_struct_id}: {e}")
             return []
-        finally:
-            if cursor:
-                cursor.close()
 
     def get_song_with_lyrics(self, pg1_id: int) -> Optional[Dict]:
         """
@@ -135,34 +172,13 @@ class SupabaseService:
         Returns:
             Optional[Dict]: Combined data with song structure and the specific lyric entry.
         """
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        return self.progress_cache.get_or_load(pg1_id, lambda: self._query_song_with_lyrics(pg1_id))
 
-            query = """
-            SELECT
-                s.id,
-                s.book_name,
-                s.chapter,
-                s.verse_range,
-                s.song_structure,
-                s.tone,
-                s.styles,
-                p.pg1_id,
-                p.pg1_created_at,
-                p.pg1_style,
-                p.pg1_lyrics,
-                p.pg1_song_id,
-                p.pg1_status,
-                p.pg1_reviews,
-                p.pg1_updated_at
-            FROM tblprogress_v1 p
-            LEFT JOIN song_structure_tbl s ON s.id = p.pg1_song_struct_id
-            WHERE p.pg1_id = %s
-            """
-            
-            cursor.execute(query, (pg1_id,))
-            result = cursor.fetchone()
+    def _query_song_with_lyrics(self, pg1_id: int) -> Optional[Dict]:
+        try:
+            with self.pool.connection() as conn:
+                rows = self.pool.execute_prepared(conn, "song_with_lyrics", SONG_WITH_LYRICS_SQL, (pg1_id,))
+            result = rows[0] if rows else None
 
             if not result:
                 print(f"No data found for pg1_id: {pg1_id}")
@@ -199,9 +215,10 @@ class SupabaseService:
         except Exception as e:
             print(f"Error retrieving combined song data for pg1_id {pg1_id}: {e}")
             return None
-        finally:
-            if cursor:
-                cursor.close()
+
+    async def get_song_with_lyrics_async(self, pg1_id: int) -> Optional[Dict]:
+        """Non-blocking variant of get_song_with_lyrics"""
+        return await self.pool.run(self.get_song_with_lyrics, pg1_id)
 
     def delete_song(self, song_structure_id: int) -> bool:
         """
@@ -216,80 +233,138 @@ class SupabaseService:
         # TODO: Consider adding transaction handling for atomic operations
         # TODO: Should we also delete from song_structure_tbl to avoid orphaned structures?
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
             query = "DELETE FROM tblprogress_v1 WHERE pg1_song_struct_id = %s"
-            cursor.execute(query, (song_structure_id,))
-            conn.commit()
-            return cursor.rowcount > 0
+            with self.pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, (song_structure_id,))
+                    deleted = cursor.rowcount > 0
+                conn.commit()
+            self.progress_cache.invalidate_where(
+                lambda _pg1_id, row: (row.get("song_structure") or {}).get("id") == song_structure_id
+            )
+            return deleted
         except Exception as e:
             print(f"Error deleting song with structure_id {song_structure_id}: {e}")
             return False
-        finally:
-            if cursor:
-                cursor.close()
 
-    def get_all_song_structures(self, limit: int = 100, offset: int = 0) -> List[Dict]:
+    async def delete_song_async(self, song_structure_id: int) -> bool:
+        """Non-blocking variant of delete_song"""
+        return await self.pool.run(self.delete_song, song_structure_id)
+
+    def list_song_structures(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = DEFAULT_LIST_LIMIT,
+        columns: Optional[Sequence[str]] = None,
+        book_name: Optional[str] = None,
+        chapter: Optional[int] = None,
+        tone: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
-        Retrieve all song structures with pagination
-        
+        List song structures in id order using keyset pagination.
+
+        Args:
+            after_id (Optional[int]): Cursor; only rows with a greater id are returned
+            limit (int): Page size, capped at MAX_LIST_LIMIT
+            columns (Optional[Sequence[str]]): Columns to return (subset of LISTABLE_COLUMNS);
+                defaults to DEFAULT_LIST_COLUMNS. ``id`` is always included.
+            book_name, chapter, tone: Optional equality filters
+
+        Returns:
+            Dict[str, Any]: {"items": [...], "next_cursor": id of the last row or None when exhausted}
+
+        Raises:
+            ValueError: If an unknown column is requested
+        """
+        requested = list(columns) if columns else list(DEFAULT_LIST_COLUMNS)
+        unknown = [column for column in requested if column not in LISTABLE_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown song structure columns: {', '.join(unknown)}")
+        selected = ["id"] + [column for column in dict.fromkeys(requested) if column != "id"]
+        limit = max(1, min(int(limit), MAX_LIST_LIMIT))
+
+        conditions = []
+        params: List[Any] = []
+        for column, value in (("id", after_id), ("book_name", book_name), ("chapter", chapter), ("tone", tone)):
+            if value is None:
+                continue
+            conditions.append(sql.SQL("{} > %s" if column == "id" else "{} = %s").format(sql.Identifier(column)))
+            params.append(value)
+
+        query = sql.SQL("SELECT {columns} FROM song_structure_tbl {where} ORDER BY id LIMIT %s").format(
+            columns=sql.SQL(", ").join(sql.Identifier(column) for column in selected),
+            where=sql.SQL("WHERE ") + sql.SQL(" AND ").join(conditions) if conditions else sql.SQL(""),
+        )
+        # One extra row tells whether another page exists
+        params.append(limit + 1)
+
+        with self.pool.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, params)
+                results = cursor.fetchall()
+
+        items = [dict(zip(selected, result)) for result in results[:limit]]
+        next_cursor = items[-1]["id"] if len(results) > limit else None
+        return {"items": items, "next_cursor": next_cursor}
+
+    async def list_song_structures_async(self, **kwargs: Any) -> Dict[str, Any]:
+        """Non-blocking variant of list_song_structures"""
+        return await self.pool.run(self.list_song_structures, **kwargs)
+
+    def get_all_song_structures(
+        self, limit: int = 100, offset: int = 0, after_id: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Retrieve song structures (all columns) in id order
+
+        Pages by id cursor, so ``limit`` may exceed MAX_LIST_LIMIT. ``offset`` is
+        kept for existing callers and runs the old LIMIT/OFFSET query; prefer ``after_id``.
+
         Args:
             limit (int): Maximum number of records to return
-            offset (int): Number of records to skip
-            
+            offset (int): Number of records to skip (ignored when after_id is given)
+            after_id (Optional[int]): Return rows with an id greater than this
+
         Returns:
             List[Dict]: List of song structure data
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            query = """
-            SELECT 
-                id,
-                book_name,
-                chapter,
-                verse_range,
-                song_structure,
-                tone,
-                styles
-            FROM song_structure_tbl 
-            ORDER BY id
-            LIMIT %s OFFSET %s
-            """
-            
-            cursor.execute(query, (limit, offset))
-            results = cursor.fetchall()
-            
-            structures = []
-            for result in results:
-                structures.append({
-                    'id': result[0],
-                    'book_name': result[1],
-                    'chapter': result[2],
-                    'verse_range': result[3],
-                    'song_structure': result[4],
-                    'tone': result[5],
-                    'styles': result[6]
-                })
-            
+            if offset and after_id is None:
+                return self._get_song_structures_by_offset(limit, offset)
+
+            structures: List[Dict] = []
+            cursor_id = after_id
+            while len(structures) < limit:
+                page = self.list_song_structures(
+                    after_id=cursor_id,
+                    limit=min(limit - len(structures), MAX_LIST_LIMIT),
+                    columns=LISTABLE_COLUMNS,
+                )
+                structures.extend(page["items"])
+                cursor_id = page["next_cursor"]
+                if cursor_id is None:
+                    break
             return structures
-            
         except Exception as e:
             print(f"Error retrieving all song structures: {e}")
             return []
-        finally:
-            if cursor:
-                cursor.close()
 
-    def close_connection(self):
-        """Close database connection"""
-        if self.connection and not self.connection.closed:
-            self.connection.close()
+    def _get_song_structures_by_offset(self, limit: int, offset: int) -> List[Dict]:
+        query = f"""
+        SELECT {", ".join(LISTABLE_COLUMNS)}
+        FROM song_structure_tbl
+        ORDER BY id
+        LIMIT %s OFFSET %s
+        """
+        with self.pool.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, (limit, offset))
+                results = cursor.fetchall()
+        return [dict(zip(LISTABLE_COLUMNS, result)) for result in results]
 
-    def __del__(self):
-        """Destructor to ensure connection is closed"""
-        self.close_connection()
+    def close_connection(self):
+        """Kept for callers of the pre-pool API: connections already return to the pool after each call"""
+        return None
 
 
 # Convenience functions for direct use
@@ -0,0 +1,106 @@
+"""
+System: Suno Automation
+Module: AI Generation Route Tests
+File URL: backend/tests/test_api/test_ai_generation.py
+Purpose: Validate that only usable Gemini replies are cached and that regeneration reaches the model.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+# The route module builds its Supabase client and configures Gemini on import; no request is sent
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")  # noqa: E402
+os.environ.setdefault("SUPABASE_KEY", "test-key")  # noqa: E402
+os.environ.setdefault("GEMINI_API_KEY", "test-key")  # noqa: E402
+
+from api.ai_generation import routes  # noqa: E402
+from middleware.gemini_response_cache import ResponseCache  # noqa: E402
+from services.query_cache import get_structure_cache, structure_key  # noqa: E402
+
+
+class FakeReply:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeModel:
+    """Answers with the queued replies in order and records every prompt."""
+
+    model_name = "fake-gemini"
+
+    def __init__(self, replies: List[str]):
+        self.replies = list(replies)
+        self.prompts: List[str] = []
+
+    async def generate_content_async(self, prompt: str, generation_config: Optional[dict] = None) -> FakeReply:
+        self.prompts.append(prompt)
+        return FakeReply(self.replies.pop(0))
+
+
+class FakeResponse:
+    def __init__(self, data: List[Dict[str, Any]]):
+        self.data = data
+
+
+VALID_COMBINED_REPLY = json.dumps(
+    {"sections": [{"section": "verse1", "verses": "1-5"}, {"section": "chorus", "verses": "6-10"}], "tone": 1}
+)
+
+
+@pytest.fixture
+def response_cache(monkeypatch, tmp_path: Path) -> ResponseCache:
+    cache = ResponseCache(str(tmp_path / "responses.db"))
+    monkeypatch.setattr(routes, "get_response_cache", lambda: cache)
+    monkeypatch.setattr(routes, "RESPONSE_CACHE_ENABLED", True)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_invalid_reply_is_not_replayed_on_retry(monkeypatch, response_cache: ResponseCache) -> None:
+    model = FakeModel(["not json", VALID_COMBINED_REPLY])
+    monkeypatch.setattr(routes, "model_flash", model)
+
+    first = await routes._generate_structure_and_tone("John", 3, "1-10")
+    retry = await routes._generate_structure_and_tone("John", 3, "1-10")
+    cached = await routes._generate_structure_and_tone("John", 3, "1-10")
+
+    assert first is None
+    assert retry == ({"verse1": "1-5", "chorus": "6-10"}, 1)
+    assert cached == retry
+    assert len(model.prompts) == 2
+
+
+@pytest.mark.asyncio
+async def test_regenerating_an_existing_row_calls_the_model(monkeypatch, response_cache: ResponseCache) -> None:
+    stored_row = {"id": 7, "song_structure": json.dumps({"verse1": "1-10"}), "tone": 0, "styles": None}
+    executed: List[Any] = []
+
+    async def fake_execute_async(query: Any) -> FakeResponse:
+        executed.append(query)
+        return FakeResponse([stored_row])
+
+    model = FakeModel([VALID_COMBINED_REPLY])
+    monkeypatch.setattr(routes, "model_flash", model)
+    monkeypatch.setattr(routes, "execute_async", fake_execute_async)
+    monkeypatch.setattr(routes, "STRUCTURE_COMBINED_CALL", True)
+    get_structure_cache().set(structure_key("John", 3, "1-10"), stored_row)
+
+    stored = await routes.generate_song_structure_handler("John", 3, "1-10")
+    assert stored == {"verse1": "1-10"}
+    assert model.prompts == []
+
+    regenerated = await routes.generate_song_structure_handler("John", 3, "1-10", structureId="7")
+    assert regenerated == {"verse1": "1-5", "chorus": "6-10"}
+    assert len(model.prompts) == 1
+    # Only the UPDATE of the new structure reaches the database
+    assert len(executed) == 1
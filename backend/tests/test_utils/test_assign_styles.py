@@ -0,0 +1,60 @@
+"""
+System: Suno Automation
+Module: Style Assignment Tests
+File URL: backend/tests/test_utils/test_assign_styles.py
+Purpose: Validate compiling the style map CSV into the lookup table and reloading it on change.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+from utils import assign_styles  # noqa: E402
+from utils.assign_styles import get_style_by_chapter, get_styles_for_book  # noqa: E402
+
+STYLE_MAP_CSV = (
+    'Positive Style,"Pop, Rock","Worship. Anthem.",Jazz\n'
+    'Negative Style,"Sad Folk","Lofi, Emo",Blues\n'
+    "Genesis,1,2,3\n"
+    ",4,,5\n"
+    "Exodus,,1,\n"
+)
+
+
+def test_chapters_map_to_their_column_style(tmp_path: Path, monkeypatch) -> None:
+    csv_path = tmp_path / "song_variation_map.csv"
+    csv_path.write_text(STYLE_MAP_CSV, encoding="utf-8")
+    monkeypatch.setattr(assign_styles, "STYLE_MAP_PATH", str(csv_path))
+
+    assert get_style_by_chapter("Genesis", 1, 1) == ["Pop", "Rock"]
+    assert get_style_by_chapter("Genesis", "4", 0) == ["Sad Folk"]
+    assert get_style_by_chapter("Genesis", 5, 1) == ["Jazz"]
+    assert get_style_by_chapter("Exodus", 1, 0) == ["Lofi", "Emo"]
+    assert get_style_by_chapter("Exodus", 2, 1) is None
+    assert get_style_by_chapter("Leviticus", 1, 1) is None
+    assert get_styles_for_book("Genesis", 1) == {
+        1: ["Pop", "Rock"], 2: ["Worship. Anthem."], 3: ["Jazz"], 4: ["Pop", "Rock"], 5: ["Jazz"]
+    }
+
+
+def test_table_is_recompiled_when_the_csv_changes(tmp_path: Path, monkeypatch) -> None:
+    csv_path = tmp_path / "song_variation_map.csv"
+    csv_path.write_text(STYLE_MAP_CSV, encoding="utf-8")
+    monkeypatch.setattr(assign_styles, "STYLE_MAP_PATH", str(csv_path))
+    assert get_style_by_chapter("Genesis", 1, 1) == ["Pop", "Rock"]
+
+    csv_path.write_text(STYLE_MAP_CSV.replace('"Pop, Rock"', "Gospel"), encoding="utf-8")
+    stat = os.stat(csv_path)
+    os.utime(csv_path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert get_style_by_chapter("Genesis", 1, 1) == ["Gospel"]
+
+
+def test_bundled_map_covers_genesis() -> None:
+    assert get_style_by_chapter("Genesis", 1, 1)
+    assert len(get_styles_for_book("Genesis", 0)) >= 48
@@ -0,0 +1,51 @@
+"""
+System: Suno Automation
+Module: Bible Utils Tests
+File URL: backend/tests/test_utils/test_bible_utils.py
+Purpose: Validate the deterministic verse-range split and the memoized verse counts.
+"""
+
+import sys
+from pathlib import Path
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+import pytest  # noqa: E402
+
+from utils.bible_utils import (  # noqa: E402
+    ChapterSplitError,
+    get_chapter_verse_count,
+    split_chapter_into_sections,
+    split_chapter_into_verse_ranges,
+)
+
+
+@pytest.mark.parametrize(
+    "book_name, chapter, expected",
+    [
+        ("1 John", "1", ["1-10"]),
+        ("Genesis", "1", ["1-11", "12-21", "22-31"]),
+        ("Psalms", "119", ["1-36", "37-71", "72-106", "107-141", "142-176"]),
+    ],
+)
+def test_ranges_are_contiguous_and_cover_the_chapter(book_name: str, chapter: str, expected: list) -> None:
+    assert split_chapter_into_verse_ranges(book_name, chapter) == expected
+    assert split_chapter_into_sections(book_name, chapter) == len(expected)
+
+
+def test_verse_counts_are_memoized() -> None:
+    get_chapter_verse_count.cache_clear()
+    split_chapter_into_verse_ranges("John", "3")
+    split_chapter_into_verse_ranges("John", "3")
+    info = get_chapter_verse_count.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_invalid_chapter_raises() -> None:
+    with pytest.raises(ChapterSplitError):
+        split_chapter_into_verse_ranges("John", "0")
+    with pytest.raises(ChapterSplitError):
+        split_chapter_into_verse_ranges("John", "99")
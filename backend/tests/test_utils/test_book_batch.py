@@ -0,0 +1,68 @@
+"""
+System: Suno Automation
+Module: Book Batch Tests
+File URL: backend/tests/test_utils/test_book_batch.py
+Purpose: Validate passage planning for book batches and the bounded concurrent runner.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+import pytest  # noqa: E402
+
+from utils.bible_utils import ChapterSplitError, split_chapter_into_verse_ranges  # noqa: E402
+from utils.book_batch import plan_book_passages, run_bounded  # noqa: E402
+
+
+def test_whole_book_is_split_locally() -> None:
+    pending, skipped = plan_book_passages("Ruth", [])
+    assert skipped == 0
+    assert {passage["chapter"] for passage in pending} == {1, 2, 3, 4}
+    assert [p["verse_range"] for p in pending if p["chapter"] == 1] == split_chapter_into_verse_ranges("Ruth", "1")
+    assert all(passage["id"] is None for passage in pending)
+
+
+def test_existing_rows_keep_their_ranges_and_structures_are_skipped() -> None:
+    rows = [
+        {"id": 1, "chapter": 2, "verse_range": "1-10", "song_structure": '{"verse1": "1-5"}'},
+        {"id": 2, "chapter": 2, "verse_range": "11-23", "song_structure": None},
+    ]
+    pending, skipped = plan_book_passages("Ruth", rows, chapters=[2, 3])
+    assert skipped == 1
+    assert pending[0] == {"id": 2, "chapter": 2, "verse_range": "11-23"}
+    assert all(passage["chapter"] == 3 and passage["id"] is None for passage in pending[1:])
+
+
+def test_unknown_book_raises() -> None:
+    with pytest.raises(ChapterSplitError):
+        plan_book_passages("Not A Book", [])
+
+
+async def test_run_bounded_limits_concurrency_and_reports_errors() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def worker(item: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if item == 3:
+            raise ValueError("boom")
+        return item * 2
+
+    results = [result async for result in run_bounded(range(10), worker, concurrency=3)]
+
+    assert peak == 3
+    assert len(results) == 10
+    assert {item: value for item, value, error in results if error is None} == {
+        item: item * 2 for item in range(10) if item != 3
+    }
+    assert [str(error) for item, _, error in results if error is not None] == ["boom"]
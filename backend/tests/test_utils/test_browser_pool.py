@@ -0,0 +1,124 @@
+"""
+System: Suno Automation
+Module: Browser Pool Tests
+File URL: backend/tests/test_utils/test_browser_pool.py
+Purpose: Validate browser reuse, use-count recycling, and unhealthy-browser relaunch.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+from utils import browser_pool  # noqa: E402
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, fail_first_page: bool = False) -> None:
+        self.fail_first_page = fail_first_page
+
+    async def new_page(self) -> FakePage:
+        if self.fail_first_page:
+            self.fail_first_page = False
+            raise RuntimeError("Target closed")
+        return FakePage()
+
+
+class FakeCamoufox:
+    launches: List["FakeCamoufox"] = []
+    fail_next_context = False
+
+    def __init__(self, **kwargs) -> None:
+        self.exited = False
+        FakeCamoufox.launches.append(self)
+
+    async def __aenter__(self) -> FakeContext:
+        fail = FakeCamoufox.fail_next_context
+        FakeCamoufox.fail_next_context = False
+        return FakeContext(fail_first_page=fail)
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.exited = True
+
+
+@pytest.fixture(autouse=True)
+def fake_camoufox(monkeypatch):
+    FakeCamoufox.launches = []
+    FakeCamoufox.fail_next_context = False
+    monkeypatch.setattr(browser_pool, "AsyncCamoufox", FakeCamoufox)
+    monkeypatch.setattr(browser_pool, "_browser_rss_mb", lambda: None)
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_browser_and_recycles_after_max_uses() -> None:
+    pool = browser_pool.CamoufoxBrowserPool(launch_options={}, max_uses=2, max_rss_mb=0)
+
+    leased = []
+    for _ in range(3):
+        async with pool.page() as page:
+            leased.append(page)
+
+    assert all(page.is_closed() for page in leased)
+    assert len(FakeCamoufox.launches) == 2
+    assert FakeCamoufox.launches[0].exited is True
+
+    await pool.stop()
+    assert FakeCamoufox.launches[1].exited is True
+    assert pool.is_running is False
+
+
+@pytest.mark.asyncio
+async def test_pool_relaunches_unhealthy_browser() -> None:
+    FakeCamoufox.fail_next_context = True
+    pool = browser_pool.CamoufoxBrowserPool(launch_options={}, max_uses=0, max_rss_mb=0)
+
+    async with pool.page() as page:
+        assert page.is_closed() is False
+
+    assert len(FakeCamoufox.launches) == 2
+    assert pool.stats()["active_pages"] == 0
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_exclusive_blocks_new_leases_until_released() -> None:
+    pool = browser_pool.CamoufoxBrowserPool(launch_options={}, max_uses=0, max_rss_mb=0)
+    async with pool.page():
+        pass
+    assert pool.is_running
+
+    async def lease() -> None:
+        async with pool.page():
+            pass
+
+    async with pool.exclusive():
+        assert not pool.is_running
+        waiting = asyncio.ensure_future(lease())
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        assert len(FakeCamoufox.launches) == 1
+
+    await asyncio.wait_for(waiting, timeout=1)
+    assert len(FakeCamoufox.launches) == 2
+
+
+def test_pooled_browser_launches_headed_by_default() -> None:
+    assert browser_pool.build_launch_options()["headless"] is False
@@ -0,0 +1,111 @@
+"""
+System: Suno Automation
+Module: Converter Tests
+File URL: backend/tests/test_utils/test_converter.py
+Purpose: Validate section verse parsing and the single ranged verse query behind song_strcture_to_lyrics.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+import pytest  # noqa: E402
+
+from utils import converter  # noqa: E402
+
+
+class FakeQuery:
+    def __init__(self, client: "FakeSupabase"):
+        self.client = client
+        self.filters: List[tuple] = []
+
+    def select(self, columns: str) -> "FakeQuery":
+        return self
+
+    def eq(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append(("eq", column, value))
+        return self
+
+    def gte(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append(("gte", column, value))
+        return self
+
+    def lte(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append(("lte", column, value))
+        return self
+
+    def execute(self):
+        self.client.queries.append(self.filters)
+        low = next(value for op, _, value in self.filters if op == "gte")
+        high = next(value for op, _, value in self.filters if op == "lte")
+        rows = [{"start_verse": verse, "verse_text": f"text {verse}"} for verse in self.client.verses if low <= verse <= high]
+        return type("Response", (), {"data": rows})()
+
+
+class FakeSupabase:
+    def __init__(self, verses):
+        self.verses = list(verses)
+        self.queries: List[List[tuple]] = []
+
+    def table(self, name: str) -> FakeQuery:
+        assert name == "bible_verses_tbl"
+        return FakeQuery(self)
+
+
+@pytest.fixture
+def fake_supabase(monkeypatch) -> FakeSupabase:
+    client = FakeSupabase(range(1, 12))
+    monkeypatch.setattr(converter, "_get_supabase", lambda: client)
+    monkeypatch.setattr(converter, "get_verse_store", lambda: None)
+    return client
+
+
+@pytest.mark.parametrize(
+    "reference, expected",
+    [
+        ("3-5", [3, 4, 5]),
+        (" 3 - 5 ", [3, 4, 5]),
+        ("7", [7]),
+        ("Exodus 2:3-4", [3, 4]),
+        ("Exodus 2:9", [9]),
+        ("5-3", []),
+        ("1-2-3", []),
+        ("three", []),
+    ],
+)
+def test_section_references_parse_to_verse_numbers(reference: str, expected: List[int]) -> None:
+    assert converter.parse_section_verse_numbers("verse1", reference, "Exodus", 2) == expected
+
+
+def test_non_string_reference_is_skipped() -> None:
+    assert converter.parse_section_verse_numbers("verse1", 5, "Exodus", 2) is None
+
+
+def test_lyrics_use_one_ranged_query(fake_supabase: FakeSupabase) -> None:
+    structure: Dict[str, Any] = {
+        "verse1": "Exodus 2:2-3",
+        "chorus": "5",
+        "intro": "1",  # not a lyric section
+        "bridge": ["7"],  # not a string: skipped
+        "outro": "9-10",
+    }
+    lyrics = converter.song_strcture_to_lyrics(1, structure, "Exodus", 2, "Pop")
+
+    assert lyrics == {
+        "verse1": {"2": "text 2", "3": "text 3"},
+        "chorus": {"5": "text 5"},
+        "outro": {"9": "text 9", "10": "text 10"},
+    }
+    assert len(fake_supabase.queries) == 1
+    assert ("gte", "start_verse", 2) in fake_supabase.queries[0]
+    assert ("lte", "start_verse", 10) in fake_supabase.queries[0]
+
+
+def test_missing_verses_are_empty(fake_supabase: FakeSupabase) -> None:
+    lyrics = converter.song_strcture_to_lyrics(1, {"verse1": "10-12"}, "Exodus", 2, "Pop")
+    assert lyrics == {"verse1": {"10": "text 10", "11": "text 11", "12": ""}}
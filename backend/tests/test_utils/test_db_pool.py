@@ -0,0 +1,125 @@
+"""
+System: Suno Automation
+Module: Database Pool Tests
+File URL: backend/tests/test_utils/test_db_pool.py
+Purpose: Validate connection reuse, the size bound, broken-connection replacement and prepared statements.
+"""
+
+import sys
+import threading
+from pathlib import Path
+from typing import List
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+import psycopg2  # noqa: E402
+import pytest  # noqa: E402
+
+from services.db_pool import DatabasePool, DatabasePoolError  # noqa: E402
+
+
+class FakeCursor:
+    def __init__(self, conn: "FakeConnection"):
+        self.conn = conn
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def execute(self, sql: str, params=None) -> None:
+        if self.conn.fail_next:
+            self.conn.fail_next = False
+            self.conn.closed = 1
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        self.conn.statements.append(sql)
+
+    def fetchall(self) -> List[tuple]:
+        return [(1,)]
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.fail_next = False
+        self.statements: List[str] = []
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def rollback(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.closed = 1
+
+
+def make_pool(**kwargs):
+    opened: List[FakeConnection] = []
+
+    def connect() -> FakeConnection:
+        conn = FakeConnection()
+        opened.append(conn)
+        return conn
+
+    return DatabasePool(connect=connect, **kwargs), opened
+
+
+def test_connections_are_reused() -> None:
+    pool, opened = make_pool(max_size=2)
+    for _ in range(5):
+        with pool.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+    assert len(opened) == 1
+    assert pool.stats() == {"open": 1, "idle": 1, "max_size": 2}
+
+
+def test_checkout_times_out_when_exhausted() -> None:
+    pool, _ = make_pool(max_size=1, acquire_timeout=0.05)
+    with pool.connection():
+        with pytest.raises(DatabasePoolError):
+            with pool.connection():
+                pass
+
+
+def test_broken_connection_is_replaced() -> None:
+    pool, opened = make_pool(max_size=1)
+    with pytest.raises(psycopg2.OperationalError):
+        with pool.connection() as conn:
+            conn.fail_next = True
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+    assert pool.stats()["open"] == 0
+
+    with pool.connection() as conn:
+        assert conn is opened[1]
+        assert not conn.closed
+
+
+def test_prepares_once_per_connection() -> None:
+    pool, _ = make_pool(max_size=1)
+    sql = "SELECT * FROM song_structure_tbl WHERE id = $1"
+    for _ in range(3):
+        with pool.connection() as conn:
+            assert pool.execute_prepared(conn, "by_id", sql, (7,)) == [(1,)]
+    assert conn.statements.count(f"PREPARE by_id AS {sql}") == 1
+    assert conn.statements.count("EXECUTE by_id (%s)") == 3
+
+
+def test_plain_query_when_prepared_statements_disabled() -> None:
+    pool, _ = make_pool(use_prepared_statements=False)
+    with pool.connection() as conn:
+        pool.execute_prepared(conn, "by_id", "SELECT * FROM t WHERE id = $1 AND b = $2", (1, 2))
+    assert conn.statements == ["SELECT * FROM t WHERE id = %s AND b = %s"]
+
+
+async def test_run_uses_executor_threads() -> None:
+    pool, _ = make_pool(max_size=2)
+    thread_name = await pool.run(lambda: threading.current_thread().name)
+    pool.close()
+    assert thread_name.startswith("db-pool")
@@ -0,0 +1,145 @@
+"""
+System: Suno Automation
+Module: Gemini Files Tests
+File URL: backend/tests/test_utils/test_gemini_files.py
+Purpose: Validate that uploads are cached by content hash and re-uploaded once expired.
+"""
+
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+from middleware import gemini_files  # noqa: E402
+from middleware.rate_limiter import TokenBucketRateLimiter  # noqa: E402
+
+
+def _expiry(hours: float) -> str:
+    return (datetime.now(timezone.utc) + timedelta(hours=hours)).strftime("%Y-%m-%dT%H:%M:%S.%f123Z")
+
+
+@pytest.fixture
+def uploads(monkeypatch, tmp_path: Path) -> Dict[str, Any]:
+    calls: List[str] = []
+    state: Dict[str, Any] = {"calls": calls, "expiry_hours": 48.0}
+
+    async def fake_upload_once(file_path: str, api_key: str) -> Dict[str, Any]:
+        calls.append(file_path)
+        return {
+            "name": f"files/upload-{len(calls)}",
+            "uri": f"https://example.invalid/files/upload-{len(calls)}",
+            "mimeType": "audio/mpeg",
+            "expirationTime": _expiry(state["expiry_hours"]),
+        }
+
+    monkeypatch.setattr(gemini_files, "_upload_file_once", fake_upload_once)
+    monkeypatch.setattr(gemini_files, "_upload_cache", gemini_files.UploadCache(str(tmp_path / "uploads.db")))
+    monkeypatch.setattr(
+        "middleware.rate_limiter._gemini_rate_limiter",
+        TokenBucketRateLimiter(requests_per_minute=6000, burst=10),
+    )
+    return state
+
+
+@pytest.mark.asyncio
+async def test_same_audio_is_uploaded_once(uploads: Dict[str, Any], tmp_path: Path) -> None:
+    first_copy = tmp_path / "first.mp3"
+    second_copy = tmp_path / "second.mp3"
+    first_copy.write_bytes(b"ID3-same-audio")
+    second_copy.write_bytes(b"ID3-same-audio")
+
+    first = await gemini_files.upload_file_to_google_ai(str(first_copy), "key")
+    second = await gemini_files.upload_file_to_google_ai(str(second_copy), "key")
+
+    assert len(uploads["calls"]) == 1
+    assert second["uri"] == first["uri"]
+    assert second["name"] == "files/upload-1"
+
+
+@pytest.mark.asyncio
+async def test_expiring_upload_is_replaced(uploads: Dict[str, Any], tmp_path: Path) -> None:
+    audio = tmp_path / "song.mp3"
+    audio.write_bytes(b"ID3-expiring-audio")
+
+    uploads["expiry_hours"] = 0.1  # inside the minimum remaining lifetime
+    await gemini_files.upload_file_to_google_ai(str(audio), "key")
+    refreshed = await gemini_files.upload_file_to_google_ai(str(audio), "key")
+
+    assert len(uploads["calls"]) == 2
+    assert refreshed["name"] == "files/upload-2"
+
+
+@pytest.mark.asyncio
+async def test_upload_cache_is_used_off_the_event_loop(uploads: Dict[str, Any], monkeypatch, tmp_path: Path) -> None:
+    audio = tmp_path / "song.mp3"
+    audio.write_bytes(b"ID3-threaded-audio")
+    cache = gemini_files._upload_cache
+    threads: List[int] = []
+
+    def record(method):
+        def wrapper(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return method(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(cache, "get", record(cache.get))
+    monkeypatch.setattr(cache, "put", record(cache.put))
+
+    await gemini_files.upload_file_to_google_ai(str(audio), "key")
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_interrupted_upload_resumes_from_confirmed_offset(monkeypatch, tmp_path: Path) -> None:
+    payload = bytes(range(256)) * 4096  # 1 MiB, several upload chunks
+    audio = tmp_path / "resume.mp3"
+    audio.write_bytes(payload)
+    received = bytearray()
+    put_offsets: List[int] = []
+
+    async def start_upload(request: web.Request) -> web.Response:
+        session_url = str(request.url.with_path("/session").with_query(None))
+        return web.json_response({}, headers={"X-Goog-Upload-URL": session_url})
+
+    async def upload_bytes(request: web.Request) -> web.Response:
+        offset = int(request.headers["X-Goog-Upload-Offset"])
+        put_offsets.append(offset)
+        assert offset == len(received)
+        if len(put_offsets) == 1:
+            received.extend(await request.content.readexactly(300 * 1024))
+            request.transport.close()
+            return web.Response()
+        received.extend(await request.read())
+        return web.json_response({"file": {"name": "files/resumed", "uri": "https://example.invalid/resumed"}})
+
+    async def query_upload(request: web.Request) -> web.Response:
+        assert request.headers["X-Goog-Upload-Command"] == "query"
+        return web.Response(headers={
+            "X-Goog-Upload-Status": "active",
+            "X-Goog-Upload-Size-Received": str(len(received)),
+        })
+
+    app = web.Application()
+    app.router.add_post("/upload", start_upload)
+    app.router.add_put("/session", upload_bytes)
+    app.router.add_post("/session", query_upload)
+
+    async with TestServer(app) as server:
+        monkeypatch.setattr(gemini_files, "GOOGLE_AI_UPLOAD_URL", str(server.make_url("/upload")))
+        result = await gemini_files._upload_file_once(str(audio), "key")
+
+    assert result["name"] == "files/resumed"
+    assert put_offsets == [0, 300 * 1024]
+    assert bytes(received) == payload
@@ -0,0 +1,75 @@
+"""
+System: Suno Automation
+Module: LLM Response Cache Tests
+File URL: backend/tests/test_utils/test_gemini_response_cache.py
+Purpose: Validate cache keys, TTL expiry and least-recently-used eviction of the response cache.
+"""
+
+import sys
+from pathlib import Path
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+from middleware.gemini_response_cache import ResponseCache, make_cache_key  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_key_depends_on_model_prompt_and_config() -> None:
+    key = make_cache_key("gemini-2.5-flash", "prompt")
+    assert key == make_cache_key("gemini-2.5-flash", "prompt")
+    assert key != make_cache_key("gemini-2.5-pro", "prompt")
+    assert key != make_cache_key("gemini-2.5-flash", "other prompt")
+    assert key != make_cache_key("gemini-2.5-flash", "prompt", {"temperature": 0.2})
+    assert make_cache_key("m", "p", {"a": 1, "b": 2}) == make_cache_key("m", "p", {"b": 2, "a": 1})
+
+
+def test_entries_persist_across_instances(tmp_path) -> None:
+    db_path = str(tmp_path / "responses.db")
+    ResponseCache(db_path).put("key", "model", "answer")
+    assert ResponseCache(db_path).get("key") == "answer"
+
+
+def test_entries_expire_after_ttl(tmp_path) -> None:
+    clock = FakeClock()
+    cache = ResponseCache(str(tmp_path / "responses.db"), ttl_seconds=60, clock=clock)
+    cache.put("key", "model", "answer")
+    clock.now += 59
+    assert cache.get("key") == "answer"
+    clock.now += 1
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path) -> None:
+    clock = FakeClock()
+    cache = ResponseCache(str(tmp_path / "responses.db"), max_entries=2, clock=clock)
+    cache.put("a", "model", "1")
+    clock.now += 1
+    cache.put("b", "model", "2")
+    clock.now += 1
+    assert cache.get("a") == "1"
+    clock.now += 1
+    cache.put("c", "model", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+async def test_async_access_and_overwrite(tmp_path) -> None:
+    cache = ResponseCache(str(tmp_path / "responses.db"))
+    await cache.put_async("key", "model", "old answer")
+    assert await cache.get_async("key") == "old answer"
+
+    # A regenerated answer replaces the cached one
+    await cache.put_async("key", "model", "new answer")
+    assert await cache.get_async("key") == "new answer"
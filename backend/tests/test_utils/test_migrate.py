@@ -0,0 +1,114 @@
+"""
+System: Suno Automation
+Module: Migration Runner Tests
+File URL: backend/tests/test_utils/test_migrate.py
+Purpose: Validate migration loading, version ordering, skipping of applied versions and failure handling.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+import pytest  # noqa: E402
+
+from database_migration.migrate import MIGRATIONS_DIR, apply_migrations, load_migrations  # noqa: E402
+
+
+class FakeConnection:
+    """Records statements; SELECT version returns applied_versions, to_regclass returns missing_tables as NULL."""
+
+    def __init__(self, applied_versions=(), missing_tables=()):
+        self.applied_versions = list(applied_versions)
+        self.missing_tables = set(missing_tables)
+        self.executed: List[Tuple[str, Any]] = []
+        self.commits = 0
+        self.rollbacks = 0
+        self._result: List[tuple] = []
+
+    def cursor(self) -> "FakeConnection":
+        return self
+
+    def __enter__(self) -> "FakeConnection":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def execute(self, sql: str, params: Optional[tuple] = None) -> None:
+        self.executed.append((sql, params))
+        if sql.startswith("SELECT version FROM schema_migrations"):
+            self._result = [(version,) for version in self.applied_versions]
+        elif sql.startswith("SELECT to_regclass"):
+            self._result = [(None if params[0] in self.missing_tables else params[0],)]
+        elif sql.startswith("INSERT INTO schema_migrations"):
+            self.applied_versions.append(params[0])
+
+    def fetchone(self) -> tuple:
+        return self._result[0]
+
+    def fetchall(self) -> List[tuple]:
+        return self._result
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+def write_migration(directory: Path, filename: str, version: str, body: str = "    conn.upgraded.append(VERSION)") -> None:
+    (directory / filename).write_text(
+        f'VERSION = "{version}"\nDESCRIPTION = "migration {version}"\n\n\ndef upgrade(conn):\n{body}\n'
+    )
+
+
+def test_migrations_load_in_version_order(tmp_path) -> None:
+    write_migration(tmp_path, "b_second.py", "0002")
+    write_migration(tmp_path, "a_first.py", "0001")
+    (tmp_path / "__init__.py").write_text("")
+    assert [module.VERSION for module in load_migrations(str(tmp_path))] == ["0001", "0002"]
+
+
+def test_duplicate_versions_are_rejected(tmp_path) -> None:
+    write_migration(tmp_path, "0001_a.py", "0001")
+    write_migration(tmp_path, "0001_b.py", "0001")
+    with pytest.raises(ValueError, match="Duplicate migration versions"):
+        load_migrations(str(tmp_path))
+
+
+def test_only_pending_migrations_are_applied_and_recorded(tmp_path) -> None:
+    for version in ("0001", "0002", "0003"):
+        write_migration(tmp_path, f"{version}_m.py", version)
+    conn = FakeConnection(applied_versions=["0001"])
+    conn.upgraded = []
+
+    assert apply_migrations(conn, load_migrations(str(tmp_path))) == ["0002", "0003"]
+    assert conn.upgraded == ["0002", "0003"]
+    assert conn.applied_versions == ["0001", "0002", "0003"]
+    assert apply_migrations(conn, load_migrations(str(tmp_path))) == []
+
+
+def test_failed_migration_is_rolled_back_and_not_recorded(tmp_path) -> None:
+    write_migration(tmp_path, "0001_ok.py", "0001")
+    write_migration(tmp_path, "0002_bad.py", "0002", body='    raise RuntimeError("boom")')
+    conn = FakeConnection()
+    conn.upgraded = []
+
+    with pytest.raises(RuntimeError, match="boom"):
+        apply_migrations(conn, load_migrations(str(tmp_path)))
+    assert conn.applied_versions == ["0001"]
+    assert conn.rollbacks == 1
+
+
+def test_index_migration_fails_when_table_is_missing() -> None:
+    index_migration = next(module for module in load_migrations(MIGRATIONS_DIR) if module.VERSION == "0002")
+    conn = FakeConnection(missing_tables={"bible_verses_tbl"})
+
+    with pytest.raises(RuntimeError, match="bible_verses_tbl"):
+        apply_migrations(conn, [index_migration])
+    assert "0002" not in conn.applied_versions
@@ -0,0 +1,83 @@
+"""
+System: Suno Automation
+Module: Progress Repository Tests
+File URL: backend/tests/test_utils/test_progress_repository.py
+Purpose: Validate in-place status updates of progress rows and invalidation of cached reads.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, List, Tuple
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+from services.db_pool import DatabasePool  # noqa: E402
+from services.progress_repository import ProgressRepository, ProgressStatus  # noqa: E402
+from services.query_cache import get_progress_cache  # noqa: E402
+
+
+class RecordingConnection:
+    def __init__(self):
+        self.closed = 0
+        self.executed: List[Tuple[str, Any]] = []
+        self.commits = 0
+
+    def cursor(self) -> "RecordingConnection":
+        return self
+
+    def __enter__(self) -> "RecordingConnection":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def execute(self, sql: str, params=None) -> None:
+        self.executed.append((sql, params))
+        self.rowcount = len(params[2]) if params else 0
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.closed = 1
+
+
+def test_verdicts_map_to_statuses() -> None:
+    assert ProgressStatus.from_verdict("continue") == ProgressStatus.APPROVED
+    assert ProgressStatus.from_verdict("re-roll") == ProgressStatus.REJECTED
+    assert ProgressStatus.from_verdict("error") == ProgressStatus.REVIEW_FAILED
+    assert ProgressStatus.from_verdict(None) == ProgressStatus.REVIEW_FAILED
+
+
+def test_update_status_updates_in_place_and_invalidates_cache() -> None:
+    conn = RecordingConnection()
+    repository = ProgressRepository(pool=DatabasePool(connect=lambda: conn, max_size=1))
+    cache = get_progress_cache()
+    cache.clear()
+    cache.set(11, {"song_structure": None, "lyrics": [{"pg1_id": 11, "pg1_song_id": "clip-a"}]})
+    cache.set(12, {"song_structure": None, "lyrics": [{"pg1_id": 12, "pg1_song_id": "clip-c"}]})
+
+    updated = repository.update_status(["clip-a", "clip-b", "clip-a", None], ProgressStatus.APPROVED, increment_reviews=True)
+
+    assert updated == 2
+    sql, params = conn.executed[-1]
+    assert sql.strip().startswith("UPDATE tblprogress_v1")
+    assert params == (ProgressStatus.APPROVED, 1, ["clip-a", "clip-b"])
+    assert conn.commits == 1
+    assert cache.get(11) is None
+    assert cache.get(12) is not None
+    cache.clear()
+
+
+def test_empty_updates_do_not_touch_the_database() -> None:
+    conn = RecordingConnection()
+    repository = ProgressRepository(pool=DatabasePool(connect=lambda: conn, max_size=1))
+    assert repository.update_status([None, ""], ProgressStatus.DOWNLOADED) == 0
+    assert repository.upsert_songs(1, [], "lyrics", "pop") == {}
+    assert conn.executed == []
@@ -0,0 +1,87 @@
+"""
+System: Suno Automation
+Module: Query Cache Tests
+File URL: backend/tests/test_utils/test_query_cache.py
+Purpose: Validate TTL expiry, LRU eviction, copy-on-read and passage invalidation of the query caches.
+"""
+
+import sys
+from pathlib import Path
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+from services.query_cache import (  # noqa: E402
+    TTLCache,
+    get_structure_cache,
+    invalidate_passage,
+    structure_id_key,
+    structure_key,
+    verse_ranges_key,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    cache = TTLCache(max_entries=4, ttl_seconds=10, clock=clock)
+    cache.set("a", {"id": 1})
+    clock.now = 9.9
+    assert cache.get("a") == {"id": 1}
+    clock.now = 10.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_get_or_load_reads_through_once_and_returns_copies() -> None:
+    cache = TTLCache(max_entries=4, ttl_seconds=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"styles": ["pop"]}
+
+    first = cache.get_or_load("row", loader)
+    first["styles"].append("rock")
+    assert cache.get_or_load("row", loader) == {"styles": ["pop"]}
+    assert len(calls) == 1
+
+    assert cache.get_or_load("missing", lambda: None) is None
+    assert len(cache) == 1
+
+
+def test_invalidate_passage_drops_rows_by_key_and_value() -> None:
+    cache = get_structure_cache()
+    cache.clear()
+    cache.set(verse_ranges_key("John", 3), ["1-10", "11-21"])
+    cache.set(structure_key("John", 3, "1-10"), {"id": 7, "song_structure": None})
+    cache.set(structure_key("John", 3, "11-21"), {"id": 8, "song_structure": "{}"})
+    cache.set(structure_id_key(7), {"id": 7, "book_name": "John", "chapter": 3, "verse_range": "1-10"})
+
+    invalidate_passage("John", 3, "1-10")
+
+    assert cache.get(verse_ranges_key("John", 3)) is None
+    assert cache.get(structure_key("John", 3, "1-10")) is None
+    assert cache.get(structure_id_key(7)) is None
+    assert cache.get(structure_key("John", 3, "11-21")) == {"id": 8, "song_structure": "{}"}
+    cache.clear()
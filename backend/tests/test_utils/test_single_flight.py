@@ -0,0 +1,95 @@
+"""
+System: Suno Automation
+Module: Single-Flight Tests
+File URL: backend/tests/test_utils/test_single_flight.py
+Purpose: Validate that concurrent identical calls share one computation, result and failure.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+import pytest  # noqa: E402
+
+from services.single_flight import SingleFlight, passage_key  # noqa: E402
+
+
+async def test_concurrent_calls_share_one_computation() -> None:
+    flights = SingleFlight()
+    calls = 0
+
+    async def generate() -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"verse1": "1-5"}
+
+    key = passage_key("song_structure", "Genesis ", 1, " 1-10")
+    results = await asyncio.gather(*(flights.run(key, generate) for _ in range(5)))
+
+    assert calls == 1
+    assert all(result == {"verse1": "1-5"} for result in results)
+    assert len({id(result) for result in results}) == 5
+    assert not flights.in_flight(key)
+
+    await flights.run(key, generate)
+    assert calls == 2
+
+
+async def test_different_keys_run_separately() -> None:
+    flights = SingleFlight()
+    calls = []
+
+    async def generate(verse_range: str) -> str:
+        calls.append(verse_range)
+        await asyncio.sleep(0.01)
+        return verse_range
+
+    results = await asyncio.gather(
+        flights.run(passage_key("passage", "Genesis", 1, "1-10"), lambda: generate("1-10")),
+        flights.run(passage_key("passage", "Genesis", 1, "11-20"), lambda: generate("11-20")),
+    )
+    assert results == ["1-10", "11-20"]
+    assert sorted(calls) == ["1-10", "11-20"]
+
+
+async def test_failure_is_shared_and_not_remembered() -> None:
+    flights = SingleFlight()
+    calls = 0
+
+    async def fail() -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("quota exceeded")
+
+    key = passage_key("verse_ranges", "Genesis", 1)
+    results = await asyncio.gather(flights.run(key, fail), flights.run(key, fail), return_exceptions=True)
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    with pytest.raises(RuntimeError):
+        await flights.run(key, fail)
+    assert calls == 2
+
+
+async def test_cancelled_caller_does_not_cancel_followers() -> None:
+    flights = SingleFlight()
+
+    async def generate() -> str:
+        await asyncio.sleep(0.02)
+        return "done"
+
+    key = passage_key("passage", "Genesis", 1, "1-10")
+    leader = asyncio.ensure_future(flights.run(key, generate))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flights.run(key, generate))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "done"
@@ -0,0 +1,71 @@
+"""
+System: Suno Automation
+Module: Song Structure Schema Tests
+File URL: backend/tests/test_utils/test_song_structure_schema.py
+Purpose: Validate parsing and rejection rules of the single-call structure-and-tone reply.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+import pytest  # noqa: E402
+
+from utils.song_structure_schema import parse_structure_and_tone  # noqa: E402
+
+
+def reply(sections, tone=1) -> str:
+    return json.dumps({"sections": [{"section": name, "verses": verses} for name, verses in sections], "tone": tone})
+
+
+def test_sections_fold_into_ordered_structure() -> None:
+    text = reply([("verse1", "1-5"), ("chorus", "6 - 8"), ("outro", "9")], tone=0)
+    song_structure, tone = parse_structure_and_tone(text)
+    assert song_structure == {"verse1": "1-5", "chorus": "6-8", "outro": "9"}
+    assert list(song_structure) == ["verse1", "chorus", "outro"]
+    assert tone == 0
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        None,
+        "",
+        "{'sections': []}",
+        json.dumps(["verse1", "1-5"]),
+        reply([]),
+        reply([("verse1", "1-5")], tone=2),
+        reply([("verse1", "1-5")], tone=True),
+        reply([("verse1", "1-5"), ("verse1", "6-8")]),
+        reply([("verse1", "5-1")]),
+        reply([("verse1", "one to five")]),
+        reply([("", "1-5")]),
+    ],
+)
+def test_invalid_replies_are_rejected(text) -> None:
+    assert parse_structure_and_tone(text) is None
+
+
+def test_sections_inside_the_passage_are_accepted() -> None:
+    text = reply([("verse1", "11-14"), ("chorus", "15-17"), ("outro", "18")])
+    song_structure, _ = parse_structure_and_tone(text, "11-20")
+    assert song_structure == {"verse1": "11-14", "chorus": "15-17", "outro": "18"}
+
+
+@pytest.mark.parametrize(
+    "sections",
+    [
+        [("verse1", "1-5"), ("chorus", "6-12")],  # runs past the end of the passage
+        [("verse1", "0-3")],  # starts before it
+        [("verse1", "1-5"), ("chorus", "5-8")],  # shares verse 5
+        [("chorus", "6-8"), ("verse1", "1-7")],  # overlap regardless of order
+        [("verse1", "1-4"), ("chorus", "3")],  # single verse inside another section
+    ],
+)
+def test_out_of_range_or_overlapping_sections_are_rejected(sections) -> None:
+    assert parse_structure_and_tone(reply(sections), "1-10") is None
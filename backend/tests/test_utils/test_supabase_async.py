@@ -0,0 +1,51 @@
+"""
+System: Suno Automation
+Module: Async Supabase Access Tests
+File URL: backend/tests/test_utils/test_supabase_async.py
+Purpose: Validate that blocking queries run off the event loop.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+from services.supabase_async import execute_async, run_blocking  # noqa: E402
+
+
+class SlowQuery:
+    """Stands in for a supabase-py query builder whose execute() blocks."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def execute(self):
+        time.sleep(self.seconds)
+        return threading.current_thread().name
+
+
+async def test_execute_async_keeps_event_loop_responsive() -> None:
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    thread_name = await execute_async(SlowQuery(0.2))
+    ticker_task.cancel()
+
+    assert thread_name.startswith("supabase")
+    assert ticks >= 5
+
+
+async def test_run_blocking_passes_arguments() -> None:
+    assert await run_blocking(lambda a, b=0: a + b, 2, b=3) == 5
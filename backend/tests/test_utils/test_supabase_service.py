@@ -0,0 +1,101 @@
+"""
+System: Suno Automation
+Module: Supabase Service Tests
+File URL: backend/tests/test_utils/test_supabase_service.py
+Purpose: Validate keyset pagination and column projection of song structure listings.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, List
+
+# Setup path for local imports (required before module imports)  # noqa: E402
+BACKEND_ROOT = Path(__file__).resolve().parents[2]  # noqa: E402
+if str(BACKEND_ROOT) not in sys.path:  # noqa: E402
+    sys.path.append(str(BACKEND_ROOT))  # noqa: E402
+
+import pytest  # noqa: E402
+
+from services.db_pool import DatabasePool  # noqa: E402
+from services.supabase_service import MAX_LIST_LIMIT, SupabaseService  # noqa: E402
+
+
+class ListingConnection:
+    """Serves (id, book_name, chapter, verse_range) rows with ids 1..total."""
+
+    def __init__(self, total: int):
+        self.closed = 0
+        self.total = total
+        self.params: List[Any] = []
+
+    def cursor(self) -> "ListingConnection":
+        return self
+
+    def __enter__(self) -> "ListingConnection":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def execute(self, query, params) -> None:
+        self.params.append(params)
+        if isinstance(query, str) and "OFFSET" in query:
+            limit, offset = params
+            self.rows = [(i, "John", 3, f"{i}-{i + 1}") for i in range(1, self.total + 1)][offset:offset + limit]
+            return
+        after_id = params[0] if len(params) > 1 else 0
+        limit = params[-1]
+        self.rows = [(i, "John", 3, f"{i}-{i + 1}") for i in range(after_id + 1, self.total + 1)][:limit]
+
+    def fetchall(self) -> List[tuple]:
+        return self.rows
+
+    def rollback(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.closed = 1
+
+
+def make_service(total: int) -> SupabaseService:
+    conn = ListingConnection(total)
+    return SupabaseService(pool=DatabasePool(connect=lambda: conn, max_size=1))
+
+
+def test_pages_follow_the_id_cursor_until_exhausted() -> None:
+    service = make_service(total=5)
+
+    first = service.list_song_structures(limit=2)
+    assert [item["id"] for item in first["items"]] == [1, 2]
+    assert first["items"][0] == {"id": 1, "book_name": "John", "chapter": 3, "verse_range": "1-2"}
+    assert first["next_cursor"] == 2
+
+    second = service.list_song_structures(after_id=first["next_cursor"], limit=2)
+    assert [item["id"] for item in second["items"]] == [3, 4]
+
+    last = service.list_song_structures(after_id=second["next_cursor"], limit=2)
+    assert [item["id"] for item in last["items"]] == [5]
+    assert last["next_cursor"] is None
+
+
+def test_unknown_columns_are_rejected() -> None:
+    service = make_service(total=1)
+    with pytest.raises(ValueError):
+        service.list_song_structures(columns=["id", "password"])
+
+
+def test_get_all_song_structures_pages_past_the_list_cap() -> None:
+    service = make_service(total=MAX_LIST_LIMIT + 20)
+
+    structures = service.get_all_song_structures(limit=MAX_LIST_LIMIT + 10)
+    assert [item["id"] for item in structures] == list(range(1, MAX_LIST_LIMIT + 11))
+
+    after = service.get_all_song_structures(limit=100, after_id=MAX_LIST_LIMIT)
+    assert [item["id"] for item in after] == list(range(MAX_LIST_LIMIT + 1, MAX_LIST_LIMIT + 21))
+
+
+def test_get_all_song_structures_keeps_offset_paging() -> None:
+    service = make_service(total=10)
+
+    structures = service.get_all_song_structures(limit=3, offset=4)
+    assert [item["id"] for item in structures] == [5, 6, 7]
@@ -8,9 +8,11 @@ import ast
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.bible_utils import split_chapter_into_sections
+from utils.bible_utils import split_chapter_into_verse_ranges
 from utils.assign_styles import get_style_by_chapter
+from config.generation_config import VERSE_RANGES_USE_LLM
 from lib.supabase import supabase
+from services.query_cache import invalidate_passage
 from multi_tool_agent.song_generation_agent import agent_runner, session_service, APP_NAME
 from google.genai import types
 
@@ -115,11 +117,32 @@ def generate_verse_ranges(book_name: str, book_chapter: int) -> list[str]:
     )
     ai_logger.info(f"Generating verse ranges for {book_name} chapter {book_chapter}")
     
-    split_chapter = split_chapter_into_sections(book_name, str(book_chapter))
+    local_ranges = split_chapter_into_verse_ranges(book_name, str(book_chapter))
+    split_chapter = len(local_ranges)
 
     print(
         f"[generate_verse_ranges()] Splitting {book_name} {book_chapter} into sections: {split_chapter}"
     )
+
+    if not VERSE_RANGES_USE_LLM:
+        # Deterministic local split, no agent round-trip
+        try:
+            supabase.table("song_structure_tbl").insert(
+                [
+                    {
+                        "book_name": book_name,
+                        "chapter": book_chapter,
+                        "verse_range": verse_range,
+                    }
+                    for verse_range in local_ranges
+                ]
+            ).execute()
+            invalidate_passage(book_name, book_chapter)
+            return local_ranges
+        except Exception as e:
+            print(f"Error saving verse ranges: {e}")
+            ai_logger.error(f"Error saving verse ranges: {e}")
+            return []
     
     # Use the agent to generate verse ranges
     try:
@@ -140,15 +163,18 @@ def generate_verse_ranges(book_name: str, book_chapter: int) -> list[str]:
             verse_ranges = verse_ranges_str.split(",")
             print(f"Verse ranges: {verse_ranges} with type {type(verse_ranges)}")
 
-            # Insert verse ranges into database
-            for verse_range in verse_ranges:
-                supabase.table("song_structure_tbl").insert(
+            # Insert verse ranges into database (one multi-row request)
+            supabase.table("song_structure_tbl").insert(
+                [
                     {
                         "book_name": book_name,
                         "chapter": book_chapter,
                         "verse_range": verse_range.strip(),
                     }
-                ).execute()
+                    for verse_range in verse_ranges
+                ]
+            ).execute()
+            invalidate_passage(book_name, book_chapter)
 
             return [v.strip() for v in verse_ranges]
         else:
@@ -319,6 +345,7 @@ def generate_song_structure(
         ).eq("book_name", strBookName).eq("chapter", intBookChapter).eq(
             "verse_range", strVerseRange
         ).execute()
+        invalidate_passage(strBookName, intBookChapter, strVerseRange)
 
         print(
             f"Successfully updated song structure for {strBookName} {intBookChapter}:{strVerseRange}"
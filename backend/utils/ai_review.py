@@ -10,20 +10,18 @@ import json
 import traceback
 import logging
 import shutil
-import asyncio
 from typing import Dict, Any, Optional
-import aiohttp
 from services.supabase_service import SupabaseService
 from middleware.gemini import model_pro, model_flash, api_key
+from middleware.gemini_files import upload_file_to_google_ai
 try:
     from config.ai_review_config import (
-        USE_FLASH_MODEL, DELAY_BETWEEN_API_CALLS, 
+        USE_FLASH_MODEL,
         PROCESS_SEQUENTIALLY
     )
 except ImportError:
     # Fallback if config file doesn't exist
     USE_FLASH_MODEL = False
-    DELAY_BETWEEN_API_CALLS = 30
     PROCESS_SEQUENTIALLY = True
 
 # Configure logger
@@ -43,83 +41,6 @@ file_handler.setFormatter(formatter)
 logger.addHandler(file_handler)
 
 
-async def upload_file_to_google_ai(file_path: str, api_key: str) -> Optional[Dict[str, Any]]:
-    """
-    Uploads a file to Google AI Files API using resumable upload protocol.
-
-    This function handles the entire upload process including:
-    1. Initializing the resumable upload session
-    2. Uploading the file content
-    3. Finalizing the upload
-
-    Args:
-        file_path (str): Absolute path to the file to upload
-        api_key (str): Google AI API key for authentication
-
-    Returns:
-        Optional[Dict[str, Any]]: Dictionary containing file metadata (name, uri, mimeType)
-        on success, None on failure
-
-    Raises:
-        None: Errors are caught and logged internally
-    """
-    try:
-        # Get file info
-        file_size = os.path.getsize(file_path)
-        file_name = os.path.basename(file_path)
-        
-        # Determine MIME type
-        mime_type = "audio/mpeg" if file_path.endswith(".mp3") else "audio/wav"
-        
-        async with aiohttp.ClientSession() as session:
-            # Step 1: Initialize resumable upload
-            init_url = f"https://generativelanguage.googleapis.com/upload/v1beta/files?key={api_key}"
-            init_headers = {
-                "X-Goog-Upload-Protocol": "resumable",
-                "X-Goog-Upload-Command": "start",
-                "X-Goog-Upload-Header-Content-Length": str(file_size),
-                "X-Goog-Upload-Header-Content-Type": mime_type,
-                "Content-Type": "application/json"
-            }
-            init_data = {
-                "file": {
-                    "display_name": file_name
-                }
-            }
-            
-            async with session.post(init_url, headers=init_headers, json=init_data) as resp:
-                if resp.status != 200:
-                    print(f"Failed to initialize upload: {resp.status}")
-                    return None
-                    
-                upload_url = resp.headers.get("X-Goog-Upload-URL")
-                if not upload_url:
-                    print("No upload URL received")
-                    return None
-            
-            # Step 2: Upload the file
-            upload_headers = {
-                "Content-Length": str(file_size),
-                "X-Goog-Upload-Offset": "0",
-                "X-Goog-Upload-Command": "upload, finalize"
-            }
-            
-            with open(file_path, "rb") as f:
-                file_data = f.read()
-                
-            async with session.put(upload_url, headers=upload_headers, data=file_data) as resp:
-                if resp.status != 200:
-                    print(f"Failed to upload file: {resp.status}")
-                    return None
-                    
-                result = await resp.json()
-                return result.get("file")
-                
-    except Exception as e:
-        print(f"Error uploading file to Google AI: {e}")
-        return None
-
-
 async def send_prompt_to_google_ai(
     prompt: str,
     file_uri: Optional[str] = None,
@@ -177,15 +98,12 @@ async def send_prompt_to_google_ai(
             "maxOutputTokens": 8192,
         }
 
-        # Add rate limiting based on configuration
+        # Rate limiting is handled by the shared token bucket wrapped around the model
         print(f"\n🕒 [API-CALL] Preparing to call Gemini API...")
         print(f"🕒 [API-CALL] Model: {'Gemini Flash' if USE_FLASH_MODEL else 'Gemini Pro'}")
-        print(f"🕒 [API-CALL] Rate limit delay: {DELAY_BETWEEN_API_CALLS}s")
         print(f"🕒 [API-CALL] Has file attachment: {'Yes' if file_uri else 'No'}")
         print(f"🕒 [API-CALL] Has conversation history: {'Yes' if previous_messages else 'No'}")
         
-        await asyncio.sleep(DELAY_BETWEEN_API_CALLS)
-        
         # Select model based on configuration
         model = model_flash if USE_FLASH_MODEL else model_pro
         
@@ -263,7 +181,7 @@ async def review_song_with_ai(
         service = SupabaseService()
         try:
             logger.debug(f"Fetching song data for ID: {pg1_id}")
-            song_data = service.get_song_with_lyrics(pg1_id)
+            song_data = await service.get_song_with_lyrics_async(pg1_id)
             if not song_data or not song_data.get('lyrics'):
                 error_msg = f"No lyrics data found for pg1_id: {pg1_id}"
                 logger.error(error_msg)
@@ -401,11 +319,6 @@ async def review_song_with_ai(
         logger.info("First AI response received successfully")
         logger.debug(f"First AI response content:\n{first_response}")
         
-        # Add delay to avoid rate limiting based on configuration
-        print(f"\n⏳ [RATE-LIMIT] Waiting {DELAY_BETWEEN_API_CALLS} seconds before second API call...")
-        logger.info(f"Waiting {DELAY_BETWEEN_API_CALLS} seconds before second API call to avoid rate limits...")
-        await asyncio.sleep(DELAY_BETWEEN_API_CALLS)
-        
         # Prepare conversation history for second prompt
         conversation_history = [
             {
@@ -492,7 +405,7 @@ Add final verdict by ending with 'Final Verdict: [re-roll] or [continue]'."""
         
         if verdict == "re-roll":
             # Delete the database entry for this song
-            deletion_db_success = service.delete_song(pg1_id)
+            deletion_db_success = await service.delete_song_async(pg1_id)
             if deletion_db_success:
                 logger.info(f"Deleted database entry for pg1_id: {pg1_id}")
             else:
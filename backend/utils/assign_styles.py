@@ -1,109 +1,133 @@
+"""
+System: Suno Automation
+Module: Style Assignment
+File URL: backend/utils/assign_styles.py
+Purpose: Look up the Suno styles of a Bible chapter by tone from song_variation_map.csv.
+
+The CSV is compiled once into a flat (book, chapter, tone) -> styles table on first
+use and recompiled when the file's modification time changes.
+
+CSV layout:
+    row 1: "Positive Style", then one style description per style column
+    row 2: "Negative Style", then one style description per style column
+    rows 3+: book name (only on a book's first row), then chapter numbers; a
+             chapter's column selects its style description
+"""
+
+import csv
 import os
-
-import pandas as pd
-
-
-def separate_books():
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    csv_file_path = os.path.join(
-        base_dir, "misc", "data", "bible_song_styles", "song_variation_map.csv"
-    )
-
-    df_all = pd.read_csv(csv_file_path, header=None, dtype=str).fillna("")
-
-    style_dataframes = {}
-
-    # Positive Style (first row)
-    positive_style_name = df_all.iloc[0, 0]
-    positive_style_descriptions = (
-        df_all.iloc[0, 1:].replace("", pd.NA).dropna().tolist()
-    )
-    if positive_style_descriptions:
-        style_dataframes[positive_style_name] = pd.DataFrame(
-            [positive_style_descriptions],
-            columns=[f"Style_{i+1}" for i in range(len(positive_style_descriptions))],
-        )
-    else:
-        style_dataframes[positive_style_name] = pd.DataFrame()
-
-    # Negative Style (second row)
-    negative_style_name = df_all.iloc[1, 0]
-    negative_style_descriptions = (
-        df_all.iloc[1, 1:].replace("", pd.NA).dropna().tolist()
-    )
-    if negative_style_descriptions:
-        style_dataframes[negative_style_name] = pd.DataFrame(
-            [negative_style_descriptions],
-            columns=[f"Style_{i+1}" for i in range(len(negative_style_descriptions))],
-        )
-    else:
-        style_dataframes[negative_style_name] = pd.DataFrame()
-
-    df_books_raw = df_all.iloc[2:].copy()
-    df_books_raw.reset_index(drop=True, inplace=True)
-
-    bible_book_dataframes = {}
-
-    if not df_books_raw.empty:
-        df_books_raw["ActualBook"] = df_books_raw.iloc[:, 0].replace("", pd.NA).ffill()
-
-        for book_name, group_df in df_books_raw.groupby("ActualBook"):
-            book_specific_df = group_df.iloc[:, 1:-1].copy()
-
-            num_chapter_cols = book_specific_df.shape[1]
-            book_specific_df.columns = [f"Style_{i+1}" for i in range(num_chapter_cols)]
-
-            book_specific_df.reset_index(drop=True, inplace=True)
-
-            book_specific_df = book_specific_df.fillna("")
-
-            bible_book_dataframes[book_name] = book_specific_df
-
-    return style_dataframes, bible_book_dataframes
-
-
-def get_style_by_chapter(book_name, chapter_number, tone):
-    style_dataframes, bible_book_dataframes = separate_books()
-
-    if book_name not in bible_book_dataframes:
-        print(f"Book {book_name} not found.")
+import threading
+from typing import Dict, List, Optional, Tuple
+
+STYLE_MAP_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "misc", "data", "bible_song_styles", "song_variation_map.csv",
+)
+
+NEGATIVE_TONE = 0
+POSITIVE_TONE = 1
+
+StyleTable = Dict[Tuple[str, int, int], List[str]]
+
+_style_table: Optional[StyleTable] = None
+_style_table_source: Optional[Tuple[str, float]] = None
+_style_table_lock = threading.Lock()
+
+
+def _split_styles(description: str) -> List[str]:
+    return [style.strip() for style in description.split(",") if style.strip()]
+
+
+def compile_style_table(csv_file_path: str = STYLE_MAP_PATH) -> StyleTable:
+    """Compile the style map CSV into {(book, chapter, tone): [style, ...]}."""
+    with open(csv_file_path, "r", encoding="utf-8", newline="") as csv_file:
+        rows = list(csv.reader(csv_file))
+    if len(rows) < 2:
+        return {}
+
+    # Style descriptions are numbered by their position among the non-empty cells
+    styles_by_tone = {
+        POSITIVE_TONE: [cell for cell in rows[0][1:] if cell],
+        NEGATIVE_TONE: [cell for cell in rows[1][1:] if cell],
+    }
+
+    # Chapter cells per book, grouped by style column
+    book_columns: Dict[str, Dict[int, List[str]]] = {}
+    current_book = ""
+    for row in rows[2:]:
+        if not row:
+            continue
+        if row[0]:
+            current_book = row[0]
+        if not current_book:
+            continue
+        columns = book_columns.setdefault(current_book, {})
+        for column_index, cell in enumerate(row[1:]):
+            if cell:
+                columns.setdefault(column_index, []).append(cell.strip())
+
+    table: StyleTable = {}
+    for book_name, columns in book_columns.items():
+        # A chapter listed in several columns takes the leftmost one
+        for column_index in sorted(columns):
+            for cell in columns[column_index]:
+                if not cell.isdigit():
+                    continue
+                for tone, descriptions in styles_by_tone.items():
+                    key = (book_name, int(cell), tone)
+                    if key not in table and column_index < len(descriptions):
+                        table[key] = _split_styles(descriptions[column_index])
+    return table
+
+
+def _get_style_table() -> StyleTable:
+    """Return the compiled table, recompiling it when the CSV has changed on disk."""
+    global _style_table, _style_table_source
+    source = (STYLE_MAP_PATH, os.path.getmtime(STYLE_MAP_PATH))
+    if _style_table is None or source != _style_table_source:
+        with _style_table_lock:
+            if _style_table is None or source != _style_table_source:
+                _style_table = compile_style_table(source[0])
+                _style_table_source = source
+    return _style_table
+
+
+def get_style_by_chapter(book_name, chapter_number, tone) -> Optional[List[str]]:
+    """
+    Styles for one chapter.
+
+    Args:
+        book_name (str): Book name as written in the CSV (e.g. "Genesis")
+        chapter_number (int | str): Chapter number
+        tone (int): 0 for negative, 1 for positive
+
+    Returns:
+        Optional[List[str]]: The styles, or None when the book, chapter or tone is unknown
+    """
+    try:
+        key = (book_name, int(chapter_number), int(tone))
+    except (TypeError, ValueError):
         return None
+    styles = _get_style_table().get(key)
+    if styles is None:
+        print(f"No style found for {book_name} {chapter_number} (tone {tone}).")
+        return None
+    return list(styles)
 
-    df = bible_book_dataframes[book_name]
-
-    chapter_to_find_str = str(chapter_number)
-    column_name = ""
-
-    for column in df.columns:
-        if chapter_to_find_str in df[column].values:
-            column_name = column
-            break
-
-    if column_name != "":
-
-        if tone == 0:
-            df_styles = style_dataframes["Negative Style"]
-
-        if tone == 1:
-            df_styles = style_dataframes["Positive Style"]
-
-        style = df_styles[column_name].values[0]
-        style = style.split(",") if isinstance(style, str) else style
-        style = [s.strip() for s in style if s.strip()]
 
-    return style
+def get_styles_for_book(book_name, tone) -> Dict[int, List[str]]:
+    """Styles of every chapter of a book for one tone, keyed by chapter number."""
+    return {
+        chapter: list(styles)
+        for (book, chapter, chapter_tone), styles in _get_style_table().items()
+        if book == book_name and chapter_tone == tone
+    }
 
 
 if __name__ == "__main__":
-    style_dataframes, bible_book_dataframes = separate_books()
-
-    print("--- Style DataFrames ---")
-    for name, df_style in style_dataframes.items():
-        print(f"\n--- DataFrame for: {name} ---")
-        print(df_style)
-
-    print("\n\n--- Bible Book DataFrames ---")
-
-    for name, book_df in bible_book_dataframes.items():
-        print(f"\n--- DataFrame for: {name} ---")
-        print(book_df.head())
+    style_table = _get_style_table()
+    books = sorted({book for book, _, _ in style_table})
+    print(f"--- {len(style_table)} (book, chapter, tone) entries across {len(books)} books ---")
+    for name in books:
+        chapters = get_styles_for_book(name, POSITIVE_TONE)
+        print(f"{name}: {len(chapters)} chapters")
@@ -1,3 +1,6 @@
+import functools
+from typing import List
+
 import pythonbible as bible
 from pythonbible import Book
 
@@ -8,10 +11,76 @@ class ChapterSplitError(Exception):
     pass
 
 
-def split_chapter_into_sections(book_name, book_chapter_str: str) -> int:
+def _resolve_book(book_name):
+    """Map a book name string to a pythonbible.Book enum; other values are returned unchanged."""
+    if not isinstance(book_name, str):
+        return book_name
+
+    try:
+        normalized_book_name = book_name.strip().replace(" ", "_").upper()
+
+        if normalized_book_name.startswith("1_"):
+            normalized_book_name = normalized_book_name[2:] + "_1"
+        elif normalized_book_name.startswith("2_"):
+            normalized_book_name = normalized_book_name[2:] + "_2"
+        elif normalized_book_name.startswith("3_"):
+            normalized_book_name = normalized_book_name[2:] + "_3"
+
+        return Book[normalized_book_name]
+    except KeyError:
+        # If direct match fails, try a more general normalization
+        try:
+            cleaned_book_name = book_name.lower().replace(" ", "")
+            for book in Book:
+                if book.name.lower().replace("_", "") == cleaned_book_name:
+                    return book
+            # If no match is found after iterating, we keep the original string
+            # and let the bible library handle it, logging the failure.
+            print(
+                f"Could not find a matching book enum for '{book_name}'. Passing as is."
+            )
+            return book_name
+        except Exception as e:
+            print(
+                f"An unexpected error occurred during book normalization for '{book_name}': {e}"
+            )
+            return book_name
+
+
+@functools.lru_cache(maxsize=None)
+def get_chapter_verse_count(book, chapter: int) -> int:
+    """Memoized pythonbible.get_number_of_verses (book is a Book enum or name)."""
+    return bible.get_number_of_verses(book, chapter)
+
+
+def get_book_chapter_count(book_name) -> int:
     """
-    Calculates the number of sections a Bible chapter should be split into,
-    based on its total number of verses.
+    Number of chapters in a book.
+
+    Raises:
+        ChapterSplitError: If the book is unknown
+    """
+    try:
+        return bible.get_number_of_chapters(_resolve_book(book_name))
+    except Exception as e:
+        raise ChapterSplitError(f"Invalid book: {book_name}. Source error: {str(e)}") from e
+
+
+def _number_of_sections(total_verses: int) -> int:
+    if total_verses < 15:
+        return 1
+    if total_verses < 30:
+        return 2
+    if total_verses <= 45:
+        return 3
+    if total_verses <= 60:
+        return 4
+    return 5
+
+
+def split_chapter_into_verse_ranges(book_name, book_chapter_str: str) -> List[str]:
+    """
+    Splits a Bible chapter into contiguous "start-end" verse ranges of near-equal length.
 
     Rules for number of sections based on total verses:
     - Less than 15 verses: 1 section
@@ -20,22 +89,19 @@ def split_chapter_into_sections(book_name, book_chapter_str: str) -> int:
     - 46 to 60 verses (inclusive): 4 sections (i.e. >45 and <=60)
     - Over 60 verses: 5 sections
 
+    Earlier sections take the remainder verses, e.g. 31 verses -> ["1-11", "12-21", "22-31"].
+
     Args:
         book_name: The Bible book, can be a pythonbible.Book enum or a string name.
         book_chapter_str (str): The chapter number as a string (e.g., "1", "10").
 
     Returns:
-        int: The number of sections the chapter should be split into.
+        List[str]: The verse ranges, in order.
 
     Raises:
         ChapterSplitError: If the chapter cannot be processed, input is invalid,
                            or Bible data cannot be fetched.
     """
-
-    print(
-        f"[split_chapter_into_sections()] Calculating sections for chapter: {book_name} {book_chapter_str}"
-    )
-
     try:
         book_chapter = int(book_chapter_str)
         if book_chapter <= 0:
@@ -45,51 +111,10 @@ def split_chapter_into_sections(book_name, book_chapter_str: str) -> int:
             f"Invalid chapter number '{book_chapter_str}': {e}"
         ) from e
 
-    if isinstance(book_name, str):
-        try:
-            print(f"Normalizing book name: {book_name}")
-            normalized_book_name = book_name.strip().replace(" ", "_").upper()
-            print(f"Normalized book name: {normalized_book_name}")
-
-            if normalized_book_name.startswith("1_"):
-                normalized_book_name = normalized_book_name[2:] + "_1"
-            elif normalized_book_name.startswith("2_"):
-                normalized_book_name = normalized_book_name[2:] + "_2"
-            elif normalized_book_name.startswith("3_"):
-                normalized_book_name = normalized_book_name[2:] + "_3"
-
-            print(f"Normalized book name: {normalized_book_name}")
-
-            book_to_use = Book[normalized_book_name]
-            print(f"Using book enum: {book_to_use}")
-        except KeyError:
-            # If direct match fails, try a more general normalization
-            try:
-                cleaned_book_name = book_name.lower().replace(" ", "")
-                for book in Book:
-                    if book.name.lower().replace("_", "") == cleaned_book_name:
-                        book_to_use = book
-                        break
-                else:
-                    # If no match is found after iterating, we keep the original string
-                    # and let the bible library handle it, logging the failure.
-                    print(
-                        f"Could not find a matching book enum for '{book_name}'. Passing as is."
-                    )
-                    book_to_use = book_name
-            except Exception as e:
-                print(
-                    f"An unexpected error occurred during book normalization for '{book_name}': {e}"
-                )
-                book_to_use = book_name
-    else:
-        book_to_use = book_name
+    book_to_use = _resolve_book(book_name)
 
     try:
-        total_verses = bible.get_number_of_verses(book_to_use, book_chapter)
-        print(
-            f"[split_chapter_into_sections({book_name}, {book_chapter_str})] Total verses in {book_name} {book_chapter}: {total_verses}"
-        )
+        total_verses = get_chapter_verse_count(book_to_use, book_chapter)
 
         if total_verses is None or total_verses <= 0:
             raise bible.InvalidChapterError(
@@ -104,20 +129,7 @@ def split_chapter_into_sections(book_name, book_chapter_str: str) -> int:
             f"Unexpected error fetching verse count for {book_name} {book_chapter}: {str(e)}"
         ) from e
 
-    num_sections: int
-    if total_verses < 15:
-        num_sections = 1
-    elif total_verses < 30:
-        num_sections = 2
-    elif total_verses <= 45:
-        num_sections = 3
-    elif total_verses <= 60:
-        num_sections = 4
-    else:
-        num_sections = 5
-
-    if num_sections == 1:
-        return 1
+    num_sections = _number_of_sections(total_verses)
 
     sections_output = []
     start_verse_for_current_section = 1
@@ -149,6 +161,25 @@ def split_chapter_into_sections(book_name, book_chapter_str: str) -> int:
             break
 
     print(
-        f"Chapter {book_name} {book_chapter} split into {num_sections} sections: {sections_output}"
+        f"Chapter {book_name} {book_chapter} ({total_verses} verses) split into {len(sections_output)} sections: {sections_output}"
     )
-    return num_sections
+    return sections_output
+
+
+def split_chapter_into_sections(book_name, book_chapter_str: str) -> int:
+    """
+    Calculates the number of sections a Bible chapter should be split into,
+    based on its total number of verses (see split_chapter_into_verse_ranges).
+
+    Args:
+        book_name: The Bible book, can be a pythonbible.Book enum or a string name.
+        book_chapter_str (str): The chapter number as a string (e.g., "1", "10").
+
+    Returns:
+        int: The number of sections the chapter should be split into.
+
+    Raises:
+        ChapterSplitError: If the chapter cannot be processed, input is invalid,
+                           or Bible data cannot be fetched.
+    """
+    return len(split_chapter_into_verse_ranges(book_name, book_chapter_str))
@@ -0,0 +1,92 @@
+"""
+System: Suno Automation
+Module: Book Batch Planning
+File URL: backend/utils/book_batch.py
+Purpose: Plan the passages of a book that still need a song structure and run per-passage
+         work with bounded concurrency, yielding results as they complete.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from utils.bible_utils import get_book_chapter_count, split_chapter_into_verse_ranges
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def plan_book_passages(
+    book_name: str,
+    existing_rows: Iterable[Dict[str, Any]],
+    chapters: Optional[Iterable[int]] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Passages of a book that still need a song structure.
+
+    Chapters that already have song_structure_tbl rows keep their stored verse ranges;
+    other chapters are split locally (utils/bible_utils.py).
+
+    Args:
+        book_name (str): Book name
+        existing_rows (Iterable[dict]): song_structure_tbl rows of the book with
+            "id", "chapter", "verse_range" and "song_structure"
+        chapters (Iterable[int], optional): Chapters to plan; the whole book when omitted
+
+    Returns:
+        Tuple[List[dict], int]: Pending passages as {"id", "chapter", "verse_range"} in
+        chapter order ("id" is None for ranges without a row), and the number of
+        passages skipped because they already have a structure
+
+    Raises:
+        ChapterSplitError: If the book or a chapter is invalid
+    """
+    if chapters is None:
+        chapter_numbers = list(range(1, get_book_chapter_count(book_name) + 1))
+    else:
+        chapter_numbers = sorted({int(chapter) for chapter in chapters})
+
+    rows_by_chapter: Dict[int, List[Dict[str, Any]]] = {}
+    for row in existing_rows:
+        rows_by_chapter.setdefault(int(row["chapter"]), []).append(row)
+
+    pending: List[Dict[str, Any]] = []
+    skipped = 0
+    for chapter in chapter_numbers:
+        chapter_rows = rows_by_chapter.get(chapter)
+        if not chapter_rows:
+            for verse_range in split_chapter_into_verse_ranges(book_name, str(chapter)):
+                pending.append({"id": None, "chapter": chapter, "verse_range": verse_range})
+            continue
+        for row in chapter_rows:
+            if row.get("song_structure"):
+                skipped += 1
+            else:
+                pending.append({"id": row.get("id"), "chapter": chapter, "verse_range": row["verse_range"]})
+    return pending, skipped
+
+
+async def run_bounded(
+    items: Iterable[T], worker: Callable[[T], Awaitable[R]], concurrency: int
+) -> AsyncIterator[Tuple[T, Optional[R], Optional[BaseException]]]:
+    """
+    Run ``worker`` over ``items`` with at most ``concurrency`` calls in flight.
+
+    Yields (item, result, error) in completion order; a failing item yields its exception
+    instead of stopping the batch. Workers still running are cancelled if the consumer stops.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(item: T) -> Tuple[T, Optional[R], Optional[BaseException]]:
+        async with semaphore:
+            try:
+                return item, await worker(item), None
+            except Exception as e:
+                return item, None, e
+
+    tasks = [asyncio.ensure_future(run_one(item)) for item in items]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,243 @@
+"""
+System: Suno Automation
+Module: Browser Pool
+File URL: backend/utils/browser_pool.py
+Purpose: Keep one long-lived Camoufox persistent context per process and hand out pages from it,
+         recycling the browser after a number of uses or when its memory grows too large.
+"""
+
+import asyncio
+import traceback
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from camoufox import AsyncCamoufox
+from playwright.async_api import Page
+
+from configs.browser_config import (
+    BROWSER_POOL_HEADLESS,
+    BROWSER_POOL_MAX_RSS_MB,
+    BROWSER_POOL_MAX_USES,
+    BROWSER_POOL_PRELAUNCH,
+    config,
+)
+from configs.suno_selectors import SunoSelectors
+
+try:
+    import psutil
+except ImportError:  # RSS-based recycling is skipped without psutil
+    psutil = None
+
+
+def build_launch_options() -> Dict[str, Any]:
+    """Camoufox launch options shared by every browser-driven Suno operation."""
+    return {
+        # Headed unless BROWSER_POOL_HEADLESS is set, like the generation browser before the pool
+        "headless": BROWSER_POOL_HEADLESS,
+        "persistent_context": SunoSelectors.BROWSER_CONFIG["persistent_context"],
+        "user_data_dir": SunoSelectors.BROWSER_CONFIG["user_data_dir"],
+        "os": SunoSelectors.BROWSER_CONFIG["os"],
+        "config": config,
+        "humanize": SunoSelectors.BROWSER_CONFIG["humanize"],
+        "i_know_what_im_doing": SunoSelectors.BROWSER_CONFIG["i_know_what_im_doing"],
+    }
+
+
+def _browser_rss_mb() -> Optional[float]:
+    """Resident memory of this process's child processes (the browser tree), in MB."""
+    if psutil is None:
+        return None
+    try:
+        total = 0
+        for child in psutil.Process().children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return total / (1024 * 1024)
+    except Exception:
+        return None
+
+
+class CamoufoxBrowserPool:
+    """
+    Application-scoped Camoufox browser shared by generation, download and deletion.
+
+    A single persistent context is launched (Firefox profiles cannot be opened twice),
+    and callers lease pages from it with ``async with pool.page() as page``. The
+    browser is recycled between leases once it has served ``max_uses`` pages or its
+    process tree exceeds ``max_rss_mb``; an unhealthy browser is relaunched on demand.
+    """
+
+    def __init__(
+        self,
+        launch_options: Optional[Dict[str, Any]] = None,
+        max_uses: int = BROWSER_POOL_MAX_USES,
+        max_rss_mb: float = BROWSER_POOL_MAX_RSS_MB,
+    ):
+        self.launch_options = launch_options or build_launch_options()
+        self.max_uses = max_uses
+        self.max_rss_mb = max_rss_mb
+        self._manager = None
+        self._context = None
+        self._uses = 0
+        self._active = 0
+        self._unhealthy = False
+        self._lock = asyncio.Lock()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        # Cleared while another browser owns the profile (see exclusive())
+        self._available = asyncio.Event()
+        self._available.set()
+        self._exclusive_lock = asyncio.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._context is not None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.is_running,
+            "uses": self._uses,
+            "active_pages": self._active,
+            "max_uses": self.max_uses,
+            "rss_mb": _browser_rss_mb() if self.is_running else None,
+        }
+
+    async def start(self, prelaunch: bool = BROWSER_POOL_PRELAUNCH) -> None:
+        """Prepare the pool; optionally launch the browser immediately."""
+        if not prelaunch:
+            return
+        try:
+            async with self._lock:
+                if self._context is None:
+                    await self._launch()
+        except Exception as e:
+            # Startup must not fail because the browser is unavailable; the next lease retries.
+            print(f"🌐 [BROWSER-POOL] ⚠️ Pre-launch failed, will launch on first use: {e}")
+
+    async def stop(self) -> None:
+        """Wait for leased pages to close and shut the browser down."""
+        async with self._lock:
+            await self._idle.wait()
+            await self._close()
+
+    @asynccontextmanager
+    async def exclusive(self) -> AsyncIterator[None]:
+        """
+        Hand the browser profile to the caller (e.g. a login flow that opens its own browser).
+
+        The shared browser is shut down once leased pages have closed, and new leases wait
+        until the block exits, so two Firefox instances never run on one user_data_dir.
+        """
+        async with self._exclusive_lock:
+            self._available.clear()
+            try:
+                await self.stop()
+                yield
+            finally:
+                self._available.set()
+
+    def _needs_recycle(self) -> bool:
+        if self._unhealthy:
+            return True
+        if self.max_uses and self._uses >= self.max_uses:
+            print(f"🌐 [BROWSER-POOL] Recycling after {self._uses} uses")
+            return True
+        if self.max_rss_mb:
+            rss_mb = _browser_rss_mb()
+            if rss_mb is not None and rss_mb > self.max_rss_mb:
+                print(f"🌐 [BROWSER-POOL] Recycling at {rss_mb:.0f} MB RSS (limit {self.max_rss_mb} MB)")
+                return True
+        return False
+
+    async def _launch(self) -> None:
+        print("🌐 [BROWSER-POOL] Launching Camoufox persistent context...")
+        manager = AsyncCamoufox(**self.launch_options)
+        self._context = await manager.__aenter__()
+        self._manager = manager
+        self._uses = 0
+        self._unhealthy = False
+        print("🌐 [BROWSER-POOL] ✅ Browser ready")
+
+    async def _close(self) -> None:
+        manager, self._manager, self._context = self._manager, None, None
+        if manager is None:
+            return
+        try:
+            await manager.__aexit__(None, None, None)
+            print("🌐 [BROWSER-POOL] Browser closed")
+        except Exception as e:
+            print(f"🌐 [BROWSER-POOL] ⚠️ Error while closing browser: {e}")
+
+    async def _new_page(self) -> Page:
+        while True:
+            await self._available.wait()
+            await self._lock.acquire()
+            # exclusive() may have started while this lease waited for the lock
+            if self._available.is_set():
+                break
+            self._lock.release()
+
+        try:
+            if self._context is not None and self._needs_recycle():
+                if not self._unhealthy:
+                    # Let in-flight pages finish before tearing a healthy browser down
+                    await self._idle.wait()
+                await self._close()
+            if self._context is None:
+                await self._launch()
+            self._active += 1
+            self._idle.clear()
+            context = self._context
+        finally:
+            self._lock.release()
+
+        try:
+            page = await context.new_page()
+            if page.is_closed():
+                raise RuntimeError("Browser returned a closed page")
+            return page
+        except Exception:
+            self._unhealthy = True
+            self._release()
+            raise
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._uses += 1
+        if self._active <= 0:
+            self._active = 0
+            self._idle.set()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Lease a fresh page from the shared browser, relaunching it once if it is unhealthy."""
+        try:
+            page = await self._new_page()
+        except Exception as e:
+            print(f"🌐 [BROWSER-POOL] ⚠️ Page health check failed ({e}), relaunching browser")
+            print(traceback.format_exc())
+            page = await self._new_page()
+
+        try:
+            yield page
+        finally:
+            try:
+                if not page.is_closed():
+                    await page.close()
+            except Exception as e:
+                print(f"🌐 [BROWSER-POOL] ⚠️ Error closing page: {e}")
+                self._unhealthy = True
+            self._release()
+
+
+_browser_pool: Optional[CamoufoxBrowserPool] = None
+
+
+def get_browser_pool() -> CamoufoxBrowserPool:
+    """Return the process-wide browser pool, creating it on first use."""
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = CamoufoxBrowserPool()
+    return _browser_pool
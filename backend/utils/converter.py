@@ -1,16 +1,25 @@
 import importlib
 import importlib.util
 import os
-import json
+from typing import List, Optional
+
+from utils.verse_store import get_verse_store
 
 lib_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "lib"))
 supabase_utils_path = os.path.join(lib_path, "supabase.py")
 
-spec = importlib.util.spec_from_file_location("supabase_utils", supabase_utils_path)
-supabase_utils = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(supabase_utils)
+_supabase = None
+
 
-supabase = supabase_utils.supabase
+def _get_supabase():
+    """Supabase client from lib/supabase.py, loaded on first use so the parsing helpers import without it."""
+    global _supabase
+    if _supabase is None:
+        spec = importlib.util.spec_from_file_location("supabase_utils", supabase_utils_path)
+        supabase_utils = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(supabase_utils)
+        _supabase = supabase_utils.supabase
+    return _supabase
 
 
 def bookname_to_abrv(bookname: str) -> str:
@@ -107,125 +116,164 @@ def bookname_to_abrv(bookname: str) -> str:
     return mapping.get(bookname, bookname)
 
 
+ALLOWED_SECTION_PREFIXES = [
+    "verse",
+    "prechorus",
+    "chorus",
+    "postchorus",
+    "hook",
+    "bridge",
+    "solo",
+    "interlude",
+    "refrain",
+    "stanza",
+    "couplet",
+    "outro",
+]
+
+
+def parse_section_verse_numbers(
+    section_key: str, verse_range_str, book_name: str, book_chapter: int
+) -> Optional[List[int]]:
+    """
+    Turn a section's verse reference ("Exodus 2:3-4", "3-4" or "5") into verse numbers.
+    Malformed references are reported and yield an empty list; a non-string value
+    yields None and the section is skipped.
+    """
+    # Ensure verse_range_str is a string before stripping
+    if not isinstance(verse_range_str, str):
+        print(
+            f"Warning: Verse range for section '{section_key}' is not a string: {verse_range_str}. Skipping."
+        )
+        return None
+
+    cleaned_verse_range_str = verse_range_str.strip()
+
+    # Extract verse range by removing book name and chapter
+    if cleaned_verse_range_str.startswith(f"{book_name} {book_chapter}:"):
+        cleaned_verse_range_str = cleaned_verse_range_str[
+            len(f"{book_name} {book_chapter}:") :
+        ]
+
+    if "-" in cleaned_verse_range_str:
+        parts = cleaned_verse_range_str.split("-")
+        if len(parts) == 2:
+            start_v_str, end_v_str = parts
+            try:
+                start_v = int(start_v_str.strip())
+                end_v = int(end_v_str.strip())
+                if start_v <= end_v:
+                    return list(range(start_v, end_v + 1))
+                print(
+                    f"Warning: Invalid range '{cleaned_verse_range_str}' for section '{section_key}'. Start verse > end verse."
+                )
+            except ValueError:
+                print(
+                    f"Error: Malformed range '{cleaned_verse_range_str}' for section '{section_key}'. Could not convert parts to int."
+                )
+        else:
+            print(
+                f"Error: Malformed range string '{cleaned_verse_range_str}' for section '{section_key}'. Expected format 'start-end'."
+            )
+        return []
+
+    try:
+        return [int(cleaned_verse_range_str)]
+    except ValueError:
+        print(
+            f"Error: Malformed verse number '{cleaned_verse_range_str}' for section '{section_key}'. Could not convert to int."
+        )
+        return []
+
+
+def fetch_chapter_verses(book_abrv: str, book_chapter: int, verse_numbers) -> dict:
+    """
+    Fetch the text of every requested verse of one chapter.
+
+    Verses come from the local verse store (utils/verse_store.py) when it is
+    available; anything it lacks is fetched from Supabase in a single ranged query.
+
+    Returns:
+        dict: verse number -> verse text for the verses that exist
+    """
+    verse_numbers = sorted(set(verse_numbers))
+    if not verse_numbers:
+        return {}
+
+    verse_texts = {}
+    store = get_verse_store()
+    if store is not None:
+        verse_texts = store.get_verses(book_abrv, book_chapter, verse_numbers)
+        verse_numbers = [verse_num for verse_num in verse_numbers if verse_num not in verse_texts]
+        if not verse_numbers:
+            return verse_texts
+
+    try:
+        response = (
+            _get_supabase().table("bible_verses_tbl")
+            .select("start_verse, verse_text")
+            .eq("book", book_abrv)
+            .eq("chapter", book_chapter)
+            .gte("start_verse", verse_numbers[0])
+            .lte("start_verse", verse_numbers[-1])
+            .execute()
+        )
+    except Exception as e:
+        print(
+            f"Exception fetching verses {book_abrv} {book_chapter}:{verse_numbers[0]}-{verse_numbers[-1]}: {e}"
+        )
+        return verse_texts
+
+    wanted = set(verse_numbers)
+    for row in response.data or []:
+        try:
+            verse_num = int(row.get("start_verse"))
+        except (TypeError, ValueError):
+            continue
+        if verse_num in wanted:
+            verse_texts[verse_num] = row.get("verse_text") or ""
+    return verse_texts
+
+
 def song_strcture_to_lyrics(
     song_struct_id: int, input_dict, book_name: str, book_chapter: int, strStyle: str
 ) -> dict:
     output_dict = {}
     current_book_abrv = bookname_to_abrv(book_name)
 
+    # Resolve every section to its verse numbers first so the chapter slice is fetched once
+    section_verse_numbers = {}
     for section_key, verse_range_str in input_dict.items():
         # More flexible check for various song section types
-        allowed_prefixes = [
-            "verse",
-            "prechorus",
-            "chorus",
-            "postchorus",
-            "hook",
-            "bridge",
-            "solo",
-            "interlude",
-            "refrain",
-            "stanza",
-            "couplet",
-            "outro",
-        ]
         if not any(
-            section_key.lower().startswith(prefix) for prefix in allowed_prefixes
+            section_key.lower().startswith(prefix) for prefix in ALLOWED_SECTION_PREFIXES
         ):
             continue
-
-        section_verses_data = {}
-        verse_numbers_to_fetch = []
-
-        # Ensure verse_range_str is a string before stripping
-        if not isinstance(verse_range_str, str):
-            print(
-                f"Warning: Verse range for section '{section_key}' is not a string: {verse_range_str}. Skipping."
-            )
+        verse_numbers = parse_section_verse_numbers(
+            section_key, verse_range_str, book_name, book_chapter
+        )
+        if verse_numbers is None:
             continue
+        section_verse_numbers[section_key] = verse_numbers
 
-        cleaned_verse_range_str = verse_range_str.strip()
-
-        # Extract verse range by removing book name and chapter
-        if cleaned_verse_range_str.startswith(f"{book_name} {book_chapter}:"):
-            cleaned_verse_range_str = cleaned_verse_range_str[
-                len(f"{book_name} {book_chapter}:") :
-            ]
-
-        if "-" in cleaned_verse_range_str:
-            parts = cleaned_verse_range_str.split("-")
-            if len(parts) == 2:
-                start_v_str, end_v_str = parts
-                try:
-                    start_v = int(start_v_str.strip())
-                    end_v = int(end_v_str.strip())
-                    if start_v <= end_v:
-                        verse_numbers_to_fetch = range(start_v, end_v + 1)
-                    else:
-                        print(
-                            f"Warning: Invalid range '{cleaned_verse_range_str}' for section '{section_key}'. Start verse > end verse."
-                        )
-                except ValueError:
-                    print(
-                        f"Error: Malformed range '{cleaned_verse_range_str}' for section '{section_key}'. Could not convert parts to int."
-                    )
-            else:
-                print(
-                    f"Error: Malformed range string '{cleaned_verse_range_str}' for section '{section_key}'. Expected format 'start-end'."
-                )
-        else:
-            try:
-                verse_numbers_to_fetch = [int(cleaned_verse_range_str)]
-            except ValueError:
-                print(
-                    f"Error: Malformed verse number '{cleaned_verse_range_str}' for section '{section_key}'. Could not convert to int."
-                )
+    verse_texts = fetch_chapter_verses(
+        current_book_abrv,
+        book_chapter,
+        [verse_num for numbers in section_verse_numbers.values() for verse_num in numbers],
+    )
 
-        for verse_num in verse_numbers_to_fetch:
-            try:
-                verse_text_response = (
-                    supabase.table("bible_verses_tbl")
-                    .select("verse_text")
-                    .eq("book", current_book_abrv)
-                    .eq("chapter", book_chapter)
-                    .eq("start_verse", verse_num)
-                    .single()
-                    .execute()
-                )
-                actual_verse_text = ""
-                if (
-                    verse_text_response.data
-                    and "verse_text" in verse_text_response.data
-                ):
-                    actual_verse_text = verse_text_response.data["verse_text"]
-                else:
-                    print(
-                        f"Warning: No verse text found for {current_book_abrv} {book_chapter}:{verse_num} in section '{section_key}'"
-                    )
-
-                section_verses_data[str(verse_num)] = actual_verse_text
-            except Exception as e:
+    for section_key, verse_numbers in section_verse_numbers.items():
+        section_verses_data = {}
+        for verse_num in verse_numbers:
+            if verse_num not in verse_texts:
                 print(
-                    f"Exception fetching/processing verse {current_book_abrv} {book_chapter}:{verse_num} for section '{section_key}': {e}"
+                    f"Warning: No verse text found for {current_book_abrv} {book_chapter}:{verse_num} in section '{section_key}'"
                 )
-                section_verses_data[str(verse_num)] = ""
-
+            section_verses_data[str(verse_num)] = verse_texts.get(verse_num, "")
         output_dict[section_key] = section_verses_data
 
-    # Save to database
-    try:
-        lyrics_json = json.dumps(output_dict)
-        data_to_insert = {
-            "pg1_song_struct_id": song_struct_id,
-            "pg1_style": strStyle,
-            "pg1_lyrics": lyrics_json,
-            "pg1_status": 0,
-            "pg1_reviews": 0,
-        }
-        supabase.table("tblprogress_v1").insert(data_to_insert).execute()
-    except Exception as e:
-        print(f"Error saving progress to database: {e}")
-
+    # Progress rows are written once per Suno clip after creation
+    # (services/progress_repository.py), not here.
     return output_dict
 
 
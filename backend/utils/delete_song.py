@@ -10,10 +10,9 @@ import os
 import traceback
 from typing import Dict, Any, Optional, List
 from pathlib import Path
-from camoufox.async_api import AsyncCamoufox
 from configs.browser_config import config
 from configs.suno_selectors import SunoSelectors
-from configs.suno_selectors import SunoSelectors
+from utils.browser_pool import get_browser_pool
 
 
 class SongDeleter:
@@ -155,17 +154,7 @@ class SongDeleter:
         SONG_URL = f"https://suno.com/song/{song_id}"
 
         try:
-            async with AsyncCamoufox(
-                headless=True,
-                persistent_context=True,
-                user_data_dir="backend/camoufox_session_data",
-                os=("windows"),
-                config=self.browser_config,
-                humanize=True,
-                i_know_what_im_doing=True,
-            ) as browser:
-                page = await browser.new_page()
-                
+            async with get_browser_pool().page() as page:
                 try:
                     print(f"[NAVIGATE] Navigating to song: {SONG_URL}")
                     await page.goto(SONG_URL)
@@ -204,8 +193,6 @@ class SongDeleter:
                         "success": False,
                         "error": error_msg
                     }
-                finally:
-                    await page.close()
                     
         except Exception as e:
             error_msg = f"Browser automation error: {str(e)}"
@@ -15,10 +15,10 @@ import traceback
 from datetime import datetime
 from typing import Dict, Any
 from slugify import slugify
-from camoufox import AsyncCamoufox
 from playwright.async_api import Page, Locator
 from configs.browser_config import config
 from configs.suno_selectors import SunoSelectors
+from utils.browser_pool import get_browser_pool
 
 
 class SunoDownloader:
@@ -478,16 +478,9 @@ class SunoDownloader:
             print(f"📥 [DOWNLOAD-START] Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             print(f"{'='*80}")
 
-            async with AsyncCamoufox(
-                headless=True,
-                persistent_context=True,
-                user_data_dir="backend/camoufox_session_data",
-                os=("windows"),
-                config=self.config,
-                humanize=True,  # IMPORTANT: Keep this True for the one special hover to work
-                i_know_what_im_doing=True,
-            ) as browser:
-                page = await browser.new_page()
+            # Pages come from the shared browser pool; humanize stays enabled there,
+            # which the special download sub-menu hover relies on
+            async with get_browser_pool().page() as page:
 
                 try:
                     # Validate page is available
@@ -0,0 +1,42 @@
+"""
+System: Suno Automation
+Module: Shared HTTP Session
+File URL: backend/utils/http_session.py
+Purpose: Provide one pooled, keep-alive aiohttp ClientSession per event loop for CDN and API traffic.
+"""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+HTTP_POOL_LIMIT = 20
+HTTP_POOL_LIMIT_PER_HOST = 8
+HTTP_KEEPALIVE_SECONDS = 60
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared ClientSession, creating it for the running loop if needed."""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+        _session_loop = loop
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the shared ClientSession (called from the application lifespan)."""
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
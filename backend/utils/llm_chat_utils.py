@@ -6,8 +6,13 @@ import requests
 from dotenv import load_dotenv  # type: ignore
 from openai import APIError, OpenAI  # Import APIError
 
+from config.generation_config import RESPONSE_CACHE_ENABLED
+from middleware.gemini_response_cache import get_response_cache, make_cache_key
+
 load_dotenv()
 
+LLM_CHAT_MODEL = "deepseek/deepseek-r1-0528:free"
+
 
 def get_rate_limits():
     api_key = os.getenv("LLM_API_KEY")
@@ -57,9 +62,7 @@ def send_api_request(
     )
     messages = [{"role": "user", "content": message}]
 
-    print(
-        "Sending request to LLM with model: deepseek/deepseek-r1-0528:free"
-    )  # Corrected f-string
+    print(f"Sending request to LLM with model: {LLM_CHAT_MODEL}")
 
     try:
         completion = client.chat.completions.create(
@@ -68,7 +71,7 @@ def send_api_request(
                 "X-Title": os.getenv("OPENROUTER_SITE_NAME", "<YOUR_SITE_NAME>"),
             },
             extra_body={},
-            model="deepseek/deepseek-r1-0528:free",
+            model=LLM_CHAT_MODEL,
             messages=messages,
         )
         print(
@@ -109,15 +112,27 @@ def send_api_request(
 
 def llm_general_query(
     prompt: str,
+    bypass_cache: bool = False,
 ):
-    # TODO: Add response caching to reduce API calls for identical prompts
+    """
+    Query the chat model; identical prompts are answered from the response cache unless
+    bypass_cache is set. Fresh answers are always written back to the cache.
+    """
     # TODO: Implement rate limiting handling with automatic retry
     # TODO: Add telemetry/metrics for API usage tracking
+    cache_key = make_cache_key(LLM_CHAT_MODEL, prompt)
+    if RESPONSE_CACHE_ENABLED and not bypass_cache:
+        cached_response = get_response_cache().get(cache_key)
+        if cached_response is not None:
+            return cached_response
+
     response_content = send_api_request(prompt)
     if response_content is None:
         print(
             f"Failed to get response from LLM for prompt (first 100 chars): '{prompt[:100]}...'"
         )
+    elif RESPONSE_CACHE_ENABLED and response_content:
+        get_response_cache().put(cache_key, LLM_CHAT_MODEL, response_content)
     return response_content
 
 
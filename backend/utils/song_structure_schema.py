@@ -0,0 +1,113 @@
+"""
+System: Suno Automation
+Module: Song Structure Schema
+File URL: backend/utils/song_structure_schema.py
+Purpose: Response schema and validation for the single-call song structure and tone generation.
+"""
+
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Gemini response schemas cannot express free-form object keys, so sections come back
+# as an ordered list of {section, verses} pairs and are folded into the usual dict.
+STRUCTURE_AND_TONE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "sections": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "section": {"type": "string"},
+                    "verses": {"type": "string"},
+                },
+                "required": ["section", "verses"],
+            },
+        },
+        "tone": {"type": "integer"},
+    },
+    "required": ["sections", "tone"],
+}
+
+STRUCTURE_AND_TONE_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": STRUCTURE_AND_TONE_SCHEMA,
+}
+
+_VERSES_PATTERN = re.compile(r"^\d+(-\d+)?$")
+
+
+def _parse_verses(verses: str) -> Optional[Tuple[int, int]]:
+    """(start, end) of "start-end" or a single "verse"; None when malformed or reversed."""
+    verses = verses.replace(" ", "")
+    if not _VERSES_PATTERN.match(verses):
+        return None
+    start, _, end = verses.partition("-")
+    bounds = (int(start), int(end or start))
+    return bounds if bounds[0] <= bounds[1] else None
+
+
+def parse_structure_and_tone(
+    response_text: Optional[str], verse_range: Optional[str] = None
+) -> Optional[Tuple[Dict[str, str], int]]:
+    """
+    Validate a structured structure-and-tone reply.
+
+    Args:
+        response_text (str): JSON reply matching STRUCTURE_AND_TONE_SCHEMA
+        verse_range (str, optional): The passage the structure was requested for (e.g. "1-10");
+            when given, every section must lie inside it
+
+    Returns:
+        Optional[Tuple[Dict[str, str], int]]: ({section: verses}, tone), or None when the
+        reply is not valid JSON, has no sections, repeats a section name, uses a malformed
+        or reversed verse range, has sections that overlap or fall outside ``verse_range``,
+        or has a tone other than 0 or 1
+    """
+    if not response_text:
+        return None
+    try:
+        payload = json.loads(response_text)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+
+    tone = payload.get("tone")
+    if isinstance(tone, bool) or tone not in (0, 1):
+        return None
+
+    sections = payload.get("sections")
+    if not isinstance(sections, list) or not sections:
+        return None
+
+    passage_bounds = _parse_verses(verse_range) if verse_range else None
+    if verse_range and passage_bounds is None:
+        return None
+
+    song_structure: Dict[str, str] = {}
+    section_bounds: List[Tuple[int, int]] = []
+    for item in sections:
+        if not isinstance(item, dict):
+            return None
+        name = item.get("section")
+        verses = item.get("verses")
+        if not isinstance(name, str) or not isinstance(verses, str):
+            return None
+        name = name.strip()
+        bounds = _parse_verses(verses)
+        if not name or name in song_structure or bounds is None:
+            return None
+        if passage_bounds and not (passage_bounds[0] <= bounds[0] and bounds[1] <= passage_bounds[1]):
+            return None
+        song_structure[name] = verses.replace(" ", "")
+        section_bounds.append(bounds)
+
+    # Sections must not share verses
+    section_bounds.sort()
+    for (_, previous_end), (next_start, _) in zip(section_bounds, section_bounds[1:]):
+        if next_start <= previous_end:
+            return None
+
+    return song_structure, tone
@@ -0,0 +1,179 @@
+"""
+System: Suno Automation
+Module: Offline Verse Store
+File URL: backend/utils/verse_store.py
+Purpose: Compile the bundled bible_verses_tbl SQL dumps into a local SQLite store and look verses up
+         by (book abbreviation, chapter, verse) without a network round-trip.
+
+Build explicitly with:
+    python -m utils.verse_store            (from backend/)
+The store is also built automatically on first use when it is missing.
+"""
+
+import glob
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+BIBLE_VERSES_DUMP_DIR = str(BACKEND_ROOT / "misc" / "data" / "bible_verses")
+VERSE_STORE_PATH = os.getenv("VERSE_STORE_PATH") or str(BACKEND_ROOT / "data" / "bible_verses.db")
+
+# INSERT INTO bible_verses_tbl VALUES ('GN1_1','002_1_1','GEN','1','1','1','In the beginning, ...');
+_INSERT_PREFIX = "INSERT INTO bible_verses_tbl VALUES ("
+_SQL_STRING = re.compile(r"'((?:[^']|'')*)'")
+
+
+def parse_dump_values(line: str) -> Optional[List[str]]:
+    """Return the column values of one INSERT line in table order, else None."""
+    if not line.startswith(_INSERT_PREFIX):
+        return None
+    values = [value.replace("''", "'") for value in _SQL_STRING.findall(line[len(_INSERT_PREFIX):])]
+    return values if len(values) >= 7 else None
+
+
+def _parse_dump_line(line: str) -> Optional[Tuple[str, int, int, str]]:
+    """Return (book, chapter, start_verse, verse_text) for one INSERT line, else None."""
+    values = parse_dump_values(line)
+    if values is None:
+        return None
+    try:
+        return values[2], int(values[3]), int(values[4]), values[6]
+    except ValueError:
+        return None
+
+
+def iter_dump_lines(dump_dir: str = BIBLE_VERSES_DUMP_DIR) -> Iterator[str]:
+    """Yield every line of the output_part_*.txt dumps."""
+    for dump_path in sorted(glob.glob(os.path.join(dump_dir, "output_part_*.txt"))):
+        with open(dump_path, "r", encoding="utf-8") as dump_file:
+            yield from dump_file
+
+
+def iter_dump_verses(dump_dir: str = BIBLE_VERSES_DUMP_DIR) -> Iterator[Tuple[str, int, int, str]]:
+    """Yield every verse found in the output_part_*.txt dumps."""
+    for line in iter_dump_lines(dump_dir):
+        parsed = _parse_dump_line(line)
+        if parsed:
+            yield parsed
+
+
+def iter_dump_rows(dump_dir: str = BIBLE_VERSES_DUMP_DIR) -> Iterator[List[str]]:
+    """Yield the full bible_verses_tbl row of every INSERT in the dumps."""
+    for line in iter_dump_lines(dump_dir):
+        values = parse_dump_values(line)
+        if values:
+            yield values
+
+
+def build_verse_store(dump_dir: str = BIBLE_VERSES_DUMP_DIR, db_path: str = VERSE_STORE_PATH) -> int:
+    """
+    Compile the SQL dumps into a SQLite verse store, replacing any existing file atomically.
+
+    Returns:
+        int: Number of verses written
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    tmp_path = f"{db_path}.building"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute(
+            """
+            CREATE TABLE verses (
+                book TEXT NOT NULL,
+                chapter INTEGER NOT NULL,
+                verse INTEGER NOT NULL,
+                verse_text TEXT NOT NULL,
+                PRIMARY KEY (book, chapter, verse)
+            ) WITHOUT ROWID
+            """
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO verses (book, chapter, verse, verse_text) VALUES (?, ?, ?, ?)",
+            iter_dump_verses(dump_dir),
+        )
+        conn.commit()
+        verse_count = conn.execute("SELECT COUNT(*) FROM verses").fetchone()[0]
+    finally:
+        conn.close()
+
+    if verse_count == 0:
+        os.remove(tmp_path)
+        raise ValueError(f"No verses found in {dump_dir}")
+    os.replace(tmp_path, db_path)
+    return verse_count
+
+
+class VerseStore:
+    """Read-only lookups against a compiled verse store."""
+
+    def __init__(self, db_path: str = VERSE_STORE_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            f"file:{db_path}?mode=ro", uri=True, check_same_thread=False
+        )
+
+    def get_verse(self, book_abrv: str, chapter: int, verse: int) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT verse_text FROM verses WHERE book = ? AND chapter = ? AND verse = ?",
+                (book_abrv, chapter, verse),
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_verses(self, book_abrv: str, chapter: int, verse_numbers: Iterable[int]) -> Dict[int, str]:
+        """Return verse number -> text for the requested verses that exist (one range scan)."""
+        wanted = set(verse_numbers)
+        if not wanted:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT verse, verse_text FROM verses WHERE book = ? AND chapter = ? AND verse BETWEEN ? AND ?",
+                (book_abrv, chapter, min(wanted), max(wanted)),
+            ).fetchall()
+        return {verse: text for verse, text in rows if verse in wanted}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_verse_store: Optional[VerseStore] = None
+_verse_store_unavailable = False
+_verse_store_lock = threading.Lock()
+
+
+def get_verse_store() -> Optional[VerseStore]:
+    """
+    Return the process-wide verse store, building it from the dumps on first use.
+    Returns None when neither a store nor the dumps are available.
+    """
+    global _verse_store, _verse_store_unavailable
+    if _verse_store is not None or _verse_store_unavailable:
+        return _verse_store
+    with _verse_store_lock:
+        if _verse_store is None and not _verse_store_unavailable:
+            try:
+                if not os.path.exists(VERSE_STORE_PATH):
+                    started = time.perf_counter()
+                    verse_count = build_verse_store()
+                    print(f"📖 [VERSE-STORE] Built {verse_count:,} verses in {time.perf_counter() - started:.1f}s")
+                _verse_store = VerseStore(VERSE_STORE_PATH)
+            except Exception as e:
+                print(f"📖 [VERSE-STORE] ⚠️ Local verse store unavailable, using Supabase: {e}")
+                _verse_store_unavailable = True
+    return _verse_store
+
+
+if __name__ == "__main__":
+    started_at = time.perf_counter()
+    count = build_verse_store()
+    print(f"📖 [VERSE-STORE] Wrote {count:,} verses to {VERSE_STORE_PATH} in {time.perf_counter() - started_at:.1f}s")